@@ -1,9 +1,9 @@
 from typing import List
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
+from hummingbot.data_feed.candles_feed.candles_indicators import BollingerBands
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
@@ -82,9 +82,9 @@ class BollingerV1Controller(DirectionalTradingControllerBase):
         df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
-                                                      max_records=self.max_records)
-        # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
+                                                      max_records=self.max_records,
+                                                      indicators=[BollingerBands(length=self.config.bb_length,
+                                                                                 std=self.config.bb_std)])
         bbp = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
 
         # Generate signal
@@ -2,11 +2,11 @@ import time
 from decimal import Decimal
 from typing import List, Optional, Tuple
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.data_feed.candles_feed.candles_indicators import BollingerBands
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
@@ -167,9 +167,9 @@ class DManV3Controller(DirectionalTradingControllerBase):
         df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
-                                                      max_records=self.max_records)
-        # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
+                                                      max_records=self.max_records,
+                                                      indicators=[BollingerBands(length=self.config.bb_length,
+                                                                                 std=self.config.bb_std)])
 
         # Generate signal
         long_condition = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"] < self.config.bb_long_threshold
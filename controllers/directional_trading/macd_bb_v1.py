@@ -1,9 +1,9 @@
 from typing import List
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
+from hummingbot.data_feed.candles_feed.candles_indicators import MACD, BollingerBands
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
@@ -98,10 +98,13 @@ class MACDBBV1Controller(DirectionalTradingControllerBase):
         df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
-                                                      max_records=self.max_records)
-        # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
-        df.ta.macd(fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal, append=True)
+                                                      max_records=self.max_records,
+                                                      indicators=[
+                                                          BollingerBands(length=self.config.bb_length,
+                                                                         std=self.config.bb_std),
+                                                          MACD(fast=self.config.macd_fast, slow=self.config.macd_slow,
+                                                               signal=self.config.macd_signal),
+                                                      ])
 
         bbp = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
         macdh = df[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
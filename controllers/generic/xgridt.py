@@ -3,13 +3,13 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Set
 
 import pandas as pd
-import pandas_ta as ta  # noqa: F401
 from pydantic import BaseModel, Field
 from scipy.signal import find_peaks
 
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.core.data_type.common import OrderType, PositionMode, PriceType, TradeType
 from hummingbot.core.data_type.trade_fee import TokenAmount
+from hummingbot.data_feed.candles_feed.candles_indicators import EMA, NATR, DonchianChannel
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.controllers import ControllerBase, ControllerConfigBase
@@ -379,14 +379,16 @@ class XGridT(ControllerBase):
         df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
-                                                      max_records=self.max_records)
-        # Add indicators
-        df.ta.ema(length=self.config.ema_short, append=True)
-        df.ta.ema(length=self.config.ema_medium, append=True)
-        df.ta.ema(length=self.config.ema_long, append=True)
-        df.ta.donchian(lower_length=self.config.donchian_channel_length,
-                       upper_length=self.config.donchian_channel_length, append=True)
-        df.ta.natr(length=self.config.natr_length, append=True)
+                                                      max_records=self.max_records,
+                                                      indicators=[
+                                                          EMA(length=self.config.ema_short),
+                                                          EMA(length=self.config.ema_medium),
+                                                          EMA(length=self.config.ema_long),
+                                                          DonchianChannel(
+                                                              lower_length=self.config.donchian_channel_length,
+                                                              upper_length=self.config.donchian_channel_length),
+                                                          NATR(length=self.config.natr_length),
+                                                      ])
 
         short_ema = df[f"EMA_{self.config.ema_short}"]
         medium_ema = df[f"EMA_{self.config.ema_medium}"]
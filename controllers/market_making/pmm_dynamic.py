@@ -1,10 +1,10 @@
 from decimal import Decimal
 from typing import List
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
+from hummingbot.data_feed.candles_feed.candles_indicators import MACD, NATR
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy_v2.controllers.market_making_controller_base import (
     MarketMakingControllerBase,
@@ -101,13 +101,17 @@ class PMMDynamicController(MarketMakingControllerBase):
         candles = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                            trading_pair=self.config.candles_trading_pair,
                                                            interval=self.config.interval,
-                                                           max_records=self.max_records)
-        natr = ta.natr(candles["high"], candles["low"], candles["close"], length=self.config.natr_length) / 100
-        macd_output = ta.macd(candles["close"], fast=self.config.macd_fast,
-                              slow=self.config.macd_slow, signal=self.config.macd_signal)
-        macd = macd_output[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+                                                           max_records=self.max_records,
+                                                           indicators=[
+                                                               NATR(length=self.config.natr_length),
+                                                               MACD(fast=self.config.macd_fast,
+                                                                    slow=self.config.macd_slow,
+                                                                    signal=self.config.macd_signal),
+                                                           ])
+        natr = candles[f"NATR_{self.config.natr_length}"] / 100
+        macd = candles[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
         macd_signal = - (macd - macd.mean()) / macd.std()
-        macdh = macd_output[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        macdh = candles[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
         macdh_signal = macdh.apply(lambda x: 1 if x > 0 else -1)
         max_price_shift = natr / 2
         price_multiplier = ((0.5 * macd_signal + 0.5 * macdh_signal) * max_price_shift).iloc[-1]
@@ -83,10 +83,12 @@ client_configs_to_display = ["autofill_import",
                              "other_commands_timeout",
                              "tables_format",
                              "tick_size",
+                             "clock_min_wake_interval",
                              "market_data_collection",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "market_data_collection_format",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
@@ -31,6 +31,10 @@ class ExitCommand:
         if self._gateway_monitor is not None:
             self._gateway_monitor.stop()
 
+        if self.markets_recorder is not None:
+            # Write the event records still buffered by the recorder
+            self.markets_recorder.flush()
+
         self.notify("Winding down notifiers...")
         for notifier in self.notifiers:
             notifier.stop()
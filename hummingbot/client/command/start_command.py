@@ -20,6 +20,7 @@ from hummingbot.client.config.config_validators import validate_bool
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.exceptions import InvalidScriptModule, OracleRateUnavailable
@@ -32,6 +33,15 @@ if TYPE_CHECKING:
 
 
 GATEWAY_READY_TIMEOUT = 300  # seconds
+# Market events that wake up the clock when clock_min_wake_interval is enabled
+CLOCK_WAKE_UP_MARKET_EVENTS = [
+    MarketEvent.OrderFilled,
+    MarketEvent.BuyOrderCompleted,
+    MarketEvent.SellOrderCompleted,
+    MarketEvent.OrderCancelled,
+    MarketEvent.OrderExpired,
+    MarketEvent.OrderFailure,
+]
 
 
 class StartCommand(GatewayChainApiManager):
@@ -245,7 +255,9 @@ class StartCommand(GatewayChainApiManager):
             self.start_time = time.time() * 1e3  # Time in milliseconds
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
-            self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            self.clock = Clock(ClockMode.REALTIME,
+                               tick_size=tick_size,
+                               min_wake_interval=self.client_config_map.clock_min_wake_interval)
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
@@ -255,6 +267,8 @@ class StartCommand(GatewayChainApiManager):
                         await market.cancel_all(10.0)
             if self.strategy:
                 self.clock.add_iterator(self.strategy)
+            if self.clock.min_wake_interval > 0:
+                safe_ensure_future(self.wait_till_ready(self._add_clock_wake_up_sources), loop=self.ev_loop)
             self.strategy_task: asyncio.Task = safe_ensure_future(self._run_clock(), loop=self.ev_loop)
             self.notify(f"\n'{self.strategy_name}' strategy started.\n"
                         f"Run `status` command to query the progress.")
@@ -266,6 +280,16 @@ class StartCommand(GatewayChainApiManager):
         except Exception as e:
             self.logger().error(str(e), exc_info=True)
 
+    def _add_clock_wake_up_sources(self,  # type: HummingbotApplication
+                                   ):
+        # The order books are only available once the markets are ready
+        for market in self.markets.values():
+            if market is None:
+                continue
+            self.clock.add_wake_up_source(market, CLOCK_WAKE_UP_MARKET_EVENTS)
+            for order_book in market.order_books.values():
+                self.clock.add_wake_up_source(order_book, [OrderBookEvent.TopOfBookChangedEvent])
+
     def _initialize_strategy(self, strategy_name: str):
         if self.is_current_strategy_script_strategy():
             self.start_script_strategy()
@@ -141,6 +141,9 @@ class MQTTBridgeConfigMap(BaseClientModel):
         title = "mqtt_bridge"
 
 
+MARKET_DATA_COLLECTION_FORMATS = ["database", "columnar"]
+
+
 class MarketDataCollectionConfigMap(BaseClientModel):
     market_data_collection_enabled: bool = Field(
         default=False,
@@ -168,10 +171,27 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    market_data_collection_format: str = Field(
+        default="database",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"How do you want to store the market data? ({'/'.join(MARKET_DATA_COLLECTION_FORMATS)})"
+            ),
+        ),
+    )
 
     class Config:
         title = "market_data_collection"
 
+    @validator("market_data_collection_format", pre=True)
+    def validate_market_data_collection_format(cls, v: str):
+        """Used for client-friendly error output."""
+        if v not in MARKET_DATA_COLLECTION_FORMATS:
+            raise ValueError(
+                f"Invalid market data format, please choose a value from {MARKET_DATA_COLLECTION_FORMATS}."
+            )
+        return v
+
 
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
@@ -317,6 +337,16 @@ class PaperTradeConfigMap(BaseClientModel):
         ),
     )
 
+    paper_trade_queue_position_fills: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to fill the paper trade limit orders by their simulated queue position"
+                " in the order book? (Yes/No)"
+            ),
+        ),
+    )
+
     @validator("paper_trade_account_balance", pre=True)
     def validate_paper_trade_account_balance(cls, v: Union[str, Dict[str, float]]):
         if isinstance(v, str):
@@ -1101,6 +1131,19 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    clock_min_wake_interval: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="The clock can also run the strategy right after market events (order book top changes, fills,"
+                    "\norder updates), at most once every clock_min_wake_interval seconds. 0 disables it, the strategy"
+                    " \nonly runs every tick_size seconds.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "What minimum time (in seconds) between clock ticks triggered by market events do you want to use?"
+                " (Enter 0 to only tick every tick size)"
+            ),
+        ),
+    )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
 
     class Config:
@@ -1205,6 +1248,14 @@ class ClientConfigMap(BaseClientModel):
             raise ValueError(ret)
         return v
 
+    @validator("clock_min_wake_interval", pre=True)
+    def validate_clock_min_wake_interval(cls, v: float):
+        """Used for client-friendly error output."""
+        ret = validate_float(v, min_value=0)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
     # === post-validations ===
 
     @root_validator()
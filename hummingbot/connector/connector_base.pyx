@@ -1,7 +1,7 @@
 import asyncio
 import time
 from decimal import Decimal
-from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
@@ -202,6 +202,13 @@ cdef class ConnectorBase(NetworkIterator):
     def tracking_states(self) -> Dict[str, any]:
         return {}
 
+    def tracking_state(self, order_id: str) -> Optional[Dict[str, any]]:
+        """
+        Returns the tracking state of a single order (the value of `tracking_states` for the order), or None if the
+        order is not tracked. Connectors should override it to avoid serializing all the orders.
+        """
+        return self.tracking_states.get(order_id)
+
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         """
         Restores the tracking states from a previously saved state.
@@ -4,6 +4,8 @@ from hummingbot.core.data_type.in_flight_order import OrderState
 EXCHANGE_NAME = "binance_perpetual"
 BROKER_ID = "x-nbQe1H39"
 MAX_ORDER_ID_LEN = 32
+MAX_BATCH_ORDER_CREATE_SIZE = 5
+MAX_BATCH_ORDER_CANCEL_SIZE = 10
 
 DOMAIN = EXCHANGE_NAME
 TESTNET_DOMAIN = "binance_perpetual_testnet"
@@ -34,6 +36,8 @@ SERVER_TIME_PATH_URL = "v1/time"
 
 # Private API v1 Endpoints
 ORDER_URL = "v1/order"
+BATCH_ORDERS_URL = "v1/batchOrders"
+BATCH_ORDERS_CANCEL_LIMIT_ID = "BatchOrdersCancel"
 CANCEL_ALL_OPEN_ORDERS_URL = "v1/allOpenOrders"
 ACCOUNT_TRADE_LIST_URL = "v1/userTrades"
 SET_LEVERAGE_URL = "v1/leverage"
@@ -107,6 +111,12 @@ RATE_LIMITS = [
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1),
                              LinkedLimitWeightPair(ORDERS_1MIN, weight=1),
                              LinkedLimitWeightPair(ORDERS_1SEC, weight=1)]),
+    RateLimit(limit_id=BATCH_ORDERS_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=5),
+                             LinkedLimitWeightPair(ORDERS_1MIN, weight=1),
+                             LinkedLimitWeightPair(ORDERS_1SEC, weight=5)]),
+    RateLimit(limit_id=BATCH_ORDERS_CANCEL_LIMIT_ID, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
     RateLimit(limit_id=CANCEL_ALL_OPEN_ORDERS_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
     RateLimit(limit_id=ACCOUNT_TRADE_LIST_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import time
 from collections import defaultdict
 from decimal import Decimal
@@ -19,6 +20,7 @@ from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_user_st
     BinancePerpetualUserStreamDataSource,
 )
 from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.perpetual_derivative_py_base import PerpetualDerivativePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
@@ -40,6 +42,8 @@ bpm_logger = None
 
 class BinancePerpetualDerivative(PerpetualDerivativePyBase):
     web_utils = web_utils
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDER_CREATE_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDER_CANCEL_SIZE
     SHORT_POLL_INTERVAL = 5.0
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
     LONG_POLL_INTERVAL = 120.0
@@ -241,6 +245,43 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
             **kwargs,
     ) -> Tuple[str, float]:
 
+        api_params = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+            position_action=position_action,
+        )
+        try:
+            order_result = await self._api_post(
+                path_url=CONSTANTS.ORDER_URL,
+                data=api_params,
+                is_auth_required=True)
+            o_id = str(order_result["orderId"])
+            transact_time = order_result["updateTime"] * 1e-3
+        except IOError as e:
+            error_description = str(e)
+            is_server_overloaded = ("status is 503" in error_description
+                                    and "Unknown error, please check your request or try again later." in error_description)
+            if is_server_overloaded:
+                o_id = "UNKNOWN"
+                transact_time = time.time()
+            else:
+                raise
+        return o_id, transact_time
+
+    async def _order_creation_data(
+            self,
+            order_id: str,
+            trading_pair: str,
+            amount: Decimal,
+            trade_type: TradeType,
+            order_type: OrderType,
+            price: Decimal,
+            position_action: PositionAction,
+    ) -> Dict[str, Any]:
         amount_str = f"{amount:f}"
         price_str = f"{price:f}"
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
@@ -261,23 +302,92 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
                 api_params["positionSide"] = "LONG" if trade_type is TradeType.BUY else "SHORT"
             else:
                 api_params["positionSide"] = "SHORT" if trade_type is TradeType.BUY else "LONG"
+        return api_params
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        orders_params = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                position_action=order.position,
+            )
+            for order in orders
+        ]
+        orders_results = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDERS_URL,
+            data={"batchOrders": json.dumps(orders_params)},
+            is_auth_required=True)
+        # The results follow the order of the request, the rejected orders are informed with an error code
+        results = []
+        for order, order_result in zip(orders, orders_results):
+            if "code" in order_result:
+                results.append(PlaceOrderResult(
+                    update_timestamp=self.current_timestamp,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=None,
+                    trading_pair=order.trading_pair,
+                    exception=IOError(f"{order_result['code']} - {order_result.get('msg')}"),
+                ))
+            else:
+                results.append(PlaceOrderResult(
+                    update_timestamp=order_result["updateTime"] * 1e-3,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(order_result["orderId"]),
+                    trading_pair=order.trading_pair,
+                ))
+        return results
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        # The batch cancelation only accepts orders of a single symbol
+        orders_by_trading_pair = defaultdict(list)
+        for order in orders:
+            orders_by_trading_pair[order.trading_pair].append(order)
+        results = await safe_gather(*[
+            self._place_cancels_batch_for_trading_pair(trading_pair=trading_pair, orders=trading_pair_orders)
+            for trading_pair, trading_pair_orders in orders_by_trading_pair.items()
+        ])
+        return [result for trading_pair_results in results for result in trading_pair_results]
+
+    async def _place_cancels_batch_for_trading_pair(
+            self,
+            trading_pair: str,
+            orders: List[InFlightOrder]) -> List[CancelOrderResult]:
         try:
-            order_result = await self._api_post(
-                path_url=CONSTANTS.ORDER_URL,
-                data=api_params,
-                is_auth_required=True)
-            o_id = str(order_result["orderId"])
-            transact_time = order_result["updateTime"] * 1e-3
-        except IOError as e:
-            error_description = str(e)
-            is_server_overloaded = ("status is 503" in error_description
-                                    and "Unknown error, please check your request or try again later." in error_description)
-            if is_server_overloaded:
-                o_id = "UNKNOWN"
-                transact_time = time.time()
+            cancel_results = await self._api_delete(
+                path_url=CONSTANTS.BATCH_ORDERS_URL,
+                params={
+                    "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+                    "origClientOrderIdList": json.dumps([order.client_order_id for order in orders]),
+                },
+                is_auth_required=True,
+                limit_id=CONSTANTS.BATCH_ORDERS_CANCEL_LIMIT_ID)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            return [CancelOrderResult(client_order_id=order.client_order_id, trading_pair=trading_pair, exception=ex)
+                    for order in orders]
+
+        results = []
+        for order, cancel_result in zip(orders, cancel_results):
+            if "code" in cancel_result:
+                results.append(CancelOrderResult(
+                    client_order_id=order.client_order_id,
+                    trading_pair=trading_pair,
+                    not_found=cancel_result["code"] == CONSTANTS.UNKNOWN_ORDER_ERROR_CODE,
+                    exception=IOError(f"{cancel_result['code']} - {cancel_result.get('msg')}"),
+                ))
             else:
-                raise
-        return o_id, transact_time
+                results.append(CancelOrderResult(
+                    client_order_id=order.client_order_id,
+                    trading_pair=trading_pair,
+                    exception=(None if cancel_result.get("status") == "CANCELED"
+                               else IOError(f"The order {order.client_order_id} was not canceled: {cancel_result}")),
+                ))
+        return results
 
     async def _all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
         trade_updates = []
@@ -32,6 +32,9 @@ if TYPE_CHECKING:
 
 class BinanceExchange(ExchangePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    ORDER_STATUS_UPDATE_CONCURRENCY = 5
+    # The open orders request (weight 6) is cheaper than two order status requests (weight 4 each)
+    BULK_ORDER_STATUS_UPDATE_MIN_ORDERS = 2
 
     web_utils = web_utils
 
@@ -467,28 +470,62 @@ class BinanceExchange(ExchangePyBase):
                 limit_id=CONSTANTS.MY_TRADES_PATH_URL)
 
             for trade in all_fills_response:
-                exchange_order_id = str(trade["orderId"])
-                fee = TradeFeeBase.new_spot_fee(
-                    fee_schema=self.trade_fee_schema(),
-                    trade_type=order.trade_type,
-                    percent_token=trade["commissionAsset"],
-                    flat_fees=[TokenAmount(amount=Decimal(trade["commission"]), token=trade["commissionAsset"])]
-                )
-                trade_update = TradeUpdate(
-                    trade_id=str(trade["id"]),
-                    client_order_id=order.client_order_id,
-                    exchange_order_id=exchange_order_id,
-                    trading_pair=trading_pair,
-                    fee=fee,
-                    fill_base_amount=Decimal(trade["qty"]),
-                    fill_quote_amount=Decimal(trade["quoteQty"]),
-                    fill_price=Decimal(trade["price"]),
-                    fill_timestamp=trade["time"] * 1e-3,
-                )
-                trade_updates.append(trade_update)
+                trade_updates.append(self._create_trade_update(order=order, trade=trade, trading_pair=trading_pair))
 
         return trade_updates
 
+    async def _request_trade_updates_for_trading_pair(self, trading_pair: str, since_timestamp: float
+                                                      ) -> List[TradeUpdate]:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        params = {
+            "symbol": symbol,
+            "startTime": int(since_timestamp * 1e3),
+            "limit": CONSTANTS.MAX_MY_TRADES_LIMIT,
+        }
+        all_fills_response = []
+        while True:
+            fills_page = await self._api_get(
+                path_url=CONSTANTS.MY_TRADES_PATH_URL,
+                params=params,
+                is_auth_required=True,
+                limit_id=CONSTANTS.MY_TRADES_PATH_URL)
+            all_fills_response.extend(fills_page)
+            if len(fills_page) < CONSTANTS.MAX_MY_TRADES_LIMIT:
+                break
+            # A full page can be truncated, the next one starts after its last trade (in ascending id order)
+            params = {
+                "symbol": symbol,
+                "fromId": max(int(trade["id"]) for trade in fills_page) + 1,
+                "limit": CONSTANTS.MAX_MY_TRADES_LIMIT,
+            }
+
+        orders_by_exchange_order_id = self._order_tracker.all_fillable_orders_by_exchange_order_id
+        trade_updates = []
+        for trade in all_fills_response:
+            order = orders_by_exchange_order_id.get(str(trade["orderId"]))
+            if order is not None:
+                trade_updates.append(self._create_trade_update(order=order, trade=trade, trading_pair=trading_pair))
+        return trade_updates
+
+    def _create_trade_update(self, order: InFlightOrder, trade: Dict[str, Any], trading_pair: str) -> TradeUpdate:
+        fee = TradeFeeBase.new_spot_fee(
+            fee_schema=self.trade_fee_schema(),
+            trade_type=order.trade_type,
+            percent_token=trade["commissionAsset"],
+            flat_fees=[TokenAmount(amount=Decimal(trade["commission"]), token=trade["commissionAsset"])]
+        )
+        return TradeUpdate(
+            trade_id=str(trade["id"]),
+            client_order_id=order.client_order_id,
+            exchange_order_id=str(trade["orderId"]),
+            trading_pair=trading_pair,
+            fee=fee,
+            fill_base_amount=Decimal(trade["qty"]),
+            fill_quote_amount=Decimal(trade["quoteQty"]),
+            fill_price=Decimal(trade["price"]),
+            fill_timestamp=trade["time"] * 1e-3,
+        )
+
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         trading_pair = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
         updated_order_data = await self._api_get(
@@ -510,6 +547,24 @@ class BinanceExchange(ExchangePyBase):
 
         return order_update
 
+    async def _request_open_orders_updates(self, trading_pair: str) -> List[OrderUpdate]:
+        open_orders_data = await self._api_get(
+            path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+            params={"symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)},
+            is_auth_required=True,
+            limit_id=CONSTANTS.OPEN_ORDERS_PATH_URL)
+
+        return [
+            OrderUpdate(
+                client_order_id=order_data["clientOrderId"],
+                exchange_order_id=str(order_data["orderId"]),
+                trading_pair=trading_pair,
+                update_timestamp=order_data["updateTime"] * 1e-3,
+                new_state=CONSTANTS.ORDER_STATE[order_data["status"]],
+            )
+            for order_data in open_orders_data
+        ]
+
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
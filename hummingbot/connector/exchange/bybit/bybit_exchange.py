@@ -11,6 +11,7 @@ from hummingbot.connector.exchange.bybit.bybit_api_order_book_data_source import
 from hummingbot.connector.exchange.bybit.bybit_api_user_stream_data_source import BybitAPIUserStreamDataSource
 from hummingbot.connector.exchange.bybit.bybit_auth import BybitAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -30,6 +31,9 @@ s_decimal_NaN = Decimal("nan")
 
 
 class BybitExchange(ExchangePyBase):
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDERS_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDERS_SIZE
+
     web_utils = web_utils
 
     def __init__(self,
@@ -220,13 +224,42 @@ class BybitExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
+        api_params = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+        api_params["category"] = self._category
+
+        response = await self._api_post(
+            path_url=CONSTANTS.ORDER_PLACE_PATH_URL,
+            data=api_params,
+            is_auth_required=True,
+            trading_pair=trading_pair
+        )
+        if response["retCode"] != 0:
+            raise ValueError(f"{response['retMsg']}")
+        order_result = response.get("result", {})
+        o_id = str(order_result["orderId"])
+        transact_time = int(response["time"]) * 1e-3
+        return (o_id, transact_time)
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, Any]:
         type_str = self.bybit_order_type(order_type)
 
         side_str = CONSTANTS.SIDE_BUY if trade_type is TradeType.BUY else CONSTANTS.SIDE_SELL
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
 
         api_params = {
-            "category": self._category,
             "symbol": symbol,
             "side": side_str,
             "orderType": type_str,
@@ -237,19 +270,72 @@ class BybitExchange(ExchangePyBase):
         }
         if order_type == OrderType.LIMIT:
             api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
+        return api_params
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        api_params = {
+            "category": self._category,
+            "request": [
+                await self._order_creation_data(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                )
+                for order in orders
+            ],
+        }
         response = await self._api_post(
-            path_url=CONSTANTS.ORDER_PLACE_PATH_URL,
+            path_url=CONSTANTS.BATCH_ORDER_PLACE_PATH_URL,
             data=api_params,
             is_auth_required=True,
-            trading_pair=trading_pair
         )
         if response["retCode"] != 0:
             raise ValueError(f"{response['retMsg']}")
-        order_result = response.get("result", {})
-        o_id = str(order_result["orderId"])
         transact_time = int(response["time"]) * 1e-3
-        return (o_id, transact_time)
+        # Both lists follow the order of the request: the result of each order and its individual status
+        orders_results = response["result"]["list"]
+        orders_statuses = response["retExtInfo"]["list"]
+        results = []
+        for order, order_result, order_status in zip(orders, orders_results, orders_statuses):
+            success = order_status["code"] == CONSTANTS.RET_CODE_OK
+            results.append(PlaceOrderResult(
+                update_timestamp=transact_time,
+                client_order_id=order.client_order_id,
+                exchange_order_id=str(order_result["orderId"]) if success else None,
+                trading_pair=order.trading_pair,
+                exception=None if success else ValueError(f"{order_status['msg']}"),
+            ))
+        return results
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        cancel_requests = []
+        for order in orders:
+            cancel_request = {"symbol": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair)}
+            if order.exchange_order_id:
+                cancel_request["orderId"] = order.exchange_order_id
+            else:
+                cancel_request["orderLinkId"] = order.client_order_id
+            cancel_requests.append(cancel_request)
+        response = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+            data={"category": self._category, "request": cancel_requests},
+            is_auth_required=True,
+            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
+        )
+        if response["retCode"] != 0:
+            raise ValueError(f"{response['retMsg']}")
+        results = []
+        for order, cancel_status in zip(orders, response["retExtInfo"]["list"]):
+            success = cancel_status["code"] == CONSTANTS.RET_CODE_OK
+            results.append(CancelOrderResult(
+                client_order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                exception=None if success else ValueError(f"{cancel_status['msg']}"),
+            ))
+        return results
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         exchange_order_id = tracked_order.exchange_order_id
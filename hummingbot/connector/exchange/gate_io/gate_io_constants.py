@@ -6,6 +6,8 @@ DEFAULT_DOMAIN = ""
 HBOT_BROKER_ID = "hummingbot"
 HBOT_ORDER_ID = "t-HBOT"
 MAX_ID_LEN = 30
+MAX_BATCH_ORDER_CREATE_SIZE = 10
+MAX_BATCH_ORDER_CANCEL_SIZE = 20
 
 REST_URL = "https://api.gateio.ws/api/v4"
 REST_URL_AUTH = "/api/v4"
@@ -14,6 +16,8 @@ NETWORK_CHECK_PATH_URL = "spot/currencies/BTC"
 SYMBOL_PATH_URL = "spot/currency_pairs"
 ORDER_CREATE_PATH_URL = "spot/orders"
 ORDER_DELETE_PATH_URL = "spot/orders/{order_id}"
+BATCH_ORDER_CREATE_PATH_URL = "spot/batch_orders"
+BATCH_ORDER_CANCEL_PATH_URL = "spot/cancel_batch_orders"
 USER_BALANCES_PATH_URL = "spot/accounts"
 ORDER_STATUS_PATH_URL = "spot/orders/{order_id}"
 USER_ORDERS_PATH_URL = "spot/open_orders"
@@ -59,6 +63,8 @@ RATE_LIMITS = [
     RateLimit(limit_id=SYMBOL_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PUBLIC_URL_POINTS_LIMIT_ID)]),
     RateLimit(limit_id=ORDER_CREATE_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
     RateLimit(limit_id=ORDER_DELETE_LIMIT_ID, limit=5_000, time_interval=1, linked_limits=[LinkedLimitWeightPair(CANCEL_ORDERS_LIMITS_ID)]),
+    RateLimit(limit_id=BATCH_ORDER_CREATE_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
+    RateLimit(limit_id=BATCH_ORDER_CANCEL_PATH_URL, limit=5_000, time_interval=1, linked_limits=[LinkedLimitWeightPair(CANCEL_ORDERS_LIMITS_ID)]),
     RateLimit(limit_id=USER_BALANCES_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
     RateLimit(limit_id=ORDER_STATUS_LIMIT_ID, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
     RateLimit(limit_id=USER_ORDERS_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
@@ -10,6 +10,7 @@ from hummingbot.connector.exchange.gate_io.gate_io_api_order_book_data_source im
 from hummingbot.connector.exchange.gate_io.gate_io_api_user_stream_data_source import GateIoAPIUserStreamDataSource
 from hummingbot.connector.exchange.gate_io.gate_io_auth import GateIoAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -30,6 +31,9 @@ class GateIoExchange(ExchangePyBase):
     # Using 120 seconds here as Gate.io websocket is quiet
     TICK_INTERVAL_LIMIT = 120.0
 
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDER_CREATE_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDER_CANCEL_SIZE
+
     web_utils = web_utils
 
     def __init__(self,
@@ -184,6 +188,37 @@ class GateIoExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+
+        # RESTRequest does not support json, and if we pass a dict
+        # the underlying aiohttp will encode it to params
+        data = data
+        endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
+        order_result = await self._api_post(
+            path_url=endpoint,
+            data=data,
+            is_auth_required=True,
+            limit_id=endpoint,
+        )
+        if order_result.get("status") in {"cancelled"}:
+            raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
+        exchange_order_id = str(order_result["id"])
+        return exchange_order_id, self.current_timestamp
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, Any]:
         order_type_str = order_type.name.lower().split("_")[0]
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
         # When type is market, it refers to different currency according to side
@@ -217,21 +252,75 @@ class GateIoExchange(ExchangePyBase):
                 data.update({
                     "amount": f"{price * amount:f}",
                 })
-
-        # RESTRequest does not support json, and if we pass a dict
-        # the underlying aiohttp will encode it to params
-        data = data
-        endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
-        order_result = await self._api_post(
-            path_url=endpoint,
+        return data
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        data = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        orders_results = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_CREATE_PATH_URL,
             data=data,
             is_auth_required=True,
-            limit_id=endpoint,
+            limit_id=CONSTANTS.BATCH_ORDER_CREATE_PATH_URL,
         )
-        if order_result.get("status") in {"cancelled"}:
-            raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
-        exchange_order_id = str(order_result["id"])
-        return exchange_order_id, self.current_timestamp
+        trading_pairs = {order.client_order_id: order.trading_pair for order in orders}
+        results = []
+        for order_result in orders_results:
+            client_order_id = order_result["text"]
+            exception = None
+            if not order_result.get("succeeded", False):
+                exception = IOError({"label": order_result.get("label"), "message": order_result.get("message")})
+            elif order_result.get("status") in {"cancelled"}:
+                exception = IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
+            results.append(PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=client_order_id,
+                exchange_order_id=str(order_result["id"]) if exception is None else None,
+                trading_pair=trading_pairs.get(client_order_id),
+                exception=exception,
+            ))
+        return results
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        # The exchange accepts the client order id (text) for the orders without exchange order id yet
+        orders_by_id = {order.exchange_order_id or order.client_order_id: order for order in orders}
+        data = [
+            {
+                "currency_pair": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                "id": order_id,
+            }
+            for order_id, order in orders_by_id.items()
+        ]
+        cancel_results = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+        )
+        results = []
+        for cancel_result in cancel_results:
+            order = orders_by_id.get(str(cancel_result["id"]))
+            if order is None:
+                continue
+            exception = None
+            if not cancel_result.get("succeeded", False):
+                exception = IOError({"label": cancel_result.get("label"), "message": cancel_result.get("message")})
+            results.append(CancelOrderResult(
+                client_order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                not_found=cancel_result.get("label") == CONSTANTS.ERR_LABEL_ORDER_NOT_FOUND,
+                exception=exception,
+            ))
+        return results
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
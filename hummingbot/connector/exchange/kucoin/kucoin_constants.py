@@ -3,6 +3,8 @@ import sys
 from hummingbot.core.api_throttler.data_types import RateLimit
 
 MAX_ORDER_ID_LEN = 40
+# The batch order endpoints only accept limit orders, up to 5 for the same symbol in each request
+MAX_BATCH_ORDER_CREATE_SIZE = 5
 TRADING_FEES_SYMBOL_LIMIT = 10
 
 DEFAULT_DOMAIN = "main"
@@ -23,6 +25,8 @@ SERVER_TIME_PATH_URL = "/api/v1/timestamp"
 SYMBOLS_PATH_URL = "/api/v2/symbols"
 ORDERS_PATH_URL = "/api/v1/orders"
 ORDERS_PATH_URL_HFT = "/api/v1/hf/orders"
+ORDERS_MULTI_PATH_URL = "/api/v1/orders/multi"
+ORDERS_MULTI_PATH_URL_HFT = "/api/v1/hf/orders/multi"
 FEE_PATH_URL = "/api/v1/trade-fees"
 ALL_TICKERS_PATH_URL = "/api/v1/market/allTickers"
 FILLS_PATH_URL = "/api/v1/fills"
@@ -36,6 +40,7 @@ WS_CONNECTION_TIME_INTERVAL = 60
 WS_REQUEST_LIMIT_ID = "WSRequest"
 GET_ORDER_LIMIT_ID = "GetOrders"
 POST_ORDER_LIMIT_ID = "PostOrder"
+POST_MULTI_ORDER_LIMIT_ID = "PostMultiOrder"
 DELETE_ORDER_LIMIT_ID = "DeleteOrder"
 WS_PING_HEARTBEAT = 10
 
@@ -62,6 +67,7 @@ RATE_LIMITS = [
     RateLimit(limit_id=LIMIT_FILLS_PATH_URL, limit=NO_LIMIT, time_interval=1),
     RateLimit(limit_id=ORDER_CLIENT_ORDER_PATH_URL, limit=NO_LIMIT, time_interval=1),
     RateLimit(limit_id=POST_ORDER_LIMIT_ID, limit=45, time_interval=3),
+    RateLimit(limit_id=POST_MULTI_ORDER_LIMIT_ID, limit=3, time_interval=3),
     RateLimit(limit_id=DELETE_ORDER_LIMIT_ID, limit=60, time_interval=3),
     RateLimit(limit_id=ORDERS_PATH_URL, limit=45, time_interval=3),
     RateLimit(limit_id=ORDERS_PATH_URL_HFT, limit=45, time_interval=3),
@@ -1,4 +1,5 @@
 import asyncio
+from collections import defaultdict
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
@@ -14,6 +15,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source impo
 from hummingbot.connector.exchange.kucoin.kucoin_api_user_stream_data_source import KucoinAPIUserStreamDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_auth import KucoinAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -21,6 +23,7 @@ from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState,
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -30,6 +33,9 @@ if TYPE_CHECKING:
 
 
 class KucoinExchange(ExchangePyBase):
+    # Kucoin has no batch cancelation by order id, the orders are canceled one by one
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDER_CREATE_SIZE
+
     web_utils = web_utils
 
     def __init__(self,
@@ -97,6 +103,10 @@ class KucoinExchange(ExchangePyBase):
     def fills_path_url(self):
         return CONSTANTS.FILLS_PATH_URL_HFT if self.domain == "hft" else CONSTANTS.FILLS_PATH_URL
 
+    @property
+    def orders_multi_path_url(self):
+        return CONSTANTS.ORDERS_MULTI_PATH_URL_HFT if self._domain == "hft" else CONSTANTS.ORDERS_MULTI_PATH_URL
+
     @property
     def trading_pairs(self):
         return self._trading_pairs
@@ -195,6 +205,31 @@ class KucoinExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+        exchange_order_id = await self._api_post(
+            path_url=self.orders_path_url,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
+        )
+        if exchange_order_id.get("data") is None:
+            raise IOError(f"Error placing order on Kucoin: {exchange_order_id}")
+        return str(exchange_order_id["data"]["orderId"]), self.current_timestamp
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, Any]:
         side = trade_type.name.lower()
         order_type_str = "market" if order_type == OrderType.MARKET else "limit"
         data = {
@@ -209,15 +244,123 @@ class KucoinExchange(ExchangePyBase):
         elif order_type is OrderType.LIMIT_MAKER:
             data["price"] = str(price)
             data["postOnly"] = True
-        exchange_order_id = await self._api_post(
-            path_url=self.orders_path_url,
+        return data
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        # The batch endpoints only accept limit orders of a single symbol. Market orders are placed one by one
+        limit_orders_by_trading_pair = defaultdict(list)
+        market_orders = []
+        for order in orders:
+            if order.order_type is OrderType.MARKET:
+                market_orders.append(order)
+            else:
+                limit_orders_by_trading_pair[order.trading_pair].append(order)
+
+        results = await safe_gather(
+            *[self._place_limit_orders_batch(trading_pair=trading_pair, orders=trading_pair_orders)
+              for trading_pair, trading_pair_orders in limit_orders_by_trading_pair.items()],
+            *[self._place_market_order_of_batch(order=order) for order in market_orders],
+        )
+        return [result for request_results in results for result in request_results]
+
+    async def _place_limit_orders_batch(self, trading_pair: str, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        try:
+            return await self._request_limit_orders_batch(trading_pair=trading_pair, orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            return [
+                PlaceOrderResult(
+                    update_timestamp=self.current_timestamp,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=None,
+                    trading_pair=trading_pair,
+                    exception=ex,
+                )
+                for order in orders
+            ]
+
+    async def _request_limit_orders_batch(self,
+                                          trading_pair: str,
+                                          orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        orders_data = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        if self.domain == "hft":
+            data = {"orderList": orders_data}
+        else:
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            for order_data in orders_data:
+                del order_data["symbol"]
+            data = {"symbol": symbol, "orderList": orders_data}
+
+        response = await self._api_post(
+            path_url=self.orders_multi_path_url,
             data=data,
             is_auth_required=True,
-            limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
+            limit_id=CONSTANTS.POST_MULTI_ORDER_LIMIT_ID,
         )
-        if exchange_order_id.get("data") is None:
-            raise IOError(f"Error placing order on Kucoin: {exchange_order_id}")
-        return str(exchange_order_id["data"]["orderId"]), self.current_timestamp
+        if response.get("data") is None:
+            raise IOError(f"Error placing orders on Kucoin: {response}")
+
+        results = []
+        if self.domain == "hft":
+            # The results are returned in the same order the orders were sent
+            for order, order_result in zip(orders, response["data"]):
+                success = order_result.get("success", False)
+                results.append(PlaceOrderResult(
+                    update_timestamp=self.current_timestamp,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(order_result["orderId"]) if success else None,
+                    trading_pair=trading_pair,
+                    exception=None if success else IOError(f"Error placing order on Kucoin: {order_result}"),
+                ))
+        else:
+            for order_result in response["data"]["data"]:
+                success = order_result.get("status") == "success"
+                results.append(PlaceOrderResult(
+                    update_timestamp=self.current_timestamp,
+                    client_order_id=order_result["clientOid"],
+                    exchange_order_id=str(order_result["id"]) if success else None,
+                    trading_pair=trading_pair,
+                    exception=None if success else IOError(f"Error placing order on Kucoin: {order_result}"),
+                ))
+        return results
+
+    async def _place_market_order_of_batch(self, order: InFlightOrder) -> List[PlaceOrderResult]:
+        try:
+            exchange_order_id, update_timestamp = await self._place_order(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            return [PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order.client_order_id,
+                exchange_order_id=None,
+                trading_pair=order.trading_pair,
+                exception=ex,
+            )]
+        return [PlaceOrderResult(
+            update_timestamp=update_timestamp,
+            client_order_id=order.client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=order.trading_pair,
+        )]
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -176,6 +176,10 @@ class NdaxExchange(ExchangeBase):
             if not order.is_done
         }
 
+    def tracking_state(self, order_id: str) -> Optional[Dict[str, Any]]:
+        order = self._in_flight_orders.get(order_id)
+        return order.to_json() if order is not None and not order.is_done else None
+
     async def initialized_account_id(self) -> int:
         if not self._account_id:
             self._account_id = await self._get_account_id()
@@ -78,6 +78,14 @@ class NdaxOrderBookMessage(OrderBookMessage):
         bids.sort(key=lambda row: (row.price, row.update_id))
         return bids
 
+    @property
+    def raw_asks(self) -> List[OrderBookRow]:
+        return self.asks
+
+    @property
+    def raw_bids(self) -> List[OrderBookRow]:
+        return self.bids
+
     def _order_book_row_for_entry(self, entry: NdaxOrderBookEntry) -> OrderBookRow:
         price = float(entry.price)
         amount = float(entry.quantity) if entry.actionType != self._DELETE_ACTION_TYPE else 0.0
@@ -10,6 +10,7 @@ from hummingbot.connector.exchange.okx.okx_api_user_stream_data_source import Ok
 from hummingbot.connector.exchange.okx.okx_auth import OkxAuth
 from hummingbot.connector.exchange_base import s_decimal_NaN
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -27,6 +28,9 @@ if TYPE_CHECKING:
 
 class OkxExchange(ExchangePyBase):
 
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDERS_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.MAX_BATCH_ORDERS_SIZE
+
     web_utils = web_utils
 
     def __init__(self,
@@ -185,19 +189,14 @@ class OkxExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
 
-        data = {
-            "clOrdId": order_id,
-            "tdMode": "cash",
-            "ordType": CONSTANTS.ORDER_TYPE_MAP[order_type],
-            "side": trade_type.name.lower(),
-            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
-            "sz": str(amount),
-        }
-        if order_type.is_limit_type():
-            data["px"] = f"{price:f}"
-        else:
-            # Specify that the the order quantity for market orders is denominated in base currency
-            data["tgtCcy"] = "base_ccy"
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
 
         exchange_order_id = await self._api_request(
             path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
@@ -237,6 +236,90 @@ class OkxExchange(ExchangePyBase):
 
         return final_result
 
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, Any]:
+        data = {
+            "clOrdId": order_id,
+            "tdMode": "cash",
+            "ordType": CONSTANTS.ORDER_TYPE_MAP[order_type],
+            "side": trade_type.name.lower(),
+            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            "sz": str(amount),
+        }
+        if order_type.is_limit_type():
+            data["px"] = f"{price:f}"
+        else:
+            # Specify that the the order quantity for market orders is denominated in base currency
+            data["tgtCcy"] = "base_ccy"
+        return data
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        data = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        trading_pairs = {order.client_order_id: order.trading_pair for order in orders}
+        results = []
+        for order_result in response["data"]:
+            client_order_id = order_result["clOrdId"]
+            exception = None
+            if order_result["sCode"] != "0":
+                exception = IOError(f"Error submitting order {client_order_id}: {order_result['sMsg']}")
+            results.append(PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=client_order_id,
+                exchange_order_id=str(order_result["ordId"]) if exception is None else None,
+                trading_pair=trading_pairs.get(client_order_id),
+                exception=exception,
+            ))
+        return results
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        data = [
+            {
+                "clOrdId": order.client_order_id,
+                "instId": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+            }
+            for order in orders
+        ]
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        trading_pairs = {order.client_order_id: order.trading_pair for order in orders}
+        results = []
+        for cancel_result in response["data"]:
+            client_order_id = cancel_result["clOrdId"]
+            exception = None
+            # 51400 (order does not exist) and 51401 (order already canceled) are processed as successful cancelations
+            # like in the single order cancelation
+            if cancel_result["sCode"] not in ("0", "51400", "51401"):
+                exception = IOError(f"Error cancelling order {client_order_id}: {cancel_result['sMsg']}")
+            results.append(CancelOrderResult(
+                client_order_id=client_order_id,
+                trading_pair=trading_pairs.get(client_order_id),
+                exception=exception,
+            ))
+        return results
+
     async def get_last_traded_prices(self, trading_pairs: List[str] = None) -> Dict[str, float]:
         params = {"instType": "SPOT"}
 
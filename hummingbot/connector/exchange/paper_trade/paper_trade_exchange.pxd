@@ -2,6 +2,7 @@ from libcpp.set cimport set as cpp_set
 from libcpp.string cimport string
 from libcpp.unordered_map cimport unordered_map
 from libcpp.utility cimport pair
+from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.LimitOrder cimport LimitOrder as CPPLimitOrder
 from hummingbot.core.data_type.OrderExpirationEntry cimport OrderExpirationEntry as CPPOrderExpirationEntry
@@ -40,6 +41,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         LimitOrderExpirationSet _limit_order_expiration_set
         object _target_market
         str _exchange_name
+        bint _queue_position_fills
+        dict _queue_positions
+        dict _queue_positions_book_versions
+        dict _crossed_limit_orders_prices
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
@@ -57,25 +62,40 @@ cdef class PaperTradeExchange(ExchangeBase):
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
                               const SingleTradingPairLimitOrdersIterator orders_it)
+    cdef c_reduce_limit_order(self,
+                              LimitOrdersIterator *map_it_ptr,
+                              const SingleTradingPairLimitOrdersIterator orders_it,
+                              object filled_amount)
     cdef c_process_limit_order(self,
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it)
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=*)
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
+    cdef c_add_queue_position(self, str trading_pair, str order_id, bint is_buy, object price)
+    cdef c_update_queue_positions(self)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef c_match_trade_to_queued_limit_orders(self,
+                                              bint is_buy,
+                                              object trade_quantity,
+                                              LimitOrders *limit_orders_map_ptr,
+                                              LimitOrdersIterator *map_it_ptr,
+                                              vector[SingleTradingPairLimitOrdersIterator] orders_its)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
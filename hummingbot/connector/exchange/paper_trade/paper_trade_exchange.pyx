@@ -110,6 +110,32 @@ cdef class QueuedOrder:
                 f"{self.amount})")
 
 
+cdef class LimitOrderQueuePosition:
+    """
+    Simulated position of a limit order in the queue of its price level, used when the exchange fills the limit orders
+    by queue position. The volume ahead starts as the amount of the level when the order is placed. It decreases with
+    the volume traded at the level and when the level amount falls below it (orders ahead canceled). The order is
+    filled by the volume traded at its price once nothing is ahead.
+    """
+    cdef:
+        public bint is_buy
+        public double price
+        public double volume_ahead
+        public object spent_amount
+        public object acquired_amount
+
+    def __init__(self, is_buy: bool, price: float, volume_ahead: float):
+        self.is_buy = is_buy
+        self.price = price
+        self.volume_ahead = volume_ahead
+        # Totals of the partial fills, reported when the order is completed
+        self.spent_amount = s_decimal_0
+        self.acquired_amount = s_decimal_0
+
+    def __repr__(self) -> str:
+        return f"LimitOrderQueuePosition({self.is_buy}, {self.price}, {self.volume_ahead})"
+
+
 cdef class OrderBookTradeListener(EventListener):
     cdef:
         ExchangeBase _market
@@ -157,7 +183,13 @@ cdef class PaperTradeExchange(ExchangeBase):
         order_book_tracker: OrderBookTracker,
         target_market: Callable,
         exchange_name: str,
+        queue_position_fills: bool = False,
     ):
+        """
+        :param queue_position_fills: if True the limit orders at the price of a public trade are filled partially by
+        the traded volume after their simulated queue position, instead of only being filled (in full) by the trades
+        through their price
+        """
         order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._set_order_book_tracker(order_book_tracker)
         self._budget_checker = BudgetChecker(exchange=self)
@@ -169,6 +201,12 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._trading_pairs = {}
         self._queued_orders = deque()
         self._quantization_params = {}
+        self._queue_position_fills = queue_position_fills
+        # Queue positions of the limit orders by trading pair and order id
+        self._queue_positions = {}
+        self._queue_positions_book_versions = {}
+        # Opposite side price when the crossed limit orders of each trading pair and side were last processed
+        self._crossed_limit_orders_prices = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
@@ -242,6 +280,16 @@ cdef class PaperTradeExchange(ExchangeBase):
     def queued_orders(self) -> List[QueuedOrder]:
         return self._queued_orders
 
+    @property
+    def queue_position_fills(self) -> bool:
+        return self._queue_position_fills
+
+    @property
+    def queue_positions(self) -> Dict[str, LimitOrderQueuePosition]:
+        return {order_id: queue_position
+                for queue_positions in self._queue_positions.values()
+                for order_id, queue_position in queue_positions.items()}
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         cdef:
@@ -318,6 +366,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
         self.c_process_market_orders()
+        if self._queue_position_fills:
+            self.c_update_queue_positions()
         self.c_process_crossed_limit_orders()
 
     cdef str c_buy(self,
@@ -370,6 +420,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            self._crossed_limit_orders_prices.pop((trading_pair_str, True), None)
+            if self._queue_position_fills:
+                self.c_add_queue_position(trading_pair_str, order_id, True, quantized_price)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -430,6 +483,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            self._crossed_limit_orders_prices.pop((trading_pair_str, False), None)
+            if self._queue_position_fills:
+                self.c_add_queue_position(trading_pair_str, order_id, False, quantized_price)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -628,7 +684,12 @@ cdef class PaperTradeExchange(ExchangeBase):
                               const SingleTradingPairLimitOrdersIterator orders_it):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            dict queue_positions
         try:
+            if self._queue_position_fills:
+                queue_positions = self._queue_positions.get(deref(deref(map_it_ptr)).first.decode("utf8"))
+                if queue_positions is not None:
+                    queue_positions.pop(deref(orders_it).getClientOrderID().decode("utf8"), None)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -637,10 +698,42 @@ cdef class PaperTradeExchange(ExchangeBase):
             self.logger().error("Error deleting limit order.", exc_info=True)
             return False
 
+    cdef c_reduce_limit_order(self,
+                              LimitOrdersIterator *map_it_ptr,
+                              const SingleTradingPairLimitOrdersIterator orders_it,
+                              object filled_amount):
+        """
+        Replaces a partially filled limit order with one for the remaining amount.
+        """
+        cdef:
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
+            object previous_filled_amount = <object> cpp_limit_order_ptr.getFilledQuantity()
+            object remaining_amount = <object> cpp_limit_order_ptr.getQuantity() - filled_amount
+            object total_filled_amount = (filled_amount if previous_filled_amount is None
+                                          else previous_filled_amount + filled_amount)
+            CPPLimitOrder remaining_order = CPPLimitOrder(
+                cpp_limit_order_ptr.getClientOrderID(),
+                cpp_limit_order_ptr.getTradingPair(),
+                cpp_limit_order_ptr.getIsBuy(),
+                cpp_limit_order_ptr.getBaseCurrency(),
+                cpp_limit_order_ptr.getQuoteCurrency(),
+                cpp_limit_order_ptr.getPrice(),
+                <PyObject *> remaining_amount,
+                <PyObject *> total_filled_amount,
+                cpp_limit_order_ptr.getCreationTimestamp(),
+                cpp_limit_order_ptr.getStatus(),
+                cpp_limit_order_ptr.getPosition(),
+            )
+        # The orders are sorted by price and id, the new one takes the same place in the collection
+        orders_collection_ptr.erase(orders_it)
+        orders_collection_ptr.insert(remaining_order)
+
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
@@ -651,6 +744,11 @@ cdef class PaperTradeExchange(ExchangeBase):
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
+            bint is_partial_fill = fill_amount is not None and fill_amount < amount
+            LimitOrderQueuePosition queue_position = self._queue_positions.get(trading_pair_str, {}).get(order_id)
+
+        if is_partial_fill:
+            amount = fill_amount
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -687,6 +785,16 @@ cdef class PaperTradeExchange(ExchangeBase):
                            quote_balance - paid_amount)
         self.c_set_balance(base_asset,
                            base_balance + acquired_amount)
+        if is_partial_fill:
+            # Reduced before emitting the events, the listeners could cancel the order
+            self.c_reduce_limit_order(map_it_ptr, orders_it, amount)
+        if queue_position is not None:
+            queue_position.spent_amount += paid_amount
+            queue_position.acquired_amount += acquired_amount
+            if not is_partial_fill:
+                # The completed event reports the totals of all the fills
+                paid_amount = queue_position.spent_amount
+                acquired_amount = queue_position.acquired_amount
 
         # add fee
         fees = build_trade_fee(
@@ -709,12 +817,15 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.BUY,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        if is_partial_fill:
+            return
+
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(
@@ -731,7 +842,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
@@ -742,6 +854,11 @@ cdef class PaperTradeExchange(ExchangeBase):
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
+            bint is_partial_fill = fill_amount is not None and fill_amount < amount
+            LimitOrderQueuePosition queue_position = self._queue_positions.get(trading_pair_str, {}).get(order_id)
+
+        if is_partial_fill:
+            amount = fill_amount
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -778,6 +895,16 @@ cdef class PaperTradeExchange(ExchangeBase):
                            quote_balance + acquired_amount)
         self.c_set_balance(base_asset,
                            base_balance - sold_amount)
+        if is_partial_fill:
+            # Reduced before emitting the events, the listeners could cancel the order
+            self.c_reduce_limit_order(map_it_ptr, orders_it, amount)
+        if queue_position is not None:
+            queue_position.spent_amount += sold_amount
+            queue_position.acquired_amount += acquired_amount
+            if not is_partial_fill:
+                # The completed event reports the totals of all the fills
+                sold_amount = queue_position.spent_amount
+                acquired_amount = queue_position.acquired_amount
 
         # add fee
         fees = build_trade_fee(
@@ -800,12 +927,15 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.SELL,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        if is_partial_fill:
+            return
+
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(
@@ -823,14 +953,22 @@ cdef class PaperTradeExchange(ExchangeBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=None):
+        """
+        Fills the limit order, in full or by fill_amount if it is less than the order amount.
+        """
+        cdef:
+            str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
+            # The crossed limit orders of the trading pair are checked again in the next tick
+            self._crossed_limit_orders_prices.pop((trading_pair, is_buy), None)
 
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
@@ -839,6 +977,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         """
         Trigger limit orders when the opposite side of the order book has crossed the limit order's price.
         This implies someone was ready to fill the limit order, if that limit order was on the market.
+        The orders are only checked again when the opposite price changes or new orders are placed, the ones crossed
+        at that price were already processed.
 
         :param is_buy: are the limit orders on the bid side?
         :param limit_orders_map_ptr: pointer to the limit orders map
@@ -852,6 +992,11 @@ cdef class PaperTradeExchange(ExchangeBase):
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            tuple checked_prices_key = (trading_pair, is_buy)
+
+        if self._crossed_limit_orders_prices.get(checked_prices_key) == opposite_order_book_price:
+            return
+        self._crossed_limit_orders_prices[checked_prices_key] = opposite_order_book_price
 
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
@@ -890,10 +1035,43 @@ cdef class PaperTradeExchange(ExchangeBase):
             if map_it != limit_orders_ptr.end():
                 inc(map_it)
 
+    cdef c_add_queue_position(self, str trading_pair, str order_id, bint is_buy, object price):
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            double order_price = float(price)
+
+        if trading_pair not in self._queue_positions:
+            self._queue_positions[trading_pair] = {}
+            self._queue_positions_book_versions[trading_pair] = order_book._version
+        self._queue_positions[trading_pair][order_id] = LimitOrderQueuePosition(
+            is_buy, order_price, order_book.c_get_level_amount(is_buy, order_price))
+
+    cdef c_update_queue_positions(self):
+        """
+        Reduces the volume ahead of the queue positions to the amount left in their levels, only for the trading pairs
+        whose order book changed since the last tick.
+        """
+        cdef:
+            OrderBook order_book
+            LimitOrderQueuePosition queue_position
+
+        for trading_pair, queue_positions in self._queue_positions.items():
+            order_book = self.c_get_order_book(trading_pair)
+            if self._queue_positions_book_versions.get(trading_pair) == order_book._version:
+                continue
+            self._queue_positions_book_versions[trading_pair] = order_book._version
+            for queue_position in queue_positions.values():
+                if queue_position.volume_ahead > 0:
+                    queue_position.volume_ahead = min(
+                        queue_position.volume_ahead,
+                        order_book.c_get_level_amount(queue_position.is_buy, queue_position.price))
+
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
         Trigger limit orders when incoming market orders have crossed the limit order's price.
+        When filling by queue position, the orders at the trade price are also filled by the traded volume left after
+        their queue positions.
 
         :param order_book_trade_event: trade event from order book
         """
@@ -910,7 +1088,9 @@ cdef class PaperTradeExchange(ExchangeBase):
             SingleTradingPairLimitOrdersIterator orders_it
             SingleTradingPairLimitOrdersRIterator orders_rit
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
+            vector[SingleTradingPairLimitOrdersIterator] at_trade_price_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            object order_price
 
         if map_it == limit_orders_map_ptr.end():
             return
@@ -920,22 +1100,72 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                order_price = <object>cpp_limit_order_ptr.getPrice()
+                if self._queue_position_fills and float(order_price) == float(trade_price):
+                    at_trade_price_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                elif order_price > trade_price:
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                else:
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
         else:
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                order_price = <object>cpp_limit_order_ptr.getPrice()
+                if self._queue_position_fills and float(order_price) == float(trade_price):
+                    at_trade_price_order_its.push_back(orders_it)
+                elif order_price < trade_price:
+                    process_order_its.push_back(orders_it)
+                else:
                     break
-                process_order_its.push_back(orders_it)
                 inc(orders_it)
 
         for orders_it in process_order_its:
             self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+        if at_trade_price_order_its.size() > 0:
+            self.c_match_trade_to_queued_limit_orders(
+                is_maker_buy, trade_quantity, limit_orders_map_ptr, address(map_it), at_trade_price_order_its)
+
+    cdef c_match_trade_to_queued_limit_orders(self,
+                                              bint is_buy,
+                                              object trade_quantity,
+                                              LimitOrders *limit_orders_map_ptr,
+                                              LimitOrdersIterator *map_it_ptr,
+                                              vector[SingleTradingPairLimitOrdersIterator] orders_its):
+        """
+        Fills the limit orders at the price of a trade with the traded volume. The volume first consumes the volume
+        ahead of each order in its level, and the rest fills the order, partially if it is not enough.
+        """
+        cdef:
+            str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
+            dict queue_positions = self._queue_positions.get(trading_pair, {})
+            double remaining_volume = float(trade_quantity)
+            double consumed_volume
+            const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            LimitOrderQueuePosition queue_position
+            SingleTradingPairLimitOrdersIterator orders_it
+
+        for orders_it in orders_its:
+            if remaining_volume <= 0:
+                break
+            cpp_limit_order_ptr = address(deref(orders_it))
+            queue_position = queue_positions.get(cpp_limit_order_ptr.getClientOrderID().decode("utf8"))
+            if queue_position is None:
+                continue
+            consumed_volume = min(remaining_volume, queue_position.volume_ahead)
+            queue_position.volume_ahead -= consumed_volume
+            remaining_volume -= consumed_volume
+            if remaining_volume <= 0:
+                break
+            fill_amount = self.c_quantize_order_amount(
+                trading_pair, min(<object>cpp_limit_order_ptr.getQuantity(), Decimal(repr(remaining_volume))))
+            if fill_amount <= s_decimal_0:
+                break
+            remaining_volume -= float(fill_amount)
+            self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
 
     # </editor-fold>
 
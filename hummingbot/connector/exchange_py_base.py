@@ -3,23 +3,27 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from async_timeout import timeout
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -45,6 +49,19 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    CONCURRENT_ORDER_BOOK_INIT = False
+    COALESCE_ORDER_BOOK_DIFFS = False
+    THROTTLER_CLASS: Type[AsyncThrottlerBase] = AsyncThrottler
+    # Maximum number of orders per request of the exchange batch endpoints (0 when the exchange has no batch endpoint)
+    BATCH_ORDER_CREATE_MAX_SIZE = 0
+    BATCH_ORDER_CANCEL_MAX_SIZE = 0
+    # Maximum number of order status and order fills requests executed at the same time (1 to execute them one by one)
+    ORDER_STATUS_UPDATE_CONCURRENCY = 1
+    # Minimum number of orders in a trading pair to update their status and fills with the exchange open orders and
+    # recent trades endpoints instead of one request per order (0 when the exchange has no such endpoints)
+    BULK_ORDER_STATUS_UPDATE_MIN_ORDERS = 0
+    # Seconds before the last trades update included in the next recent trades request (covers clock differences)
+    BULK_TRADES_UPDATE_TIME_MARGIN = 60.0
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -60,9 +77,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        # Time of the last update that included all the trades of the fillable orders of each trading pair
+        self._last_trades_update_timestamps: Dict[str, float] = {}
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
+        self._throttler = self.THROTTLER_CLASS(
             rate_limits=self.rate_limits_rules,
             limits_share_percentage=client_config_map.rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
@@ -76,7 +95,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            concurrent_init=self.CONCURRENT_ORDER_BOOK_INIT,
+            coalesce_diffs=self.COALESCE_ORDER_BOOK_DIFFS))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -194,6 +215,15 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return {key: value.to_json() for key, value in self._order_tracker.all_updatable_orders.items()}
 
+    def tracking_state(self, order_id: str) -> Optional[Dict[str, any]]:
+        # The order events are triggered before the tracker stops tracking the order, but done orders are not part of
+        # the tracking states (except the lost orders)
+        order = self._order_tracker.fetch_tracked_order(order_id)
+        if order is not None:
+            return None if order.is_done else order.to_json()
+        lost_order = self._order_tracker.fetch_lost_order(client_order_id=order_id)
+        return lost_order.to_json() if lost_order is not None else None
+
     @abstractmethod
     def supported_order_types(self) -> List[OrderType]:
         raise NotImplementedError
@@ -320,6 +350,44 @@ class ExchangePyBase(ExchangeBase, ABC):
             **kwargs))
         return order_id
 
+    def batch_order_create(
+        self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Issues the orders creation using the exchange batch endpoint, splitting the orders in as many requests as
+        required by the maximum batch size. If the exchange has no batch endpoint the orders are created one by one.
+
+        :param orders_to_create: A list of LimitOrder or MarketOrder objects representing the orders to create. The
+            order IDs can be blanc.
+
+        :return: A list of LimitOrder or MarketOrder objects representing the created orders, complete with the
+            generated order IDs.
+        """
+        if self.BATCH_ORDER_CREATE_MAX_SIZE <= 0:
+            return super().batch_order_create(orders_to_create=orders_to_create)
+        orders_with_ids_to_create = [
+            order.copy_with_id(client_order_id=get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length))
+            for order in orders_to_create
+        ]
+        safe_ensure_future(self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create))
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Issues the orders cancelation using the exchange batch endpoint, splitting the orders in as many requests as
+        required by the maximum batch size. If the exchange has no batch endpoint the orders are canceled one by one.
+
+        :param orders_to_cancel: A list of the orders to cancel.
+        """
+        if self.BATCH_ORDER_CANCEL_MAX_SIZE <= 0:
+            super().batch_order_cancel(orders_to_cancel=orders_to_cancel)
+        else:
+            safe_ensure_future(self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
     def get_fee(self,
                 base_currency: str,
                 quote_currency: str,
@@ -366,20 +434,28 @@ class ExchangePyBase(ExchangeBase, ABC):
         :return: a list of CancellationResult instances, one for each of the orders to be cancelled
         """
         incomplete_orders = [o for o in self.in_flight_orders.values() if not o.is_done]
-        tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
         order_id_set = set([o.client_order_id for o in incomplete_orders])
         successful_cancellations = []
 
         try:
             async with timeout(timeout_seconds):
-                cancellation_results = await safe_gather(*tasks, return_exceptions=True)
-                for cr in cancellation_results:
-                    if isinstance(cr, Exception):
-                        continue
-                    client_order_id = cr
-                    if client_order_id is not None:
-                        order_id_set.remove(client_order_id)
-                        successful_cancellations.append(CancellationResult(client_order_id, True))
+                if self.BATCH_ORDER_CANCEL_MAX_SIZE > 0:
+                    batch_results = await self._execute_batch_cancel(
+                        orders_to_cancel=[order.to_limit_order() for order in incomplete_orders])
+                    for cr in batch_results:
+                        if cr.success:
+                            order_id_set.remove(cr.order_id)
+                            successful_cancellations.append(CancellationResult(cr.order_id, True))
+                else:
+                    tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
+                    cancellation_results = await safe_gather(*tasks, return_exceptions=True)
+                    for cr in cancellation_results:
+                        if isinstance(cr, Exception):
+                            continue
+                        client_order_id = cr
+                        if client_order_id is not None:
+                            order_id_set.remove(client_order_id)
+                            successful_cancellations.append(CancellationResult(client_order_id, True))
         except Exception:
             self.logger().network(
                 "Unexpected error cancelling orders.",
@@ -407,6 +483,48 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        order = self._start_tracking_and_validate_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+        if order is None:
+            return
+        try:
+            await self._place_order_and_process_update(order=order, **kwargs,)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._on_order_failure(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=order.amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=order.price,
+                exception=ex,
+                **kwargs,
+            )
+
+    def _start_tracking_and_validate_order(self,
+                                           trade_type: TradeType,
+                                           order_id: str,
+                                           trading_pair: str,
+                                           amount: Decimal,
+                                           order_type: OrderType,
+                                           price: Optional[Decimal] = None,
+                                           **kwargs) -> Optional[InFlightOrder]:
+        """
+        Starts tracking the order and checks it against the trading rules. The order is marked as failed if it does
+        not comply with them.
+
+        :return: the tracked order, or None if the order can't be created
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -433,37 +551,23 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif quantized_amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order "
                                   f"size {trading_rule.min_order_size}. The order will not be created, increase the "
                                   f"amount to be higher than the minimum order size.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif notional_size < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {notional_size} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. The order will not be "
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
-        try:
-            await self._place_order_and_process_update(order=order, **kwargs,)
+            return None
 
-        except asyncio.CancelledError:
-            raise
-        except Exception as ex:
-            self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
-                exception=ex,
-                **kwargs,
-            )
+        return order
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
         exchange_order_id, update_timestamp = await self._place_order(
@@ -539,20 +643,23 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
         cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
-            update_timestamp = self.current_timestamp
-            if update_timestamp is None or math.isnan(update_timestamp):
-                update_timestamp = self._time()
-            order_update: OrderUpdate = OrderUpdate(
-                client_order_id=order.client_order_id,
-                trading_pair=order.trading_pair,
-                update_timestamp=update_timestamp,
-                new_state=(OrderState.CANCELED
-                           if self.is_cancel_request_in_exchange_synchronous
-                           else OrderState.PENDING_CANCEL),
-            )
-            self._order_tracker.process_order_update(order_update)
+            self._process_order_cancel_request_success(order=order)
         return cancelled
 
+    def _process_order_cancel_request_success(self, order: InFlightOrder):
+        update_timestamp = self.current_timestamp
+        if update_timestamp is None or math.isnan(update_timestamp):
+            update_timestamp = self._time()
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=update_timestamp,
+            new_state=(OrderState.CANCELED
+                       if self.is_cancel_request_in_exchange_synchronous
+                       else OrderState.PENDING_CANCEL),
+        )
+        self._order_tracker.process_order_update(order_update)
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Requests the exchange to cancel an active order
@@ -567,6 +674,120 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    def _batch_order_kwargs(self, order: Union[LimitOrder, MarketOrder]) -> Dict[str, Any]:
+        """
+        Additional parameters required to create the order in the exchange (e.g. the position action for perpetuals)
+        """
+        return {}
+
+    async def _execute_batch_order_create(self, orders_to_create: List[Union[LimitOrder, MarketOrder]]):
+        tracked_orders = []
+        for order in orders_to_create:
+            tracked_order = self._start_tracking_and_validate_order(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity,
+                order_type=order.order_type(),
+                price=order.price if order.price is not None else s_decimal_NaN,
+                **self._batch_order_kwargs(order),
+            )
+            if tracked_order is not None:
+                tracked_orders.append(tracked_order)
+
+        max_size = self.BATCH_ORDER_CREATE_MAX_SIZE
+        await safe_gather(*[
+            self._execute_batch_inflight_order_create(orders=tracked_orders[index:index + max_size])
+            for index in range(0, len(tracked_orders), max_size)
+        ])
+
+    async def _execute_batch_inflight_order_create(self, orders: List[InFlightOrder]):
+        try:
+            place_order_results = await self._place_orders_batch(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            place_order_results = [
+                PlaceOrderResult(
+                    update_timestamp=self.current_timestamp,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=None,
+                    trading_pair=order.trading_pair,
+                    exception=ex,
+                )
+                for order in orders
+            ]
+
+        results_by_order_id = {result.client_order_id: result for result in place_order_results}
+        for order in orders:
+            result = results_by_order_id.get(order.client_order_id)
+            if result is None or result.exception is not None:
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=(result.exception if result is not None
+                               else IOError(f"The batch order create response does not include the order "
+                                            f"{order.client_order_id}")),
+                )
+            else:
+                self._order_tracker.process_order_update(OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(result.exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=result.update_timestamp,
+                    new_state=OrderState.OPEN,
+                ))
+
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        tracked_orders = []
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.fetch_tracked_order(order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders.append(tracked_order)
+
+        max_size = self.BATCH_ORDER_CANCEL_MAX_SIZE
+        batches_results = await safe_gather(*[
+            self._execute_batch_order_cancel(orders=tracked_orders[index:index + max_size])
+            for index in range(0, len(tracked_orders), max_size)
+        ])
+        return [result for batch_results in batches_results for result in batch_results]
+
+    async def _execute_batch_order_cancel(self, orders: List[InFlightOrder]) -> List[CancellationResult]:
+        try:
+            cancel_order_results = await self._place_cancels_batch(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            cancel_order_results = [
+                CancelOrderResult(client_order_id=order.client_order_id, trading_pair=order.trading_pair, exception=ex)
+                for order in orders
+            ]
+
+        results_by_order_id = {result.client_order_id: result for result in cancel_order_results}
+        cancellation_results = []
+        for order in orders:
+            result = results_by_order_id.get(order.client_order_id)
+            success = False
+            if result is None:
+                self.logger().error(f"Failed to cancel order {order.client_order_id} (not included in the batch "
+                                    f"cancel response)")
+            elif result.not_found or (
+                    result.exception is not None
+                    and self._is_order_not_found_during_cancelation_error(cancelation_exception=result.exception)):
+                self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
+                await self._order_tracker.process_order_not_found(order.client_order_id)
+            elif result.exception is not None:
+                self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=result.exception)
+            else:
+                self._process_order_cancel_request_success(order=order)
+                success = True
+            cancellation_results.append(CancellationResult(order_id=order.client_order_id, success=success))
+        return cancellation_results
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -640,6 +861,26 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        """
+        Creates the orders in the exchange with a single request. Only required when BATCH_ORDER_CREATE_MAX_SIZE is
+        greater than zero.
+
+        :param orders: the orders to create, never more than BATCH_ORDER_CREATE_MAX_SIZE
+        :return: the result for each order, with the exception raised by the exchange for the rejected ones
+        """
+        raise NotImplementedError
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        """
+        Cancels the orders in the exchange with a single request. Only required when BATCH_ORDER_CANCEL_MAX_SIZE is
+        greater than zero.
+
+        :param orders: the orders to cancel, never more than BATCH_ORDER_CANCEL_MAX_SIZE
+        :return: the result for each order, with the exception raised by the exchange for the rejected ones
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -949,19 +1190,90 @@ class ExchangePyBase(ExchangeBase, ABC):
                 exc_info=request_error,
             )
 
-    async def _update_orders_fills(self, orders: List[InFlightOrder]):
+    async def _process_orders_concurrently(self,
+                                           orders: List[InFlightOrder],
+                                           process: Callable[[InFlightOrder], Awaitable[Any]]) -> List[Any]:
+        """
+        Executes the process function for each order, keeping at most ORDER_STATUS_UPDATE_CONCURRENCY of them running
+        at the same time. The requests are still subject to the throttler limits.
+
+        :return: the result of the process function for each order
+        """
+        if self.ORDER_STATUS_UPDATE_CONCURRENCY <= 1:
+            return [await process(order) for order in orders]
+
+        semaphore = asyncio.Semaphore(self.ORDER_STATUS_UPDATE_CONCURRENCY)
+
+        async def process_with_semaphore(order: InFlightOrder):
+            async with semaphore:
+                return await process(order)
+
+        return await safe_gather(*[process_with_semaphore(order) for order in orders])
+
+    @staticmethod
+    def _orders_by_trading_pair(orders: List[InFlightOrder]) -> Dict[str, List[InFlightOrder]]:
+        orders_by_trading_pair = defaultdict(list)
         for order in orders:
+            orders_by_trading_pair[order.trading_pair].append(order)
+        return orders_by_trading_pair
+
+    async def _update_orders_fills(self, orders: List[InFlightOrder]):
+        if self.BULK_ORDER_STATUS_UPDATE_MIN_ORDERS > 0:
+            await safe_gather(*[
+                self._update_trading_pair_orders_fills(trading_pair=trading_pair, orders=trading_pair_orders)
+                for trading_pair, trading_pair_orders in self._orders_by_trading_pair(orders).items()
+            ])
+        else:
+            await self._process_orders_concurrently(orders=orders, process=self._update_order_fills)
+
+    async def _update_order_fills(self, order: InFlightOrder) -> bool:
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+            return True
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return False
+
+    async def _update_trading_pair_orders_fills(self, trading_pair: str, orders: List[InFlightOrder]):
+        """
+        Fetches the trades of the orders with a single recent trades request for the trading pair when it has enough
+        orders and the time of the previous update is known. Otherwise the trades are requested order by order.
+        """
+        update_timestamp = self._time()
+        last_update_timestamp = self._last_trades_update_timestamps.get(trading_pair)
+
+        if last_update_timestamp is not None and len(orders) >= self.BULK_ORDER_STATUS_UPDATE_MIN_ORDERS:
             try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
+                trade_updates = await self._request_trade_updates_for_trading_pair(
+                    trading_pair=trading_pair,
+                    since_timestamp=last_update_timestamp - self.BULK_TRADES_UPDATE_TIME_MARGIN)
             except asyncio.CancelledError:
                 raise
             except Exception as request_error:
                 self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                    f"Failed to fetch trade updates for {trading_pair}. Error: {request_error}",
                     exc_info=request_error,
                 )
+                return
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+            self._last_trades_update_timestamps[trading_pair] = update_timestamp
+        else:
+            results = await self._process_orders_concurrently(orders=orders, process=self._update_order_fills)
+            updated_order_ids = {order.client_order_id for order in orders}
+            all_orders_updated = all(results) and all(
+                order.client_order_id in updated_order_ids
+                for order in self._order_tracker.all_fillable_orders.values()
+                if order.trading_pair == trading_pair)
+            if all_orders_updated:
+                self._last_trades_update_timestamps[trading_pair] = update_timestamp
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -990,14 +1302,69 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
+        if self.BULK_ORDER_STATUS_UPDATE_MIN_ORDERS > 0:
+            orders = await self._update_orders_with_open_orders(orders=orders)
+
+        async def update_order(order: InFlightOrder):
+            await self._update_order_with_error_handler(order=order, error_handler=error_handler)
+
+        await self._process_orders_concurrently(orders=orders, process=update_order)
+
+    async def _update_order_with_error_handler(self, order: InFlightOrder, error_handler: Callable):
+        try:
+            order_update = await self._request_order_status(tracked_order=order)
+            self._order_tracker.process_order_update(order_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            await error_handler(order, request_error)
+
+    async def _update_orders_with_open_orders(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Updates the orders of the trading pairs with enough orders with a single open orders request per trading pair.
+
+        :return: the orders that still require an individual status request (the ones not in the open orders list,
+            and the ones of the trading pairs with less orders than BULK_ORDER_STATUS_UPDATE_MIN_ORDERS)
+        """
+        orders_to_request = []
+        bulk_update_tasks = []
+        for trading_pair, trading_pair_orders in self._orders_by_trading_pair(orders).items():
+            if len(trading_pair_orders) >= self.BULK_ORDER_STATUS_UPDATE_MIN_ORDERS:
+                bulk_update_tasks.append(self._update_trading_pair_orders_with_open_orders(
+                    trading_pair=trading_pair, orders=trading_pair_orders))
+            else:
+                orders_to_request.extend(trading_pair_orders)
+
+        for not_open_orders in await safe_gather(*bulk_update_tasks):
+            orders_to_request.extend(not_open_orders)
+        return orders_to_request
+
+    async def _update_trading_pair_orders_with_open_orders(
+            self, trading_pair: str, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        try:
+            open_order_updates = await self._request_open_orders_updates(trading_pair=trading_pair)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            # The orders are not requested one by one to avoid multiplying the requests while the exchange is failing
+            self.logger().warning(
+                f"Failed to fetch the open orders for {trading_pair}. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return []
+
+        updates_by_client_order_id = {update.client_order_id: update for update in open_order_updates}
+        updates_by_exchange_order_id = {update.exchange_order_id: update for update in open_order_updates}
+        not_open_orders = []
         for order in orders:
-            try:
-                order_update = await self._request_order_status(tracked_order=order)
+            order_update = updates_by_client_order_id.get(order.client_order_id)
+            if order_update is None and order.exchange_order_id is not None:
+                order_update = updates_by_exchange_order_id.get(order.exchange_order_id)
+            if order_update is None:
+                not_open_orders.append(order)
+            else:
                 self._order_tracker.process_order_update(order_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                await error_handler(order, request_error)
+        return not_open_orders
 
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
@@ -1049,6 +1416,28 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_open_orders_updates(self, trading_pair: str) -> List[OrderUpdate]:
+        """
+        Requests the orders of the trading pair that are open in the exchange. Only required when
+        BULK_ORDER_STATUS_UPDATE_MIN_ORDERS is greater than zero.
+
+        :param trading_pair: the trading pair of the orders
+        :return: an update for each open order, including its client order id
+        """
+        raise NotImplementedError
+
+    async def _request_trade_updates_for_trading_pair(self, trading_pair: str, since_timestamp: float
+                                                      ) -> List[TradeUpdate]:
+        """
+        Requests the trades of the trading pair executed since the timestamp. Only required when
+        BULK_ORDER_STATUS_UPDATE_MIN_ORDERS is greater than zero.
+
+        :param trading_pair: the trading pair of the trades
+        :param since_timestamp: the time (in seconds) of the oldest trade to include
+        :return: the trade updates of the trades that belong to the fillable orders tracked by the connector
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
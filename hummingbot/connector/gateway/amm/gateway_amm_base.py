@@ -180,6 +180,10 @@ class GatewayAMMBase(ConnectorBase):
             for key, value in self.in_flight_orders.items()
         }
 
+    def tracking_state(self, order_id: str) -> Optional[Dict[str, Any]]:
+        order = self.in_flight_orders.get(order_id)
+        return order.to_json() if order is not None else None
+
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         self._order_tracker._in_flight_orders.update({
             key: GatewayInFlightOrder.from_json(value)
@@ -6,7 +6,7 @@ import threading
 import time
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -35,11 +35,13 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.columnar_market_data import ColumnarMarketDataWriter
 from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
 from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_update import MarketStateUpdate
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.position import Position
@@ -47,6 +49,7 @@ from hummingbot.model.range_position_collected_fees import RangePositionCollecte
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.write_behind_queue import WriteBehindMetrics, WriteBehindQueue
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
@@ -76,7 +79,8 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 min_market_state_updates_to_compact: int = 1000):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -87,6 +91,18 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_writer: Optional[ColumnarMarketDataWriter] = None
+        if market_data_collection.market_data_collection_format == "columnar":
+            self._market_data_writer = ColumnarMarketDataWriter(
+                root=os.path.join(data_path(), "market_data"),
+                depth=market_data_collection.market_data_collection_depth)
+        # The event records are written in batches from a background thread while the recorder is started
+        self._write_queue: WriteBehindQueue = WriteBehindQueue(sql_manager=sql)
+        # The tracking states of each market are stored as a snapshot (MarketState) and a journal of the changes of
+        # single orders since then (MarketStateUpdate), compacted into a new snapshot when it gets longer than it
+        self._min_market_state_updates_to_compact: int = min_market_state_updates_to_compact
+        self._market_state_updates: Dict[str, int] = {}
+        self._market_state_snapshot_sizes: Dict[str, int] = {}
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -134,28 +150,10 @@ class MarketsRecorder:
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    if self._market_data_writer is not None:
+                        self._record_market_data_columns()
+                    else:
+                        self._record_market_data_rows()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -163,6 +161,46 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    def _record_market_data_rows(self):
+        market_data_records: List[MarketData] = []
+        for market in self._markets:
+            exchange = market.display_name
+            for trading_pair in market.trading_pairs:
+                mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                order_book = market.get_order_book(trading_pair)
+                depth = self._market_data_collection_config.market_data_collection_depth + 1
+                bids, asks = order_book.top_levels(depth)
+                market_data = MarketData(
+                    timestamp=self.db_timestamp,
+                    exchange=exchange,
+                    trading_pair=trading_pair,
+                    mid_price=mid_price,
+                    best_bid=best_bid,
+                    best_ask=best_ask,
+                    order_book={
+                        "bid": bids.tolist(),
+                        "ask": asks.tolist()}
+                )
+                market_data_records.append(market_data)
+        self._write_queue.submit(lambda session, records=market_data_records: session.add_all(records))
+
+    def _record_market_data_columns(self):
+        timestamp = time.time()
+        for market in self._markets:
+            exchange = market.display_name
+            for trading_pair in market.trading_pairs:
+                self._market_data_writer.append(
+                    exchange=exchange,
+                    trading_pair=trading_pair,
+                    timestamp=timestamp,
+                    mid_price=float(market.get_price_by_type(trading_pair, PriceType.MidPrice)),
+                    best_bid=float(market.get_price_by_type(trading_pair, PriceType.BestBid)),
+                    best_ask=float(market.get_price_by_type(trading_pair, PriceType.BestAsk)),
+                    order_book=market.get_order_book(trading_pair),
+                )
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -179,7 +217,19 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def pending_writes(self) -> int:
+        """
+        Number of event records waiting to be written to the database
+        """
+        return self._write_queue.queue_depth
+
+    @property
+    def write_metrics(self) -> WriteBehindMetrics:
+        return self._write_queue.metrics
+
     def start(self):
+        self._write_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -192,6 +242,15 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._market_data_writer is not None:
+            self._market_data_writer.flush()
+        self._write_queue.stop()
+
+    def flush(self):
+        """
+        Waits until all the event records are written to the database.
+        """
+        self._write_queue.flush()
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -242,6 +301,7 @@ class MarketsRecorder:
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path,
                        Order.market == market.display_name]
@@ -257,6 +317,7 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
                             .query(TradeFill)
@@ -268,37 +329,129 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
-
-        if market_states is not None:
-            market_states.saved_state = market.tracking_states
-            market_states.timestamp = timestamp
-        else:
-            market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
-                                        timestamp=timestamp,
-                                        saved_state=market.tracking_states)
-            session.add(market_states)
+        self._write_market_states(config_file_path=config_file_path,
+                                  market_name=market.display_name,
+                                  timestamp=self.db_timestamp,
+                                  saved_state=market.tracking_states,
+                                  session=session)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
+        self.flush()
         with self._sql_manager.get_new_session() as session:
-            market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+            saved_state: Optional[Dict[str, Any]] = self._read_market_states(config_file_path,
+                                                                             market.display_name,
+                                                                             session=session)
 
-            if market_states is not None:
-                market.restore_tracking_states(market_states.saved_state)
+        if saved_state is not None:
+            market.restore_tracking_states(saved_state)
 
     def get_market_states(self,
                           config_file_path: str,
                           market: ConnectorBase,
                           session: Session) -> Optional[MarketState]:
+        return self._get_market_states(config_file_path, market.display_name, session=session)
+
+    @staticmethod
+    def _get_market_states(config_file_path: str, market_name: str, session: Session) -> Optional[MarketState]:
         query: Query = (session
                         .query(MarketState)
                         .filter(MarketState.config_file_path == config_file_path,
-                                MarketState.market == market.display_name))
+                                MarketState.market == market_name))
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def _read_market_states(self,
+                            config_file_path: str,
+                            market_name: str,
+                            session: Session) -> Optional[Dict[str, Any]]:
+        """
+        Returns the tracking states of the market: its last snapshot with the journal of changes applied in order.
+        """
+        market_states: Optional[MarketState] = self._get_market_states(config_file_path, market_name, session=session)
+        updates: List[Tuple[str, Optional[Dict[str, Any]]]] = (
+            session
+            .query(MarketStateUpdate.order_id, MarketStateUpdate.saved_state)
+            .filter(MarketStateUpdate.config_file_path == config_file_path,
+                    MarketStateUpdate.market == market_name)
+            .order_by(MarketStateUpdate.id)
+            .all())
+        if market_states is None and len(updates) == 0:
+            return None
+
+        saved_state: Dict[str, Any] = dict(market_states.saved_state) if market_states is not None else {}
+        for order_id, order_state in updates:
+            if order_state is None:
+                saved_state.pop(order_id, None)
+            else:
+                saved_state[order_id] = order_state
+        return saved_state
+
+    @staticmethod
+    def _write_market_states(config_file_path: str,
+                             market_name: str,
+                             timestamp: int,
+                             saved_state: Dict[str, Any],
+                             session: Session):
+        """
+        Stores a snapshot of the tracking states of the market, replacing the previous one and its journal of changes.
+        """
+        market_states: Optional[MarketState] = MarketsRecorder._get_market_states(config_file_path, market_name,
+                                                                                  session=session)
+        if market_states is not None:
+            market_states.saved_state = saved_state
+            market_states.timestamp = timestamp
+        else:
+            market_states = MarketState(config_file_path=config_file_path,
+                                        market=market_name,
+                                        timestamp=timestamp,
+                                        saved_state=saved_state)
+            session.add(market_states)
+        # The journal records added in the same transaction have to be deleted as well
+        session.flush()
+        (session
+         .query(MarketStateUpdate)
+         .filter(MarketStateUpdate.config_file_path == config_file_path,
+                 MarketStateUpdate.market == market_name)
+         .delete())
+
+    def _snapshot_market_states(self, market: ConnectorBase):
+        """
+        Writes a snapshot of all the current tracking states of the market, replacing its journal of changes.
+        """
+        market_name: str = market.display_name
+        saved_state: Dict[str, Any] = market.tracking_states
+        timestamp: int = self.db_timestamp
+        self._market_state_updates[market_name] = 0
+        self._market_state_snapshot_sizes[market_name] = len(saved_state)
+        # Written after the journal records of the previous events, that it replaces
+        self._write_queue.submit(
+            lambda session: self._write_market_states(config_file_path=self._config_file_path,
+                                                      market_name=market_name,
+                                                      timestamp=timestamp,
+                                                      saved_state=saved_state,
+                                                      session=session))
+
+    def _record_order_state(self, market: ConnectorBase, order_id: str) -> Optional[MarketStateUpdate]:
+        """
+        Returns the journal record with the current tracking state of the order, to be written with the records of the
+        event. On the first event of the market, and when its journal gets more records than orders in its last
+        snapshot, a new snapshot of all the tracking states is written instead (and None is returned). That keeps the
+        cost of each event constant on average, instead of serializing all the orders every time.
+        """
+        market_name: str = market.display_name
+        updates: Optional[int] = self._market_state_updates.get(market_name)
+        if updates is None or updates >= max(self._min_market_state_updates_to_compact,
+                                             self._market_state_snapshot_sizes[market_name]):
+            self._snapshot_market_states(market)
+            return None
+
+        self._market_state_updates[market_name] = updates + 1
+        return MarketStateUpdate(config_file_path=self._config_file_path,
+                                 market=market_name,
+                                 timestamp=self.db_timestamp,
+                                 order_id=order_id,
+                                 saved_state=market.tracking_state(order_id))
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
@@ -311,31 +464,36 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        market_name: str = market.display_name
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        order_state_update: Optional[MarketStateUpdate] = self._record_order_state(market, evt.order_id)
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+            if order_state_update is not None:
+                session.add(order_state_update)
+
+        self._write_queue.submit(write)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -350,56 +508,60 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        market_name: str = market.display_name
+
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        order_state_update: Optional[MarketStateUpdate] = self._record_order_state(market, order_id)
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            if order_state_update is not None:
+                session.add(order_state_update)
+
+        self._write_queue.submit(write)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -410,20 +572,22 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        market_name: str = market.display_name
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._write_queue.submit(write)
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
@@ -468,19 +632,22 @@ class MarketsRecorder:
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
+        order_state_update: Optional[MarketStateUpdate] = self._record_order_state(market, order_id)
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def write(session: Session):
+            if order_state_update is not None:
+                session.add(order_state_update)
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._write_queue.submit(write)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -515,16 +682,19 @@ class MarketsRecorder:
             return
 
         timestamp: int = self.db_timestamp
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        order_state_update: Optional[MarketStateUpdate] = self._record_order_state(connector, evt.order_id)
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session):
+            session.add(rp_update)
+            if order_state_update is not None:
+                session.add(order_state_update)
+
+        self._write_queue.submit(write)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -534,17 +704,20 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        # The event is not related to a single order
+        self._snapshot_market_states(connector)
+
+        def write(session: Session):
+            session.add(rp_fees)
+
+        self._write_queue.submit(write)
 
     @staticmethod
     async def _sleep(delay):
@@ -1,7 +1,7 @@
 import asyncio
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from hummingbot.connector.constants import s_decimal_0, s_decimal_NaN
 from hummingbot.connector.derivative.perpetual_budget_checker import PerpetualBudgetChecker
@@ -10,7 +10,9 @@ from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.perpetual_trading import PerpetualTrading
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.funding_info import FundingInfo
-from hummingbot.core.data_type.in_flight_order import PerpetualDerivativeInFlightOrder
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, PerpetualDerivativeInFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.perpetual_api_order_book_data_source import PerpetualAPIOrderBookDataSource
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
 from hummingbot.core.event.events import (
@@ -250,6 +252,37 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
             **kwargs,
         )
 
+    def _batch_order_kwargs(self, order: Union[LimitOrder, MarketOrder]) -> Dict[str, Any]:
+        return {"position_action": order.position}
+
+    def _start_tracking_and_validate_order(
+        self,
+        trade_type: TradeType,
+        order_id: str,
+        trading_pair: str,
+        amount: Decimal,
+        order_type: OrderType,
+        price: Optional[Decimal] = None,
+        position_action: PositionAction = PositionAction.NIL,
+        **kwargs,
+    ) -> Optional[InFlightOrder]:
+        if position_action not in self.VALID_POSITION_ACTIONS:
+            self.logger().error(
+                f"Invalid position action {position_action} for order {order_id}. "
+                f"Must be one of {self.VALID_POSITION_ACTIONS}"
+            )
+            return None
+        return super()._start_tracking_and_validate_order(
+            trade_type,
+            order_id,
+            trading_pair,
+            amount,
+            order_type,
+            price,
+            position_action=position_action,
+            **kwargs,
+        )
+
     def get_fee(
         self,
         base_currency: str,
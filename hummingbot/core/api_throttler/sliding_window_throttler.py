@@ -0,0 +1,254 @@
+import asyncio
+import math
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import MAX_CAPACITY_REACHED_WARNING_INTERVAL
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+
+class RateLimitBucket:
+    """
+    Time ordered log of the weights consumed on a rate limit, with the running total of the weight still inside the
+    sliding window.
+    """
+
+    __slots__ = ("limit_id", "limit", "time_interval", "window", "used", "waiting", "_entries")
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.limit_id: str = rate_limit.limit_id
+        self.used: float = 0.0
+        # Number of requests queued waiting for capacity on this bucket
+        self.waiting: int = 0
+        self._entries: Deque[Tuple[float, float]] = deque()
+        self.update_rate_limit(rate_limit, safety_margin_pct)
+
+    def update_rate_limit(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.limit: float = float(rate_limit.limit)
+        self.time_interval: float = float(rate_limit.time_interval)
+        self.window: float = self.time_interval * (1 + safety_margin_pct)
+
+    def expire(self, now: float):
+        entries = self._entries
+        while entries and now - entries[0][0] > self.window:
+            self.used -= entries.popleft()[1]
+        if not entries:
+            self.used = 0.0
+
+    def has_capacity(self, weight: float) -> bool:
+        return self.used + weight <= self.limit
+
+    def add(self, timestamp: float, weight: float):
+        self._entries.append((timestamp, weight))
+        self.used += weight
+
+    def available_at(self, weight: float) -> float:
+        """
+        :return: the time at which enough weight leaves the window to accept the given weight, infinite if the weight
+            is greater than the limit
+        """
+        if weight > self.limit:
+            return math.inf
+        excess = self.used + weight - self.limit
+        if excess <= 0:
+            return 0.0
+        for timestamp, entry_weight in self._entries:
+            excess -= entry_weight
+            if excess <= 0:
+                return timestamp + self.window
+        return math.inf
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _Waiter:
+    __slots__ = ("requirements", "future")
+
+    def __init__(self, requirements: List[Tuple[RateLimitBucket, float]], future: asyncio.Future):
+        self.requirements = requirements
+        self.future = future
+
+
+class SlidingWindowRequestContext:
+    """
+    An async context class ('async with' syntax) that waits until the throttler grants capacity for the task.
+    """
+
+    def __init__(self, throttler: "SlidingWindowThrottler", requirements: List[Tuple[RateLimitBucket, float]]):
+        self._throttler = throttler
+        self._requirements = requirements
+
+    def within_capacity(self) -> bool:
+        return self._throttler.within_capacity(self._requirements)
+
+    async def acquire(self):
+        await self._throttler.acquire(self._requirements)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class SlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Throttler with the same limits semantics as AsyncThrottler, designed for a high number of requests.
+
+    The used capacity is tracked per limit id in time ordered buckets with running totals, so checking the capacity
+    does not depend on the number of requests in the window. Requests that can't be executed wait in FIFO order and
+    are woken up by a timer set to the moment the capacity they need is freed, instead of polling.
+    """
+
+    # Delay added to the wake up timer to make sure the expected entries are out of the window when it fires
+    WAKE_UP_MARGIN = 0.001
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None):
+        self._buckets: Dict[str, RateLimitBucket] = {}
+        self._requirements_cache: Dict[str, List[Tuple[RateLimitBucket, float]]] = {}
+        self._waiters: Deque[_Waiter] = deque()
+        self._wake_up_handle: Optional[asyncio.TimerHandle] = None
+        self._last_max_cap_warning_ts: float = 0.0
+        super().__init__(rate_limits=rate_limits,
+                         retry_interval=retry_interval,
+                         safety_margin_pct=safety_margin_pct,
+                         limits_share_percentage=limits_share_percentage)
+        self._update_buckets()
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        if hasattr(self, "_safety_margin_pct"):
+            self._update_buckets()
+
+    def _update_buckets(self):
+        for limit_id, rate_limit in self._id_to_limit_map.items():
+            bucket = self._buckets.get(limit_id)
+            if bucket is None:
+                self._buckets[limit_id] = RateLimitBucket(rate_limit, self._safety_margin_pct)
+            else:
+                bucket.update_rate_limit(rate_limit, self._safety_margin_pct)
+        self._requirements_cache.clear()
+
+    def _time(self) -> float:
+        return time.time()
+
+    def _requirements(self, limit_id: str) -> List[Tuple[RateLimitBucket, float]]:
+        requirements = self._requirements_cache.get(limit_id)
+        if requirements is None:
+            rate_limit, related_limits = self.get_related_limits(limit_id=limit_id)
+            requirements = []
+            if rate_limit is not None:
+                requirements.append((self._buckets[rate_limit.limit_id], float(rate_limit.weight)))
+                requirements.extend((self._buckets[limit.limit_id], float(weight)) for limit, weight in related_limits)
+            self._requirements_cache[limit_id] = requirements
+        return requirements
+
+    def execute_task(self, limit_id: str) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        return SlidingWindowRequestContext(throttler=self, requirements=self._requirements(limit_id))
+
+    def within_capacity(self, requirements: List[Tuple[RateLimitBucket, float]]) -> bool:
+        now = self._time()
+        for bucket, weight in requirements:
+            bucket.expire(now)
+            if not bucket.has_capacity(weight):
+                return False
+        return True
+
+    def _grant(self, requirements: List[Tuple[RateLimitBucket, float]], now: float):
+        for bucket, weight in requirements:
+            bucket.add(now, weight)
+
+    async def acquire(self, requirements: List[Tuple[RateLimitBucket, float]]):
+        if all(bucket.waiting == 0 for bucket, _ in requirements) and self.within_capacity(requirements):
+            self._grant(requirements, self._time())
+            return
+
+        waiter = _Waiter(requirements, asyncio.get_event_loop().create_future())
+        self._waiters.append(waiter)
+        for bucket, _ in requirements:
+            bucket.waiting += 1
+        self._log_capacity_reached(requirements)
+        self._process_waiters()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if not waiter.future.done() or waiter.future.cancelled():
+                self._remove_waiter(waiter)
+                self._process_waiters()
+            raise
+
+    def _remove_waiter(self, waiter: _Waiter):
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            return
+        for bucket, _ in waiter.requirements:
+            bucket.waiting -= 1
+
+    def _process_waiters(self):
+        """
+        Grants the capacity to the waiting requests in arrival order. A request is skipped when an earlier request
+        waits for one of its buckets, so requests on unrelated limits don't block each other. Then the wake up timer is
+        set to the moment the first blocked request can be executed.
+        """
+        if self._wake_up_handle is not None:
+            self._wake_up_handle.cancel()
+            self._wake_up_handle = None
+
+        now = self._time()
+        blocked_buckets: Set[str] = set()
+        next_wake_up = math.inf
+        remaining_waiters: Deque[_Waiter] = deque()
+        for waiter in self._waiters:
+            if waiter.future.done():
+                for bucket, _ in waiter.requirements:
+                    bucket.waiting -= 1
+                continue
+            requirements = waiter.requirements
+            if any(bucket.limit_id in blocked_buckets for bucket, _ in requirements):
+                blocked_buckets.update(bucket.limit_id for bucket, _ in requirements)
+                remaining_waiters.append(waiter)
+                continue
+            if self.within_capacity(requirements):
+                self._grant(requirements, now)
+                for bucket, _ in requirements:
+                    bucket.waiting -= 1
+                waiter.future.set_result(None)
+                continue
+            available_at = max(bucket.available_at(weight) for bucket, weight in requirements)
+            if available_at != math.inf:
+                # A request that can never be executed does not block the others
+                blocked_buckets.update(bucket.limit_id for bucket, _ in requirements)
+                next_wake_up = min(next_wake_up, available_at)
+            remaining_waiters.append(waiter)
+        self._waiters = remaining_waiters
+
+        if next_wake_up != math.inf:
+            delay = max(0.0, next_wake_up - now) + self.WAKE_UP_MARGIN
+            self._wake_up_handle = asyncio.get_event_loop().call_later(delay, self._process_waiters)
+
+    def _log_capacity_reached(self, requirements: List[Tuple[RateLimitBucket, float]]):
+        now = self._time()
+        if self._last_max_cap_warning_ts >= now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            return
+        for bucket, weight in requirements:
+            if not bucket.has_capacity(weight):
+                self.logger().notify(f"API rate limit on {bucket.limit_id} ({bucket.limit:.0f} calls per "
+                                     f"{bucket.time_interval}s) has almost reached. Limits used "
+                                     f"is {bucket.used:.0f} in the last {bucket.time_interval} seconds")
+                self._last_max_cap_warning_ts = now
+                return
@@ -10,3 +10,9 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        double _min_wake_interval
+        double _last_tick_time
+        object _wake_up_event
+        object _wake_up_forwarder
+        dict _tick_stats
+        int _late_ticks
@@ -3,16 +3,42 @@
 import asyncio
 import logging
 import time
-from typing import List
+from enum import Enum
+from typing import Dict, List, Optional
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.pubsub import PubSub
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
 
+class TickStats:
+    """
+    Execution times (in seconds) of the c_tick calls of a time iterator run by the clock in real time mode.
+    """
+    __slots__ = ("ticks", "total_time", "max_time", "last_time")
+
+    def __init__(self):
+        self.ticks = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.last_time = 0.0
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.ticks if self.ticks > 0 else 0.0
+
+    def record(self, elapsed: float):
+        self.ticks += 1
+        self.total_time += elapsed
+        self.last_time = elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+
 cdef class Clock:
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -21,12 +47,19 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 min_wake_interval: float = 0.0):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param min_wake_interval: (real time mode only) minimum time between the ticks triggered by wake_up() calls.
+        0 disables them, the iterators are only ticked every tick_size seconds.
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +69,12 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._min_wake_interval = min_wake_interval
+        self._last_tick_time = 0.0
+        self._wake_up_event = None
+        self._wake_up_forwarder = EventForwarder(lambda _: self.wake_up())
+        self._tick_stats = {}
+        self._late_ticks = 0
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -49,10 +88,24 @@ cdef class Clock:
     def tick_size(self) -> float:
         return self._tick_size
 
+    @property
+    def min_wake_interval(self) -> float:
+        return self._min_wake_interval
+
+    @property
+    def late_ticks(self) -> int:
+        """
+        Number of real time ticks that finished later than the time of the next tick.
+        """
+        return self._late_ticks
+
     @property
     def child_iterators(self) -> List[TimeIterator]:
         return self._child_iterators
 
+    def tick_stats(self, iterator: TimeIterator) -> Optional[TickStats]:
+        return self._tick_stats.get(iterator)
+
     @property
     def current_timestamp(self) -> float:
         return self._current_tick
@@ -81,6 +134,27 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._tick_stats.pop(iterator, None)
+
+    def wake_up(self):
+        """
+        Requests a tick before the next tick_size boundary, to react to a market event without waiting for it. The tick
+        happens min_wake_interval seconds after the previous one at the earliest. It does nothing if the early wake ups
+        are disabled or the clock is not running.
+        """
+        if self._wake_up_event is not None:
+            self._wake_up_event.set()
+
+    def add_wake_up_source(self, source: PubSub, event_tags: List[Enum]):
+        """
+        Wakes up the clock every time the source triggers one of the events.
+        """
+        for event_tag in event_tags:
+            source.add_listener(event_tag, self._wake_up_forwarder)
+
+    def remove_wake_up_source(self, source: PubSub, event_tags: List[Enum]):
+        for event_tag in event_tags:
+            source.remove_listener(event_tag, self._wake_up_forwarder)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +164,11 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start
+            double iterator_start
+            double elapsed
+            double slowest_iterator_time
+            object slowest_iterator
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -100,6 +179,8 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator.c_start(self, self._current_tick)
             self._started = True
+        if self._min_wake_interval > 0:
+            self._wake_up_event = asyncio.Event()
 
         try:
             while True:
@@ -107,14 +188,22 @@ cdef class Clock:
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
+                # Sleep until the next tick, or until woken up if it happens earlier
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
-                self._current_tick = next_tick_time
+                if self._wake_up_event is None:
+                    await asyncio.sleep(next_tick_time - now)
+                    self._current_tick = next_tick_time
+                else:
+                    self._current_tick = await self._wait_for_next_tick(next_tick_time)
+                self._last_tick_time = self._current_tick
 
                 # Run through all the child iterators.
+                tick_start = time.perf_counter()
+                slowest_iterator_time = 0
+                slowest_iterator = None
                 for ci in self._current_context:
                     child_iterator = ci
+                    iterator_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,11 +211,50 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    elapsed = time.perf_counter() - iterator_start
+                    stats = self._tick_stats.get(ci)
+                    if stats is None:
+                        stats = self._tick_stats[ci] = TickStats()
+                    stats.record(elapsed)
+                    if elapsed > slowest_iterator_time:
+                        slowest_iterator_time = elapsed
+                        slowest_iterator = ci
+
+                # The tick overran if it finished after the time of the next one, because the iterators or the event
+                # loop were too slow. The missed ticks are skipped.
+                elapsed = time.time() - self._current_tick
+                if elapsed > self._tick_size:
+                    self._late_ticks += 1
+                    self.logger().warning(f"The clock tick at {self._current_tick} finished {elapsed:.3f} seconds "
+                                          f"after its time, more than the tick size ({self._tick_size} seconds). "
+                                          f"The iterators took {time.perf_counter() - tick_start:.3f} seconds, "
+                                          f"the slowest one was {type(slowest_iterator).__name__} "
+                                          f"({slowest_iterator_time:.3f} seconds).")
         finally:
+            self._wake_up_event = None
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    async def _wait_for_next_tick(self, next_tick_time: float) -> float:
+        """
+        Waits until the next tick time or a wake up request, whichever happens first, and returns the timestamp of the
+        tick.
+        """
+        now = time.time()
+        earliest_wake_up_time = self._last_tick_time + self._min_wake_interval
+        if earliest_wake_up_time > now:
+            await asyncio.sleep(min(earliest_wake_up_time, next_tick_time) - now)
+            now = time.time()
+        if now < next_tick_time:
+            try:
+                await asyncio.wait_for(self._wake_up_event.wait(), timeout=next_tick_time - now)
+            except asyncio.TimeoutError:
+                pass
+        self._wake_up_event.clear()
+        now = time.time()
+        return next_tick_time if now >= next_tick_time else now
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
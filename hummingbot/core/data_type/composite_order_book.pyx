@@ -28,6 +28,7 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._depth_index_outdated = True
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -71,6 +72,15 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self._depth_index_outdated = True
+
+    cdef c_build_depth_index(self):
+        # The depth index is built from the composite entries, net of the amounts already traded
+        self.c_clear_depth_index()
+        for row in self.bid_entries():
+            self.c_add_depth_index_level(False, row.price, row.amount)
+        for row in self.ask_entries():
+            self.c_add_depth_index_level(True, row.price, row.amount)
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
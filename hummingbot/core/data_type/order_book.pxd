@@ -14,23 +14,48 @@ cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _ask_book
     cdef int64_t _snapshot_uid
     cdef int64_t _last_diff_uid
+    cdef int64_t _version
     cdef double _best_bid
     cdef double _best_ask
     cdef double _last_trade_price
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _depth_index_outdated
+    cdef vector[double] _bid_depth_prices
+    cdef vector[double] _bid_depth_base_volumes
+    cdef vector[double] _bid_depth_quote_volumes
+    cdef vector[double] _ask_depth_prices
+    cdef vector[double] _ask_depth_base_volumes
+    cdef vector[double] _ask_depth_quote_volumes
+    cdef vector[double] _watched_depths_bps
+    cdef vector[double] _watched_depths_bid_volumes
+    cdef vector[double] _watched_depths_ask_volumes
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef bint c_has_listeners(self, int64_t event_tag)
+    cdef bint c_diffs_within_watched_depths(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks)
+    cdef c_trigger_book_change_events(self,
+                                      double previous_best_bid,
+                                      double previous_best_ask,
+                                      int64_t update_id,
+                                      bint depth_changed)
+    cdef double c_get_volume_within_bps(self, bint is_bid, double depth_bps)
+    cdef c_apply_raw_diffs(self, object bids, object asks, int64_t update_id)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_clear_depth_index(self)
+    cdef c_add_depth_index_level(self, bint is_buy, double price, double amount)
+    cdef c_build_depth_index(self)
+    cdef c_update_depth_index(self)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef double c_get_level_amount(self, bint is_bid, double price)
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
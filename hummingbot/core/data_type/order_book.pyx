@@ -4,10 +4,12 @@ import bisect
 import logging
 import time
 from typing import (
+    Any,
     Dict,
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
 )
 
@@ -26,7 +28,9 @@ from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
+    OrderBookDepthChangedEvent,
     OrderBookEvent,
+    OrderBookTopOfBookChangedEvent,
     OrderBookTradeEvent
 )
 
@@ -35,9 +39,61 @@ cimport numpy as np
 ob_logger = None
 NaN = float("nan")
 
+# Layout of the arrays filled by OrderBook.top_levels, it must match the OrderBookLevel struct
+ORDER_BOOK_LEVEL_DTYPE = np.dtype([("price", np.float64), ("amount", np.float64), ("update_id", np.int64)])
+
+
+cdef struct OrderBookLevel:
+    double price
+    double amount
+    int64_t update_id
+
+
+cdef inline size_t c_first_level_reaching(const vector[double] &cumulative_volumes, double volume):
+    """
+    Binary search of the first level where the cumulative volume is equal or larger than the requested volume.
+    Returns the number of levels if the volume is never reached.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = cumulative_volumes.size()
+        size_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if cumulative_volumes[middle] < volume:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef inline size_t c_levels_within_price(const vector[double] &prices, double price, bint is_buy):
+    """
+    Binary search of the number of levels with a price equal or better than the requested price. Ask prices are
+    sorted ascending and bid prices descending.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = prices.size()
+        size_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if (prices[middle] <= price) if is_buy else (prices[middle] >= price):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef inline bint c_price_changed(double previous_price, double price):
+    # NaN (empty side of the book) is considered equal to itself
+    return not (previous_price == price or (previous_price != previous_price and price != price))
+
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.TopOfBookChangedEvent.value
+    ORDER_BOOK_DEPTH_CHANGED_EVENT_TAG = OrderBookEvent.DepthChangedEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -50,11 +106,13 @@ cdef class OrderBook(PubSub):
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
+        self._version = 0
         self._best_bid = self._best_ask = float("NaN")
         self._last_trade_price = float("NaN")
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_outdated = True
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,6 +123,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -95,6 +155,13 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._version += 1
+        self._depth_index_outdated = True
+
+        self.c_trigger_book_change_events(previous_best_bid,
+                                          previous_best_ask,
+                                          update_id,
+                                          self.c_diffs_within_watched_depths(bids, asks))
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -104,6 +171,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
@@ -135,12 +204,124 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._version += 1
+        self._depth_index_outdated = True
+
+        self.c_trigger_book_change_events(previous_best_bid, previous_best_ask, update_id, True)
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef bint c_has_listeners(self, int64_t event_tag):
+        return self._events.count(event_tag) > 0
+
+    cdef bint c_diffs_within_watched_depths(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks):
+        """
+        Checks if any of the diffs is within the widest watched depth from the best prices. The volumes of the watched
+        depths can only change because of those diffs or a change of the best prices.
+        """
+        cdef:
+            double widest_depth_bps = 0
+            double bid_threshold
+            double ask_threshold
+        if self._watched_depths_bps.size() == 0 or not self.c_has_listeners(self.ORDER_BOOK_DEPTH_CHANGED_EVENT_TAG):
+            return False
+        for depth_bps in self._watched_depths_bps:
+            widest_depth_bps = max(widest_depth_bps, depth_bps)
+        bid_threshold = self._best_bid * (1 - widest_depth_bps / 10000)
+        ask_threshold = self._best_ask * (1 + widest_depth_bps / 10000)
+        for bid in bids:
+            if bid.getPrice() >= bid_threshold:
+                return True
+        for ask in asks:
+            if ask.getPrice() <= ask_threshold:
+                return True
+        return False
+
+    cdef c_trigger_book_change_events(self,
+                                      double previous_best_bid,
+                                      double previous_best_ask,
+                                      int64_t update_id,
+                                      bint depth_changed):
+        cdef:
+            bint top_of_book_changed = (c_price_changed(previous_best_bid, self._best_bid)
+                                        or c_price_changed(previous_best_ask, self._best_ask))
+            double bid_volume
+            double ask_volume
+            size_t i
+
+        if top_of_book_changed and self.c_has_listeners(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG):
+            self.c_trigger_event(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG,
+                                 OrderBookTopOfBookChangedEvent(update_id, self._best_bid, self._best_ask))
+
+        if (not (top_of_book_changed or depth_changed)
+                or self._watched_depths_bps.size() == 0
+                or not self.c_has_listeners(self.ORDER_BOOK_DEPTH_CHANGED_EVENT_TAG)):
+            return
+        for i in range(self._watched_depths_bps.size()):
+            bid_volume = self.c_get_volume_within_bps(True, self._watched_depths_bps[i])
+            ask_volume = self.c_get_volume_within_bps(False, self._watched_depths_bps[i])
+            if bid_volume != self._watched_depths_bid_volumes[i] or ask_volume != self._watched_depths_ask_volumes[i]:
+                self._watched_depths_bid_volumes[i] = bid_volume
+                self._watched_depths_ask_volumes[i] = ask_volume
+                self.c_trigger_event(self.ORDER_BOOK_DEPTH_CHANGED_EVENT_TAG,
+                                     OrderBookDepthChangedEvent(update_id,
+                                                                self._watched_depths_bps[i],
+                                                                bid_volume,
+                                                                ask_volume))
+
+    cdef double c_get_volume_within_bps(self, bint is_bid, double depth_bps):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            double threshold
+            double volume = 0
+        if is_bid:
+            threshold = self._best_bid * (1 - depth_bps / 10000)
+            while bid_iterator != self._bid_book.rend() and deref(bid_iterator).getPrice() >= threshold:
+                volume += deref(bid_iterator).getAmount()
+                inc(bid_iterator)
+        else:
+            threshold = self._best_ask * (1 + depth_bps / 10000)
+            while ask_iterator != self._ask_book.end() and deref(ask_iterator).getPrice() <= threshold:
+                volume += deref(ask_iterator).getAmount()
+                inc(ask_iterator)
+        return volume
+
+    def get_volume_within_bps(self, is_bid: bool, depth_bps: float) -> float:
+        """
+        Returns the amount of the levels of one side of the book with a price within depth_bps basis points of its
+        best price.
+        """
+        return self.c_get_volume_within_bps(is_bid, depth_bps)
+
+    def watch_depth_within_bps(self, depth_bps: float):
+        """
+        Enables the OrderBookEvent.DepthChangedEvent events for the depth within depth_bps basis points of the best
+        prices. An event is triggered when the bid or ask volume within that depth changes.
+        """
+        for watched_depth_bps in self._watched_depths_bps:
+            if watched_depth_bps == depth_bps:
+                return
+        self._watched_depths_bps.push_back(depth_bps)
+        self._watched_depths_bid_volumes.push_back(self.c_get_volume_within_bps(True, depth_bps))
+        self._watched_depths_ask_volumes.push_back(self.c_get_volume_within_bps(False, depth_bps))
+
+    def unwatch_depth_within_bps(self, depth_bps: float):
+        cdef size_t i
+        for i in range(self._watched_depths_bps.size()):
+            if self._watched_depths_bps[i] == depth_bps:
+                self._watched_depths_bps.erase(self._watched_depths_bps.begin() + i)
+                self._watched_depths_bid_volumes.erase(self._watched_depths_bid_volumes.begin() + i)
+                self._watched_depths_ask_volumes.erase(self._watched_depths_ask_volumes.begin() + i)
+                return
+
+    @property
+    def watched_depths_bps(self) -> List[float]:
+        return list(self._watched_depths_bps)
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -169,6 +350,13 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def version(self) -> int:
+        """
+        Number of snapshots and diffs applied, it changes every time the entries of the book change.
+        """
+        return self._version
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         bids_rows = list(self.bid_entries())
@@ -187,6 +375,50 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids: Sequence[Sequence[Any]], asks: Sequence[Sequence[Any]], update_id: int):
+        """
+        Applies diffs received as raw price levels, i.e. the ``[price, amount, ...]`` entries found in the content of
+        the exchange messages. Prices and amounts can be numbers or strings. The entries are converted straight into
+        the C++ structures, without building an intermediate list of OrderBookRow.
+        """
+        self.c_apply_raw_diffs(bids, asks, update_id)
+
+    cdef c_apply_raw_diffs(self, object bids, object asks, int64_t update_id):
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        cpp_bids.reserve(len(bids))
+        cpp_asks.reserve(len(asks))
+        for entry in bids:
+            cpp_bids.push_back(OrderBookEntry(float(entry[0]), float(entry[1]), update_id))
+        for entry in asks:
+            cpp_asks.push_back(OrderBookEntry(float(entry[0]), float(entry[1]), update_id))
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_diff_arrays(self,
+                          const double[:] bid_prices,
+                          const double[:] bid_amounts,
+                          const double[:] ask_prices,
+                          const double[:] ask_amounts,
+                          int64_t update_id):
+        """
+        Applies diffs received as contiguous price and amount arrays (any object supporting the buffer protocol with
+        double items, like numpy float64 arrays). No Python object is created per price level.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            Py_ssize_t i
+        if bid_prices.shape[0] != bid_amounts.shape[0] or ask_prices.shape[0] != ask_amounts.shape[0]:
+            raise ValueError("Prices and amounts arrays must have the same length.")
+        cpp_bids.reserve(bid_prices.shape[0])
+        cpp_asks.reserve(ask_prices.shape[0])
+        for i in range(bid_prices.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bid_prices[i], bid_amounts[i], update_id))
+        for i in range(ask_prices.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(ask_prices[i], ask_amounts[i], update_id))
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
     def apply_snapshot(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -280,6 +512,43 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
+    def top_levels(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the best n levels of each side as structured arrays with the ORDER_BOOK_LEVEL_DTYPE layout
+        (price, amount, update_id), best price first. The arrays are shorter than n if the book has less levels.
+        """
+        bids = np.empty(n, dtype=ORDER_BOOK_LEVEL_DTYPE)
+        asks = np.empty(n, dtype=ORDER_BOOK_LEVEL_DTYPE)
+        bids_count, asks_count = self.fill_top_levels(bids, asks)
+        return bids[:bids_count], asks[:asks_count]
+
+    def fill_top_levels(self, OrderBookLevel[:] bids_buffer, OrderBookLevel[:] asks_buffer) -> Tuple[int, int]:
+        """
+        Writes the best levels of each side into preallocated structured arrays with the ORDER_BOOK_LEVEL_DTYPE layout,
+        as many levels as the buffer length. Nothing is allocated, so the same buffers can be reused in every call.
+
+        :return: the number of bid and ask levels written
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            Py_ssize_t bids_count = 0
+            Py_ssize_t asks_count = 0
+
+        while bids_count < bids_buffer.shape[0] and bid_it != self._bid_book.rend():
+            bids_buffer[bids_count].price = deref(bid_it).getPrice()
+            bids_buffer[bids_count].amount = deref(bid_it).getAmount()
+            bids_buffer[bids_count].update_id = deref(bid_it).getUpdateId()
+            bids_count += 1
+            inc(bid_it)
+        while asks_count < asks_buffer.shape[0] and ask_it != self._ask_book.end():
+            asks_buffer[asks_count].price = deref(ask_it).getPrice()
+            asks_buffer[asks_count].amount = deref(ask_it).getAmount()
+            asks_buffer[asks_count].update_id = deref(ask_it).getUpdateId()
+            asks_count += 1
+            inc(ask_it)
+        return bids_count, asks_count
+
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
         amount_left = amount
         retval = []
@@ -318,142 +587,207 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef double c_get_level_amount(self, bint is_bid, double price):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = deref(book).find(OrderBookEntry(price, 0, 0))
+        if it == deref(book).end():
+            return 0
+        return deref(it).getAmount()
+
+    def get_level_amount(self, is_bid: bool, price: float) -> float:
+        """
+        Returns the amount of the bid or ask level at exactly the price, 0 if the side has no level at that price.
+        """
+        return self.c_get_level_amount(is_bid, price)
+
+    cdef c_clear_depth_index(self):
+        self._bid_depth_prices.clear()
+        self._bid_depth_base_volumes.clear()
+        self._bid_depth_quote_volumes.clear()
+        self._ask_depth_prices.clear()
+        self._ask_depth_base_volumes.clear()
+        self._ask_depth_quote_volumes.clear()
+
+    cdef c_add_depth_index_level(self, bint is_buy, double price, double amount):
+        cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *base_volumes = (
+                ref(self._ask_depth_base_volumes) if is_buy else ref(self._bid_depth_base_volumes))
+            vector[double] *quote_volumes = (
+                ref(self._ask_depth_quote_volumes) if is_buy else ref(self._bid_depth_quote_volumes))
+            double cumulative_base_volume = 0
+            double cumulative_quote_volume = 0
+        if deref(prices).size() > 0:
+            cumulative_base_volume = deref(base_volumes).back()
+            cumulative_quote_volume = deref(quote_volumes).back()
+        deref(prices).push_back(price)
+        deref(base_volumes).push_back(cumulative_base_volume + amount)
+        deref(quote_volumes).push_back(cumulative_quote_volume + amount * price)
+
+    cdef c_build_depth_index(self):
+        """
+        Rebuilds the cumulative base and quote volumes of each level, starting from the best price of each side.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+
+        self.c_clear_depth_index()
+        self._bid_depth_prices.reserve(self._bid_book.size())
+        self._bid_depth_base_volumes.reserve(self._bid_book.size())
+        self._bid_depth_quote_volumes.reserve(self._bid_book.size())
+        self._ask_depth_prices.reserve(self._ask_book.size())
+        self._ask_depth_base_volumes.reserve(self._ask_book.size())
+        self._ask_depth_quote_volumes.reserve(self._ask_book.size())
+        while bid_it != self._bid_book.rend():
+            entry = deref(bid_it)
+            self.c_add_depth_index_level(False, entry.getPrice(), entry.getAmount())
+            inc(bid_it)
+        while ask_it != self._ask_book.end():
+            entry = deref(ask_it)
+            self.c_add_depth_index_level(True, entry.getPrice(), entry.getAmount())
+            inc(ask_it)
+
+    cdef c_update_depth_index(self):
+        # The index is only rebuilt when queried after the order book changed
+        if self._depth_index_outdated:
+            self.c_build_depth_index()
+            self._depth_index_outdated = False
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *base_volumes
             double cumulative_volume = 0
             double result_price = NaN
+            size_t level
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_update_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        base_volumes = ref(self._ask_depth_base_volumes) if is_buy else ref(self._bid_depth_base_volumes)
+
+        level = c_first_level_reaching(deref(base_volumes), volume)
+        if level < deref(prices).size():
+            result_price = deref(prices)[level]
+            cumulative_volume = deref(base_volumes)[level]
+        elif deref(prices).size() > 0:
+            cumulative_volume = deref(base_volumes).back()
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *base_volumes
+            vector[double] *quote_volumes
             double total_cost = 0
             double total_volume = 0
+            double incremental_amount
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            size_t level
+
+        self.c_update_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        base_volumes = ref(self._ask_depth_base_volumes) if is_buy else ref(self._bid_depth_base_volumes)
+        quote_volumes = ref(self._ask_depth_quote_volumes) if is_buy else ref(self._bid_depth_quote_volumes)
+
+        level = c_first_level_reaching(deref(base_volumes), volume)
+        if level < deref(prices).size():
+            if level > 0:
+                total_cost = deref(quote_volumes)[level - 1]
+                total_volume = deref(base_volumes)[level - 1]
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * deref(prices)[level]
+            total_volume += incremental_amount
+            result_vwap = total_cost / total_volume
+        elif deref(prices).size() > 0:
+            total_volume = deref(base_volumes).back()
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            vector[double] *prices
+            vector[double] *quote_volumes
             double cumulative_volume = 0
             double result_price = NaN
+            size_t level
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_update_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        quote_volumes = ref(self._ask_depth_quote_volumes) if is_buy else ref(self._bid_depth_quote_volumes)
+
+        level = c_first_level_reaching(deref(quote_volumes), quote_volume)
+        if level < deref(prices).size():
+            result_price = deref(prices)[level]
+            cumulative_volume = deref(quote_volumes)[level]
+        elif deref(prices).size() > 0:
+            cumulative_volume = deref(quote_volumes).back()
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            vector[double] *prices
+            vector[double] *base_volumes
+            vector[double] *quote_volumes
             double cumulative_volume = 0
             double cumulative_base_amount = 0
-            double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+            size_t level
+
+        self.c_update_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        base_volumes = ref(self._ask_depth_base_volumes) if is_buy else ref(self._bid_depth_base_volumes)
+        quote_volumes = ref(self._ask_depth_quote_volumes) if is_buy else ref(self._bid_depth_quote_volumes)
+
+        level = c_first_level_reaching(deref(base_volumes), base_amount)
+        if level < deref(prices).size():
+            if level > 0:
+                cumulative_volume = deref(quote_volumes)[level - 1]
+                cumulative_base_amount = deref(base_volumes)[level - 1]
+            cumulative_volume += (base_amount - cumulative_base_amount) * deref(prices)[level]
+        elif deref(prices).size() > 0:
+            cumulative_volume = deref(quote_volumes).back()
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices
+            vector[double] *base_volumes
             double cumulative_volume = 0
             double result_price = NaN
+            size_t levels
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        self.c_update_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        base_volumes = ref(self._ask_depth_base_volumes) if is_buy else ref(self._bid_depth_base_volumes)
+
+        levels = c_levels_within_price(deref(prices), price, is_buy)
+        if levels > 0:
+            cumulative_volume = deref(base_volumes)[levels - 1]
+            result_price = deref(prices)[levels - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices
+            vector[double] *quote_volumes
             double cumulative_volume = 0
             double result_price = NaN
+            size_t levels
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        self.c_update_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        quote_volumes = ref(self._ask_depth_quote_volumes) if is_buy else ref(self._bid_depth_quote_volumes)
+
+        levels = c_levels_within_price(deref(prices), price, is_buy)
+        if levels > 0:
+            cumulative_volume = deref(quote_volumes)[levels - 1]
+            result_price = deref(prices)[levels - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -475,9 +809,35 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_prices_for_volumes(self, is_buy: bool, volumes: Sequence[float]) -> List[OrderBookQueryResult]:
+        """
+        Batch version of get_price_for_volume, the depth index is built at most once for all the queries.
+        """
+        return [self.c_get_price_for_volume(is_buy, volume) for volume in volumes]
+
+    def get_vwaps_for_volumes(self, is_buy: bool, volumes: Sequence[float]) -> List[OrderBookQueryResult]:
+        """
+        Batch version of get_vwap_for_volume, the depth index is built at most once for all the queries.
+        """
+        return [self.c_get_vwap_for_volume(is_buy, volume) for volume in volumes]
+
+    def get_volumes_for_prices(self, is_buy: bool, prices: Sequence[float]) -> List[OrderBookQueryResult]:
+        """
+        Batch version of get_volume_for_price, the depth index is built at most once for all the queries.
+        """
+        return [self.c_get_volume_for_price(is_buy, price) for price in prices]
+
+    def get_quote_volumes_for_base_amounts(self,
+                                           is_buy: bool,
+                                           base_amounts: Sequence[float]) -> List[OrderBookQueryResult]:
+        """
+        Batch version of get_quote_volume_for_base_amount, the depth index is built at most once for all the queries.
+        """
+        return [self.c_get_quote_volume_for_base_amount(is_buy, base_amount) for base_amount in base_amounts]
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
         self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_raw_diffs(diff.raw_bids, diff.raw_asks, diff.update_id)
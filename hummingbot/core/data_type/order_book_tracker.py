@@ -10,6 +10,7 @@ import pandas as pd
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -23,6 +24,8 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 10
+    SNAPSHOT_RETRY_INTERVAL: float = 5.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +34,35 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 concurrent_init: bool = False,
+                 max_concurrent_snapshot_requests: Optional[int] = None,
+                 coalesce_diffs: bool = False):
+        """
+        :param data_source: the data source used to fetch snapshots and listen to order book updates
+        :param trading_pairs: the trading pairs to track
+        :param domain: the exchange domain, if any
+        :param concurrent_init: if True the initial snapshots are requested in parallel instead of one by one. The
+            request rate is then bounded by the throttler used by the data source and not by a fixed delay
+        :param max_concurrent_snapshot_requests: maximum number of snapshot requests in flight at the same time when
+            using the concurrent initialization
+        :param coalesce_diffs: if True all the diff messages pending for an order book are merged into a single net
+            change per price level and applied at once, instead of applying them one by one
+        """
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
+        self._concurrent_init: bool = concurrent_init
+        self._max_concurrent_snapshot_requests: int = (
+            max_concurrent_snapshot_requests or self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+        self._coalesce_diffs: bool = coalesce_diffs
+        self._diff_messages_received: Dict[str, int] = defaultdict(int)
+        self._diff_updates_applied: Dict[str, int] = defaultdict(int)
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -68,6 +95,28 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order book has already been initialized and is being tracked
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    @property
+    def diff_messages_received(self) -> Dict[str, int]:
+        """
+        Number of diff messages processed for each trading pair
+        """
+        return self._diff_messages_received
+
+    @property
+    def diff_updates_applied(self) -> Dict[str, int]:
+        """
+        Number of updates applied to each order book. When diffs are coalesced several diff messages are merged into
+        a single update, so the difference with `diff_messages_received` is the number of merged messages
+        """
+        return self._diff_updates_applied
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -138,10 +187,24 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for ready_event in self._order_book_ready_events.values():
+            ready_event.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        """
+        Checks if the order book for a single trading pair has been initialized, even if the tracker is not ready yet
+
+        :param trading_pair: the trading pair to check
+        :return: True if the order book is initialized and being tracked
+        """
+        return trading_pair in self._order_book_ready_events and self._order_book_ready_events[trading_pair].is_set()
+
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_book_ready_events[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -176,15 +239,56 @@ class OrderBookTracker:
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        if self._concurrent_init:
+            await self._init_order_books_concurrently()
+        else:
+            for index, trading_pair in enumerate(self._trading_pairs):
+                order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                self._start_tracking_order_book(trading_pair=trading_pair, order_book=order_book)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index + 1}/{len(self._trading_pairs)} completed.")
+                await self._sleep(delay=1)
         self._order_books_initialized.set()
 
+    async def _init_order_books_concurrently(self):
+        """
+        Requests all the initial snapshots in parallel. There is no fixed delay between requests, the rate is
+        controlled by the throttler in the data source. Each order book starts being tracked as soon as its own
+        snapshot is received.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrent_snapshot_requests)
+        initialized_count = 0
+
+        async def init_single_order_book(trading_pair: str):
+            nonlocal initialized_count
+            while True:
+                try:
+                    async with semaphore:
+                        order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(
+                        f"Unexpected error initializing order book for {trading_pair}.",
+                        exc_info=True,
+                        app_warning_msg=f"Unexpected error initializing order book for {trading_pair}. "
+                                        f"Retrying after {self.SNAPSHOT_RETRY_INTERVAL} seconds."
+                    )
+                    await self._sleep(delay=self.SNAPSHOT_RETRY_INTERVAL)
+            self._start_tracking_order_book(trading_pair=trading_pair, order_book=order_book)
+            initialized_count += 1
+            self.logger().info(f"Initialized order book for {trading_pair}. "
+                               f"{initialized_count}/{len(self._trading_pairs)} completed.")
+
+        await asyncio.gather(*[init_single_order_book(trading_pair) for trading_pair in self._trading_pairs])
+
+    def _start_tracking_order_book(self, trading_pair: str, order_book: OrderBook):
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_ready_events[trading_pair].set()
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -260,21 +364,34 @@ class OrderBookTracker:
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
                 # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                if pending_message is not None:
+                    # Non diff message found while coalescing the previous diffs
+                    message, pending_message = pending_message, None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    if self._coalesce_diffs and len(saved_messages) == 0 and not message_queue.empty():
+                        diff_messages, pending_message = self._drain_diff_messages(message, message_queue)
+                        bids, asks, update_id = self._coalesce_diff_messages(diff_messages)
+                        order_book.apply_diffs(bids, asks, update_id)
+                        past_diffs_window.extend(diff_messages)
+                    else:
+                        diff_messages = [message]
+                        order_book.apply_raw_diffs(message.raw_bids, message.raw_asks, message.update_id)
+                        past_diffs_window.append(message)
+                    diff_messages_accepted += len(diff_messages)
+                    self._diff_messages_received[trading_pair] += len(diff_messages)
+                    self._diff_updates_applied[trading_pair] += 1
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -295,6 +412,45 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _drain_diff_messages(
+            first_message: OrderBookMessage,
+            message_queue: asyncio.Queue) -> Tuple[List[OrderBookMessage], Optional[OrderBookMessage]]:
+        """
+        Takes all the diff messages already available in the queue without waiting.
+        The draining stops at the first message that is not a diff, which is returned to be processed afterwards.
+        """
+        diff_messages: List[OrderBookMessage] = [first_message]
+        non_diff_message: Optional[OrderBookMessage] = None
+        while not message_queue.empty():
+            message: OrderBookMessage = message_queue.get_nowait()
+            if message.type is not OrderBookMessageType.DIFF:
+                non_diff_message = message
+                break
+            diff_messages.append(message)
+        return diff_messages, non_diff_message
+
+    @staticmethod
+    def _coalesce_diff_messages(
+            diff_messages: List[OrderBookMessage]) -> Tuple[List[OrderBookRow], List[OrderBookRow], int]:
+        """
+        Merges a sequence of diff messages into a single net change per price level. When a price level is present
+        in more than one message the one with the highest update id wins.
+        """
+        bids: Dict[float, OrderBookRow] = {}
+        asks: Dict[float, OrderBookRow] = {}
+        last_update_id: int = 0
+        for message in diff_messages:
+            update_id = message.update_id
+            last_update_id = max(last_update_id, update_id)
+            for levels, merged_levels in ((message.raw_bids, bids), (message.raw_asks, asks)):
+                for level in levels:
+                    price = float(level[0])
+                    current_level = merged_levels.get(price)
+                    if current_level is None or current_level.update_id <= update_id:
+                        merged_levels[price] = OrderBookRow(price, float(level[1]), update_id)
+        return list(bids.values()), list(asks.values()), last_update_id
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
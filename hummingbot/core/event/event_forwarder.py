@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 
-from typing import Callable
+import asyncio
+import time
+from typing import Callable, Optional
 
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.pubsub import PubSub
@@ -22,3 +24,57 @@ class SourceInfoEventForwarder(EventListener):
 
     def __call__(self, arg: any):
         self._to_function(self.current_event_tag, self.current_event_caller, arg)
+
+
+class ThrottledEventForwarder(EventListener):
+    """
+    Forwards the events to a function at most once every min_interval seconds.
+
+    The events received before the interval ends are coalesced, only the last one is forwarded when it ends. That
+    happens from the event loop if there is one running, or with the next event received otherwise.
+    """
+
+    def __init__(self, to_function: Callable[[any], None], min_interval: float):
+        super().__init__()
+        self._to_function: Callable[[any], None] = to_function
+        self._min_interval = min_interval
+        self._last_forward_time = float("-inf")
+        self._pending_event: any = None
+        self._has_pending_event = False
+        self._pending_event_timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def has_pending_event(self) -> bool:
+        return self._has_pending_event
+
+    def __call__(self, arg: any):
+        now = self._time()
+        elapsed = now - self._last_forward_time
+        if elapsed >= self._min_interval:
+            self._forward(arg, now)
+            return
+        self._pending_event = arg
+        self._has_pending_event = True
+        if self._pending_event_timer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._pending_event_timer = loop.call_later(self._min_interval - elapsed, self._forward_pending_event)
+
+    def _time(self) -> float:
+        return time.monotonic()
+
+    def _forward_pending_event(self):
+        self._pending_event_timer = None
+        if self._has_pending_event:
+            self._forward(self._pending_event, self._time())
+
+    def _forward(self, arg: any, now: float):
+        if self._pending_event_timer is not None:
+            self._pending_event_timer.cancel()
+            self._pending_event_timer = None
+        self._pending_event = None
+        self._has_pending_event = False
+        self._last_forward_time = now
+        self._to_function(arg)
@@ -37,6 +37,8 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    TopOfBookChangedEvent = 902
+    DepthChangedEvent = 903
     OrderBookDataSourceUpdateEvent = 904
 
 
@@ -156,6 +158,19 @@ class OrderBookTradeEvent(NamedTuple):
     is_taker: bool = True  # CEXs deliver trade events from the taker's perspective
 
 
+class OrderBookTopOfBookChangedEvent(NamedTuple):
+    update_id: int
+    best_bid: float
+    best_ask: float
+
+
+class OrderBookDepthChangedEvent(NamedTuple):
+    update_id: int
+    depth_bps: float  # the volumes are summed over the levels within depth_bps of the best price of each side
+    bid_volume: float
+    ask_volume: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -20,7 +20,7 @@ from hummingbot.core.rate_oracle.sources.hyperliquid_rate_source import Hyperliq
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.rate_oracle.sources.tegro_rate_source import TegroRateSource
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import ConversionRateGraph, find_rate
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -64,7 +64,7 @@ class RateOracle(NetworkBase):
     def __init__(self, source: Optional[RateSourceBase] = None, quote_token: Optional[str] = None):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
-        self._prices: Dict[str, Decimal] = {}
+        self._prices = {}
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -107,6 +107,17 @@ class RateOracle(NetworkBase):
             self._quote_token = new_token
             self._prices = {}
 
+    @property
+    def _prices(self) -> ConversionRateGraph:
+        """
+        The stored prices, indexed to find the conversion rates between any pair of tokens
+        """
+        return self._rates_graph
+
+    @_prices.setter
+    def _prices(self, prices: Dict[str, Decimal]):
+        self._rates_graph = ConversionRateGraph(prices)
+
     @property
     def prices(self) -> Dict[str, Decimal]:
         """
@@ -1,5 +1,7 @@
+import itertools
+from collections import defaultdict
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
@@ -16,6 +18,8 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
+    if isinstance(prices, ConversionRateGraph):
+        return prices.find_rate(pair)
     if pair in prices:
         return prices[pair]
     base, quote = split_hb_trading_pair(trading_pair=pair)
@@ -35,3 +39,160 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
         common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
         if common_denom_pair in prices:
             return proxy_price / prices[common_denom_pair]
+
+
+class ConversionRateGraph(dict):
+    """
+    Dictionary of trading pair prices that also indexes them as a graph of tokens, to find conversion rates without
+    scanning all the prices.
+
+    Each pair adds an edge between its base and quote tokens (used in both directions). The index is updated as prices
+    are added or removed, and a rate not directly priced is resolved with the shortest route of conversions (up to
+    MAX_ROUTE_HOPS), preferring the most liquid intermediate tokens (the ones used as quote by more pairs). The resolved
+    rates are cached until the prices change.
+    """
+    MAX_ROUTE_HOPS = 3
+
+    def __init__(self, prices: Optional[Mapping[str, Decimal]] = None):
+        super().__init__()
+        # Token -> neighbor token -> (pair, True if the pair is quoted in the neighbor token)
+        self._edges: Dict[str, Dict[str, Tuple[str, bool]]] = defaultdict(dict)
+        self._quote_pairs_count: Dict[str, int] = defaultdict(int)
+        self._sorted_neighbors: Dict[str, List[str]] = {}
+        self._rates: Dict[str, Optional[Decimal]] = {}
+        if prices is not None:
+            self.update(prices)
+
+    def __setitem__(self, pair: str, price: Decimal):
+        if pair not in self:
+            self._add_edge(pair)
+        super().__setitem__(pair, price)
+        self._rates.clear()
+
+    def __delitem__(self, pair: str):
+        super().__delitem__(pair)
+        self._remove_edge(pair)
+        self._rates.clear()
+
+    def update(self, prices: Optional[Mapping[str, Decimal]] = None, **kwargs):
+        for pair, price in itertools.chain((prices or {}).items(), kwargs.items()):
+            if pair not in self:
+                self._add_edge(pair)
+            super().__setitem__(pair, price)
+        self._rates.clear()
+
+    def pop(self, pair: str, *args):
+        if pair in self:
+            self._remove_edge(pair)
+            self._rates.clear()
+        return super().pop(pair, *args)
+
+    def popitem(self):
+        pair, price = super().popitem()
+        self._remove_edge(pair)
+        self._rates.clear()
+        return pair, price
+
+    def setdefault(self, pair: str, default: Optional[Decimal] = None):
+        if pair not in self:
+            self[pair] = default
+        return self[pair]
+
+    def clear(self):
+        super().clear()
+        self._edges.clear()
+        self._quote_pairs_count.clear()
+        self._sorted_neighbors.clear()
+        self._rates.clear()
+
+    def find_rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Same as the find_rate function, but resolved in O(degree) for routes with one intermediate token, supporting
+        longer routes, and cached
+        """
+        if pair in self._rates:
+            return self._rates[pair]
+        if pair in self:
+            return self[pair]
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        rate = self._route_rate(unwrap_token_symbol(base), unwrap_token_symbol(quote))
+        self._rates[pair] = rate
+        return rate
+
+    def _add_edge(self, pair: str):
+        try:
+            base, quote = split_hb_trading_pair(trading_pair=pair)
+        except ValueError:
+            return
+        # A directly priced pair is preferred over the inverse of the opposite one
+        if self._edges[base].get(quote, (None, True))[1]:
+            self._edges[base][quote] = (pair, False)
+        if quote not in self._edges or base not in self._edges[quote]:
+            self._edges[quote][base] = (pair, True)
+        self._quote_pairs_count[quote] += 1
+        self._sorted_neighbors.clear()
+
+    def _remove_edge(self, pair: str):
+        try:
+            base, quote = split_hb_trading_pair(trading_pair=pair)
+        except ValueError:
+            return
+        reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
+        for token, neighbor, inverted in ((base, quote, False), (quote, base, True)):
+            if self._edges[token].get(neighbor) == (pair, inverted):
+                if reverse_pair in self:
+                    self._edges[token][neighbor] = (reverse_pair, not inverted)
+                else:
+                    del self._edges[token][neighbor]
+        self._quote_pairs_count[quote] -= 1
+        self._sorted_neighbors.clear()
+
+    def _neighbors(self, token: str) -> List[str]:
+        neighbors = self._sorted_neighbors.get(token)
+        if neighbors is None:
+            neighbors = sorted(self._edges.get(token, {}), key=lambda neighbor: -self._quote_pairs_count[neighbor])
+            self._sorted_neighbors[token] = neighbors
+        return neighbors
+
+    def _route_rate(self, base: str, quote: str) -> Optional[Decimal]:
+        if base == quote:
+            return Decimal("1")
+        if base not in self._edges or quote not in self._edges:
+            return None
+        previous_tokens: Dict[str, Optional[str]] = {base: None}
+        level: List[str] = [base]
+        for hop in range(self.MAX_ROUTE_HOPS):
+            for token in level:
+                if quote in self._edges[token]:
+                    previous_tokens[quote] = token
+                    return self._path_rate(self._path(previous_tokens, quote))
+            if hop == self.MAX_ROUTE_HOPS - 1:
+                break
+            next_level = []
+            for token in level:
+                for neighbor in self._neighbors(token):
+                    if neighbor not in previous_tokens:
+                        previous_tokens[neighbor] = token
+                        next_level.append(neighbor)
+            level = next_level
+        return None
+
+    @staticmethod
+    def _path(previous_tokens: Dict[str, Optional[str]], token: str) -> Iterable[str]:
+        path = []
+        while token is not None:
+            path.append(token)
+            token = previous_tokens[token]
+        return reversed(path)
+
+    def _path_rate(self, path: Iterable[str]) -> Decimal:
+        # The prices are multiplied and divided separately so single conversions give the exact quotient
+        numerator = denominator = Decimal("1")
+        tokens = list(path)
+        for token, next_token in zip(tokens, tokens[1:]):
+            pair, inverted = self._edges[token][next_token]
+            if inverted:
+                denominator *= self[pair]
+            else:
+                numerator *= self[pair]
+        return numerator / denominator
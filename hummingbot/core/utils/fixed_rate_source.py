@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import ConversionRateGraph, find_rate
 
 
 class FixedRateSource:
@@ -8,7 +8,7 @@ class FixedRateSource:
     def __init__(self):
         super().__init__()
 
-        self._known_rates: dict = {}
+        self._known_rates: ConversionRateGraph = ConversionRateGraph()
 
     def __str__(self):
         return "fixed rates"
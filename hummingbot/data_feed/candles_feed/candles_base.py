@@ -1,8 +1,7 @@
 import asyncio
 import os
 import time
-from collections import deque
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -15,13 +14,15 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_indicators import CandlesIndicators, IncrementalIndicator
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a ring buffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -45,13 +46,19 @@ class CandlesBase(NetworkBase):
     })
     columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
                "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+    HISTORICAL_CANDLES_MAX_CONCURRENT_REQUESTS = 5
 
     def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesRingBuffer(maxlen=max_records, columns=len(self.columns))
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_version: int = -1
+        self._indicators = CandlesIndicators(candles=self._candles)
+        self._indicators_df_cache: Optional[pd.DataFrame] = None
+        self._indicators_df_key: Tuple[int, int] = (-1, 0)
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -91,7 +98,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -141,9 +148,43 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+        The DataFrame is cached and only rebuilt when a candle was added or updated since the previous call. A copy is
+        returned so callers can add columns (e.g. with pandas_ta append=True) without altering the cached one.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        if self._candles_df_version != self._candles.version:
+            self._candles_df_cache = pd.DataFrame(self._candles.values, columns=self.columns, dtype=float)
+            self._candles_df_version = self._candles.version
+        return self._candles_df_cache.copy()
+
+    def add_indicator(self, indicator: IncrementalIndicator) -> IncrementalIndicator:
+        """
+        Registers an indicator computed incrementally over the candles of the feed: each new or updated candle only
+        updates the indicator state, instead of recomputing it over the whole history.
+        If an indicator with the same name is already registered it is returned instead, so several controllers can
+        request the same indicator.
+        """
+        return self._indicators.add(indicator)
+
+    @property
+    def indicators_df(self) -> pd.DataFrame:
+        """
+        This property returns the candles as a Pandas DataFrame, with a column for each value of the registered
+        indicators (named as the pandas_ta ones). Like candles_df, it is cached and a copy is returned.
+        """
+        key = (self._candles.version, len(self._indicators.indicators))
+        if self._indicators_df_key != key:
+            self._indicators_df_cache = pd.DataFrame(np.hstack([self._candles.values, self._indicators.values()]),
+                                                     columns=self.columns + self._indicators.columns, dtype=float)
+            self._indicators_df_key = key
+        return self._indicators_df_cache.copy()
+
+    @property
+    def latest_indicators_values(self) -> Dict[str, float]:
+        """
+        Returns the values of the registered indicators for the last candle.
+        """
+        return self._indicators.latest_values()
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -162,11 +203,11 @@ class CandlesBase(NetworkBase):
         self._candles.extendleft(df.values.tolist())
 
     async def get_historical_candles(self, config: HistoricalCandlesConfig):
-        candles_df = pd.DataFrame()
         try:
             await self.initialize_exchange_data()
             current_end_time = self._round_timestamp_to_interval_multiple(config.end_time)
             current_start_time = self._round_timestamp_to_interval_multiple(config.start_time)
+            fetched_candles: List[np.ndarray] = []
             while current_end_time >= current_start_time:
                 missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
                 candles = await self.fetch_candles(start_time=current_start_time,
@@ -176,14 +217,59 @@ class CandlesBase(NetworkBase):
                     break
                 candles = candles[candles[:, 0] <= current_end_time]
                 current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
-                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                candles_df = pd.concat([fetched_candles_df, candles_df])
-                candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-                candles_df.reset_index(drop=True, inplace=True)
-                self.check_candles_sorted_and_equidistant(candles_df.values)
-            candles_df = candles_df[
-                (candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
-            return candles_df
+                fetched_candles.append(candles)
+            return self._assemble_historical_candles(fetched_candles, config)
+        except ValueError as e:
+            self.logger().error(f"Error fetching historical candles: {str(e)}")
+            raise e
+        except Exception as e:
+            self.logger().exception(f"Error fetching historical candles: {str(e)}")
+            raise e
+
+    async def get_historical_candles_concurrently(
+            self,
+            config: HistoricalCandlesConfig,
+            max_concurrent_requests: Optional[int] = None,
+            progress_callback: Optional[Callable[[int, int], None]] = None) -> pd.DataFrame:
+        """
+        Downloads the historical candles splitting the requested period in time windows of the maximum size allowed
+        per REST request. The windows are planned up front and fetched concurrently, the request rate being
+        controlled by the throttler with the feed rate limits. The result is assembled once all windows are fetched.
+
+        :param config: the historical candles configuration
+        :param max_concurrent_requests: maximum number of requests in flight at the same time
+        :param progress_callback: function called with the number of windows fetched and the total number of windows
+            each time a window is fetched
+        :return: a DataFrame with the candles between the start and end time of the configuration
+        """
+        try:
+            await self.initialize_exchange_data()
+            windows = self._historical_candles_windows(
+                start_time=self._round_timestamp_to_interval_multiple(config.start_time),
+                end_time=self._round_timestamp_to_interval_multiple(config.end_time))
+            semaphore = asyncio.Semaphore(max_concurrent_requests or self.HISTORICAL_CANDLES_MAX_CONCURRENT_REQUESTS)
+            fetched_windows = 0
+
+            async def fetch_window(window_end_time: int, limit: int) -> np.ndarray:
+                nonlocal fetched_windows
+                async with semaphore:
+                    candles = await self.fetch_candles(end_time=window_end_time, limit=limit)
+                fetched_windows += 1
+                self.logger().debug(f"Historical candles for {self._trading_pair} {self.interval}: "
+                                    f"{fetched_windows}/{len(windows)} windows fetched.")
+                if progress_callback is not None:
+                    progress_callback(fetched_windows, len(windows))
+                return candles
+
+            tasks = [asyncio.ensure_future(fetch_window(window_end_time, limit))
+                     for window_end_time, limit in windows]
+            try:
+                fetched_candles = await asyncio.gather(*tasks)
+            except Exception:
+                for task in tasks:
+                    task.cancel()
+                raise
+            return self._assemble_historical_candles(fetched_candles, config)
         except ValueError as e:
             self.logger().error(f"Error fetching historical candles: {str(e)}")
             raise e
@@ -191,6 +277,36 @@ class CandlesBase(NetworkBase):
             self.logger().exception(f"Error fetching historical candles: {str(e)}")
             raise e
 
+    def _historical_candles_windows(self, start_time: int, end_time: int) -> List[Tuple[int, int]]:
+        """
+        Splits the period in windows covering at most the maximum number of candles per REST request.
+        :return: list of (window end time, number of candles) tuples, most recent window first
+        """
+        max_records = self.candles_max_result_per_rest_request
+        windows = []
+        window_end_time = end_time
+        while window_end_time >= start_time:
+            records = min(max_records, int((window_end_time - start_time) / self.interval_in_seconds) + 1)
+            windows.append((window_end_time, records))
+            window_end_time -= records * self.interval_in_seconds
+        return windows
+
+    def _assemble_historical_candles(self, fetched_candles: List[np.ndarray], config: HistoricalCandlesConfig):
+        """
+        Merges all the fetched candles at once: sorted by timestamp, without duplicates and limited to the configured
+        period.
+        """
+        fetched_candles = [candles for candles in fetched_candles if len(candles) > 0]
+        if len(fetched_candles) == 0:
+            return pd.DataFrame(columns=self.columns)
+        candles = np.concatenate(fetched_candles)
+        # np.unique sorts the timestamps and keeps the first occurrence of each one
+        _, unique_indexes = np.unique(candles[:, 0], return_index=True)
+        candles = candles[unique_indexes]
+        self.check_candles_sorted_and_equidistant(candles)
+        candles = candles[(candles[:, 0] <= config.end_time) & (candles[:, 0] >= config.start_time)]
+        return pd.DataFrame(candles, columns=self.columns)
+
     def check_candles_sorted_and_equidistant(self, candles: np.ndarray):
         """
         This method checks if the given candles are sorted by timestamp in ascending order and equidistant.
@@ -320,7 +436,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles buffer until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
@@ -0,0 +1,530 @@
+import math
+import sys
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+# Positions of the candle fields used by the indicators, in the CandlesBase columns order
+HIGH = 2
+LOW = 3
+CLOSE = 4
+INDICATORS_INPUT_COLUMNS = ["timestamp", "open", "high", "low", "close"]
+
+
+class _EMA:
+    """
+    Exponential moving average seeded with the simple average of the first `length` values, as pandas_ta does.
+    """
+    __slots__ = ("length", "alpha", "_state", "_previous_state")
+
+    def __init__(self, length: int):
+        self.length = length
+        self.alpha = 2 / (length + 1)
+        # (count, sum of the first values, average)
+        self._state: Tuple[int, float, float] = (0, 0.0, math.nan)
+        self._previous_state = self._state
+
+    @property
+    def value(self) -> float:
+        return self._state[2]
+
+    def push(self, x: float):
+        self._previous_state = self._state
+        self._state = self._next_state(self._state, x)
+
+    def replace_last(self, x: float):
+        self._state = self._next_state(self._previous_state, x)
+
+    def _next_state(self, state: Tuple[int, float, float], x: float) -> Tuple[int, float, float]:
+        count, seed_sum, average = state
+        count += 1
+        if count < self.length:
+            return count, seed_sum + x, math.nan
+        if count == self.length:
+            return count, seed_sum + x, (seed_sum + x) / self.length
+        return count, seed_sum, self.alpha * x + (1 - self.alpha) * average
+
+
+class _RMA:
+    """
+    Wilder's moving average, computed like pandas ewm(alpha=1 / length, min_periods=length) (adjusted weights).
+    """
+    __slots__ = ("length", "decay", "_state", "_previous_state")
+
+    def __init__(self, length: int):
+        self.length = length
+        self.decay = 1 - 1 / length
+        # (count, weighted sum, sum of weights)
+        self._state: Tuple[int, float, float] = (0, 0.0, 0.0)
+        self._previous_state = self._state
+
+    @property
+    def value(self) -> float:
+        count, weighted_sum, weights = self._state
+        return weighted_sum / weights if count >= self.length else math.nan
+
+    def push(self, x: float):
+        self._previous_state = self._state
+        self._state = self._next_state(self._state, x)
+
+    def replace_last(self, x: float):
+        self._state = self._next_state(self._previous_state, x)
+
+    def _next_state(self, state: Tuple[int, float, float], x: float) -> Tuple[int, float, float]:
+        count, weighted_sum, weights = state
+        return count + 1, x + self.decay * weighted_sum, 1 + self.decay * weights
+
+
+class _RollingMoments:
+    """
+    Mean and population variance of the last `length` values.
+    """
+    __slots__ = ("length", "_values", "_mean", "_m2", "_updates")
+
+    def __init__(self, length: int):
+        self.length = length
+        self._values: Deque[float] = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._values) == self.length
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.is_full else math.nan
+
+    @property
+    def variance(self) -> float:
+        return max(self._m2, 0.0) / self.length if self.is_full else math.nan
+
+    def push(self, x: float):
+        if self.is_full:
+            old = self._values.popleft()
+            self._values.append(x)
+            self._replace(old=old, new=x)
+        else:
+            self._values.append(x)
+            delta = x - self._mean
+            self._mean += delta / len(self._values)
+            self._m2 += delta * (x - self._mean)
+        self._count_update()
+
+    def replace_last(self, x: float):
+        old = self._values[-1]
+        self._values[-1] = x
+        self._replace(old=old, new=x)
+        self._count_update()
+
+    def _replace(self, old: float, new: float):
+        previous_mean = self._mean
+        self._mean += (new - old) / len(self._values)
+        self._m2 += (new - old) * (new - self._mean + old - previous_mean)
+
+    def _count_update(self):
+        # The running sums accumulate rounding errors, they are recomputed once the whole window has been replaced
+        self._updates += 1
+        if self._updates >= self.length and self.is_full:
+            self._updates = 0
+            values = np.fromiter(self._values, dtype=float, count=self.length)
+            self._mean = float(values.mean())
+            self._m2 = float(((values - self._mean) ** 2).sum())
+
+
+class _RollingExtreme:
+    """
+    Maximum (or minimum) of the last `length` values, kept in a monotonic queue of (index, value).
+    """
+    __slots__ = ("length", "is_max", "_queue", "_index", "_removed")
+
+    def __init__(self, length: int, is_max: bool):
+        self.length = length
+        self.is_max = is_max
+        self._queue: Deque[Tuple[int, float]] = deque()
+        self._index = -1
+        # Entries dropped from the back by the last value, restored when it is replaced
+        self._removed: List[Tuple[int, float]] = []
+
+    @property
+    def value(self) -> float:
+        return self._queue[0][1] if self._index + 1 >= self.length else math.nan
+
+    def push(self, x: float):
+        self._index += 1
+        self._add(x)
+
+    def replace_last(self, x: float):
+        self._queue.pop()
+        self._queue.extend(reversed(self._removed))
+        self._add(x)
+
+    def _add(self, x: float):
+        removed = []
+        while len(self._queue) > 0 and (self._queue[-1][1] <= x if self.is_max else self._queue[-1][1] >= x):
+            removed.append(self._queue.pop())
+        self._queue.append((self._index, x))
+        while self._queue[0][0] <= self._index - self.length:
+            self._queue.popleft()
+        self._removed = removed
+
+
+def _non_zero(value: float) -> float:
+    # pandas_ta non_zero_range
+    return value if value != 0 else sys.float_info.epsilon
+
+
+class IncrementalIndicator(ABC):
+    """
+    Technical indicator updated one candle at a time, in O(1).
+
+    The candles are fed oldest first. A candle can be updated while it is still open: it is passed again with
+    is_new=False and the indicator values are recomputed from the state it had before the candle. The values match
+    the ones of the pandas_ta indicator with the same name (the column names are the pandas_ta ones too).
+    """
+
+    def __init__(self):
+        self.reset()
+
+    @property
+    @abstractmethod
+    def columns(self) -> Tuple[str, ...]:
+        ...
+
+    @property
+    def name(self) -> str:
+        return self.columns[0]
+
+    @abstractmethod
+    def reset(self):
+        ...
+
+    @abstractmethod
+    def update(self, candle: np.ndarray, is_new: bool = True) -> Tuple[float, ...]:
+        """
+        Adds the candle, or replaces the last one when is_new is False, and returns the indicator values for it
+        :param candle: the candle fields, in the CandlesBase columns order
+        """
+        ...
+
+
+class EMA(IncrementalIndicator):
+    def __init__(self, length: int = 10):
+        self.length = length
+        super().__init__()
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return (f"EMA_{self.length}",)
+
+    def reset(self):
+        self._ema = _EMA(self.length)
+
+    def update(self, candle: np.ndarray, is_new: bool = True) -> Tuple[float, ...]:
+        if is_new:
+            self._ema.push(candle[CLOSE])
+        else:
+            self._ema.replace_last(candle[CLOSE])
+        return (self._ema.value,)
+
+
+class SMA(IncrementalIndicator):
+    def __init__(self, length: int = 10):
+        self.length = length
+        super().__init__()
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return (f"SMA_{self.length}",)
+
+    def reset(self):
+        self._moments = _RollingMoments(self.length)
+
+    def update(self, candle: np.ndarray, is_new: bool = True) -> Tuple[float, ...]:
+        if is_new:
+            self._moments.push(candle[CLOSE])
+        else:
+            self._moments.replace_last(candle[CLOSE])
+        return (self._moments.mean,)
+
+
+class BollingerBands(IncrementalIndicator):
+    def __init__(self, length: int = 5, std: float = 2.0):
+        self.length = length
+        self.std = float(std)
+        super().__init__()
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        suffix = f"{self.length}_{self.std}"
+        return f"BBL_{suffix}", f"BBM_{suffix}", f"BBU_{suffix}", f"BBB_{suffix}", f"BBP_{suffix}"
+
+    def reset(self):
+        self._moments = _RollingMoments(self.length)
+
+    def update(self, candle: np.ndarray, is_new: bool = True) -> Tuple[float, ...]:
+        close = candle[CLOSE]
+        if is_new:
+            self._moments.push(close)
+        else:
+            self._moments.replace_last(close)
+        if not self._moments.is_full:
+            return (math.nan,) * 5
+        mid = self._moments.mean
+        deviations = self.std * math.sqrt(self._moments.variance)
+        lower = mid - deviations
+        upper = mid + deviations
+        bands_range = _non_zero(upper - lower)
+        bandwidth = 100 * bands_range / mid if mid != 0 else math.nan
+        return lower, mid, upper, bandwidth, _non_zero(close - lower) / bands_range
+
+
+class MACD(IncrementalIndicator):
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        if slow < fast:
+            fast, slow = slow, fast
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        super().__init__()
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        suffix = f"{self.fast}_{self.slow}_{self.signal}"
+        return f"MACD_{suffix}", f"MACDh_{suffix}", f"MACDs_{suffix}"
+
+    def reset(self):
+        self._fast_ema = _EMA(self.fast)
+        self._slow_ema = _EMA(self.slow)
+        self._signal_ema = _EMA(self.signal)
+        self._count = 0
+
+    def update(self, candle: np.ndarray, is_new: bool = True) -> Tuple[float, ...]:
+        close = candle[CLOSE]
+        if is_new:
+            self._count += 1
+            self._fast_ema.push(close)
+            self._slow_ema.push(close)
+        else:
+            self._fast_ema.replace_last(close)
+            self._slow_ema.replace_last(close)
+        if self._count < self.slow:
+            return (math.nan,) * 3
+        macd = self._fast_ema.value - self._slow_ema.value
+        if is_new:
+            self._signal_ema.push(macd)
+        else:
+            self._signal_ema.replace_last(macd)
+        signal = self._signal_ema.value
+        return macd, macd - signal, signal
+
+
+class RSI(IncrementalIndicator):
+    def __init__(self, length: int = 14):
+        self.length = length
+        super().__init__()
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return (f"RSI_{self.length}",)
+
+    def reset(self):
+        self._gains = _RMA(self.length)
+        self._losses = _RMA(self.length)
+        self._count = 0
+        self._previous_close = math.nan
+        self._close = math.nan
+
+    def update(self, candle: np.ndarray, is_new: bool = True) -> Tuple[float, ...]:
+        if is_new:
+            self._count += 1
+            self._previous_close = self._close
+        self._close = candle[CLOSE]
+        if self._count < 2:
+            return (math.nan,)
+        change = self._close - self._previous_close
+        if is_new:
+            self._gains.push(max(change, 0.0))
+            self._losses.push(max(-change, 0.0))
+        else:
+            self._gains.replace_last(max(change, 0.0))
+            self._losses.replace_last(max(-change, 0.0))
+        gains, losses = self._gains.value, self._losses.value
+        if math.isnan(gains) or gains + losses == 0:
+            return (math.nan,)
+        return (100 * gains / (gains + losses),)
+
+
+class NATR(IncrementalIndicator):
+    def __init__(self, length: int = 14):
+        self.length = length
+        super().__init__()
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return (f"NATR_{self.length}",)
+
+    def reset(self):
+        self._atr = _RMA(self.length)
+        self._count = 0
+        self._previous_close = math.nan
+        self._close = math.nan
+
+    def update(self, candle: np.ndarray, is_new: bool = True) -> Tuple[float, ...]:
+        if is_new:
+            self._count += 1
+            self._previous_close = self._close
+        self._close = candle[CLOSE]
+        if self._count < 2:
+            return (math.nan,)
+        high, low = candle[HIGH], candle[LOW]
+        true_range = max(abs(_non_zero(high - low)), abs(high - self._previous_close), abs(self._previous_close - low))
+        if is_new:
+            self._atr.push(true_range)
+        else:
+            self._atr.replace_last(true_range)
+        return (100 * self._atr.value / self._close,)
+
+
+class DonchianChannel(IncrementalIndicator):
+    def __init__(self, lower_length: int = 20, upper_length: int = 20):
+        self.lower_length = lower_length
+        self.upper_length = upper_length
+        super().__init__()
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        suffix = f"{self.lower_length}_{self.upper_length}"
+        return f"DCL_{suffix}", f"DCM_{suffix}", f"DCU_{suffix}"
+
+    def reset(self):
+        self._lowest = _RollingExtreme(self.lower_length, is_max=False)
+        self._highest = _RollingExtreme(self.upper_length, is_max=True)
+
+    def update(self, candle: np.ndarray, is_new: bool = True) -> Tuple[float, ...]:
+        if is_new:
+            self._lowest.push(candle[LOW])
+            self._highest.push(candle[HIGH])
+        else:
+            self._lowest.replace_last(candle[LOW])
+            self._highest.replace_last(candle[HIGH])
+        lower, upper = self._lowest.value, self._highest.value
+        return lower, 0.5 * (lower + upper), upper
+
+
+class CandlesIndicators:
+    """
+    Indicators of a candles feed, kept up to date with its candles buffer.
+
+    The values of each indicator are stored in a ring buffer aligned with the candles. On every update only the new
+    candles, and the last known one (that may have been updated while open), are fed to the indicators. When older
+    candles change (e.g. historical candles inserted at the beginning) all the values are recomputed.
+    """
+
+    def __init__(self, candles: CandlesRingBuffer):
+        self._candles = candles
+        self._indicators: Dict[str, IncrementalIndicator] = {}
+        self._values: Dict[str, CandlesRingBuffer] = {}
+        self._version = -1
+        self._first_timestamp: Optional[float] = None
+        self._last_timestamp: Optional[float] = None
+        self._recompute = False
+
+    @property
+    def indicators(self) -> List[IncrementalIndicator]:
+        return list(self._indicators.values())
+
+    @property
+    def columns(self) -> List[str]:
+        return [column for indicator in self._indicators.values() for column in indicator.columns]
+
+    def add(self, indicator: IncrementalIndicator) -> IncrementalIndicator:
+        """
+        Registers the indicator and returns it. If an indicator with the same name was already registered, the
+        existing one is returned instead.
+        """
+        existing_indicator = self._indicators.get(indicator.name)
+        if existing_indicator is not None:
+            return existing_indicator
+        self._indicators[indicator.name] = indicator
+        self._values[indicator.name] = CandlesRingBuffer(maxlen=self._candles.maxlen, columns=len(indicator.columns))
+        self._recompute = True
+        return indicator
+
+    def values(self) -> np.ndarray:
+        """
+        Returns the values of all the indicators for each candle, in the order of columns.
+        """
+        self.update()
+        if len(self._values) == 0:
+            return np.empty((len(self._candles), 0))
+        return np.hstack([values.values for values in self._values.values()])
+
+    def latest_values(self) -> Dict[str, float]:
+        """
+        Returns the values of all the indicators for the last candle.
+        """
+        self.update()
+        if len(self._candles) == 0:
+            return {column: math.nan for column in self.columns}
+        latest = {}
+        for name, indicator in self._indicators.items():
+            latest.update(zip(indicator.columns, self._values[name][-1]))
+        return latest
+
+    def update(self):
+        if not self._recompute and self._version == self._candles.version:
+            return
+        candles = self._candles.values
+        if (self._recompute or len(candles) == 0 or self._last_timestamp is None
+                or candles[0][0] < self._first_timestamp):
+            self._update_all(candles)
+        else:
+            position = len(candles) - 1
+            while position >= 0 and candles[position][0] > self._last_timestamp:
+                position -= 1
+            if position < 0 or candles[position][0] != self._last_timestamp:
+                self._update_all(candles)
+            else:
+                self._update_candle(candles[position], is_new=False)
+                for candle in candles[position + 1:]:
+                    self._update_candle(candle, is_new=True)
+        self._first_timestamp = candles[0][0] if len(candles) > 0 else None
+        self._last_timestamp = candles[-1][0] if len(candles) > 0 else None
+        self._version = self._candles.version
+        self._recompute = False
+
+    def _update_all(self, candles: Iterable[np.ndarray]):
+        for name, indicator in self._indicators.items():
+            indicator.reset()
+            self._values[name].clear()
+        for candle in candles:
+            self._update_candle(candle, is_new=True)
+
+    def _update_candle(self, candle: np.ndarray, is_new: bool):
+        for name, indicator in self._indicators.items():
+            values = indicator.update(candle, is_new=is_new)
+            if is_new:
+                self._values[name].append(values)
+            else:
+                self._values[name][-1] = values
+
+
+def add_indicators_to_df(df: pd.DataFrame, indicators: List[IncrementalIndicator]) -> pd.DataFrame:
+    """
+    Computes the indicators over all the candles of the dataframe and returns it with the indicators columns appended,
+    like pandas_ta does with append=True. Used where the candles are not stored in a feed (e.g. backtesting).
+    """
+    for indicator in indicators:
+        indicator.reset()
+        values = np.array([indicator.update(candle) for candle in df[INDICATORS_INPUT_COLUMNS].values], dtype=float)
+        values = values.reshape(len(df), len(indicator.columns))
+        for i, column in enumerate(indicator.columns):
+            df[column] = values[:, i]
+    return df
@@ -0,0 +1,108 @@
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+
+
+class CandlesRingBuffer:
+    """
+    Fixed size storage for candles backed by a preallocated 2-D numpy array.
+
+    It keeps the same interface as the bounded deque previously used by the candles feeds (append, appendleft, extend,
+    extendleft, indexing, maxlen), but the stored candles are always a contiguous block of the array, between the head
+    and tail indices. The array has room for twice the maximum number of records, so the block only has to be moved
+    once every `maxlen` insertions and `values` can be returned without copying.
+    """
+
+    def __init__(self, maxlen: int, columns: int):
+        if maxlen <= 0:
+            raise ValueError("The maximum number of records must be greater than zero.")
+        self._maxlen = maxlen
+        self._data = np.zeros((2 * maxlen, columns), dtype=float)
+        self._head = maxlen
+        self._tail = maxlen
+        self._version = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        """
+        Counter increased on every modification, used to know when the views built from the candles are outdated
+        """
+        return self._version
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Read only view of the stored candles, oldest first. The view is only valid until the next modification.
+        """
+        view = self._data[self._head:self._tail]
+        view.flags.writeable = False
+        return view
+
+    def append(self, candle: Union[np.ndarray, Iterable[float]]):
+        if self._tail == len(self._data):
+            self._move_block(new_head=0)
+        self._data[self._tail] = candle
+        self._tail += 1
+        if self._tail - self._head > self._maxlen:
+            self._head += 1
+        self._version += 1
+
+    def appendleft(self, candle: Union[np.ndarray, Iterable[float]]):
+        if self._head == 0:
+            self._move_block(new_head=len(self._data) - len(self))
+        self._head -= 1
+        self._data[self._head] = candle
+        if self._tail - self._head > self._maxlen:
+            self._tail -= 1
+        self._version += 1
+
+    def extend(self, candles: Iterable[Union[np.ndarray, Iterable[float]]]):
+        for candle in candles:
+            self.append(candle)
+
+    def extendleft(self, candles: Iterable[Union[np.ndarray, Iterable[float]]]):
+        """
+        Same semantics as deque.extendleft, the candles end up in reverse order on the left side
+        """
+        for candle in candles:
+            self.appendleft(candle)
+
+    def clear(self):
+        self._head = self._tail = self._maxlen
+        self._version += 1
+
+    def _move_block(self, new_head: int):
+        length = len(self)
+        self._data[new_head:new_head + length] = self._data[self._head:self._tail].copy()
+        self._head = new_head
+        self._tail = new_head + length
+
+    def _position(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Candles index out of range")
+        return self._head + index
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def __getitem__(self, index: Union[int, slice]) -> np.ndarray:
+        if isinstance(index, slice):
+            return self.values[index]
+        return self._data[self._position(index)]
+
+    def __setitem__(self, index: int, candle: Union[np.ndarray, Iterable[float]]):
+        self._data[self._position(index)] = candle
+        self._version += 1
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.values)
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        return self.values if dtype is None else self.values.astype(dtype)
@@ -16,6 +16,7 @@ from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_indicators import IncrementalIndicator
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
@@ -221,13 +222,15 @@ class MarketDataProvider:
         connector = self.get_connector(connector_name)
         return connector.get_price_by_type(trading_pair, price_type)
 
-    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
+    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500,
+                       indicators: Optional[List[IncrementalIndicator]] = None):
         """
         Retrieves the candles for a trading pair from the specified connector.
         :param connector_name: str
         :param trading_pair: str
         :param interval: str
         :param max_records: int
+        :param indicators: indicators to append as columns, computed incrementally by the candles feed.
         :return: Candles dataframe.
         """
         candles = self.get_candles_feed(CandlesConfig(
@@ -236,6 +239,10 @@ class MarketDataProvider:
             interval=interval,
             max_records=max_records,
         ))
+        if indicators:
+            for indicator in indicators:
+                candles.add_indicator(indicator)
+            return candles.indicators_df.iloc[-max_records:]
         return candles.candles_df.iloc[-max_records:]
 
     def get_trading_pairs(self, connector_name: str):
@@ -0,0 +1,272 @@
+import json
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import ORDER_BOOK_LEVEL_DTYPE, OrderBook
+from hummingbot.logger import HummingbotLogger
+
+COLUMNS = ("timestamp", "mid_price", "best_bid", "best_ask")
+DEPTH_COLUMNS = ("bid_price", "bid_amount", "ask_price", "ask_amount")
+COLUMN_FILE_EXTENSION = ".f8"
+METADATA_FILE_NAME = "metadata.json"
+SECONDS_PER_DAY = 86400
+
+
+def day_name(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def market_data_directory(root: str, exchange: str, trading_pair: str, day: str) -> str:
+    return os.path.join(root, exchange, trading_pair, day)
+
+
+def column_paths(directory: str) -> Dict[str, str]:
+    return {column: os.path.join(directory, column + COLUMN_FILE_EXTENSION) for column in COLUMNS + DEPTH_COLUMNS}
+
+
+def read_depth(directory: str) -> int:
+    with open(os.path.join(directory, METADATA_FILE_NAME)) as metadata_file:
+        return json.load(metadata_file)["depth"]
+
+
+def complete_rows(directory: str, depth: int) -> int:
+    """
+    Number of snapshots stored in all the column files of the directory.
+    """
+    rows = []
+    for column, path in column_paths(directory).items():
+        row_size = 8 * (1 if column in COLUMNS else depth)
+        rows.append(os.path.getsize(path) // row_size if os.path.exists(path) else 0)
+    return min(rows)
+
+
+class _MarketDataBuffer:
+    """
+    Preallocated columns of the snapshots of one exchange and trading pair not written yet to its files of the day.
+    """
+    __slots__ = ("directory", "day_index", "depth", "size", "columns")
+
+    def __init__(self, capacity: int, depth: int):
+        self.directory: Optional[str] = None
+        self.day_index: Optional[int] = None
+        self.depth = depth
+        self.size = 0
+        self.columns: Dict[str, np.ndarray] = {column: np.empty(capacity, dtype=np.float64) for column in COLUMNS}
+        for column in DEPTH_COLUMNS:
+            self.columns[column] = np.empty((capacity, depth), dtype=np.float64)
+
+    @property
+    def capacity(self) -> int:
+        return self.columns["timestamp"].shape[0]
+
+
+class ColumnarMarketDataWriter:
+    """
+    Appends market data snapshots (mid price, best bid and ask and the top levels of the order book) to columnar files,
+    as an alternative to the MarketData table that is much faster to write and to read back for research.
+
+    Each exchange, trading pair and (UTC) day has a directory with one append-only file of float64 values per column,
+    so the files can be memory-mapped straight into arrays (see ColumnarMarketDataReader). The depth columns have
+    `depth` values per snapshot, padded with NaN when the book has less levels. The depth of the files of a day is
+    kept in its metadata file.
+
+    The snapshots are stored in preallocated buffers and appended to the files when a buffer is full, when the day
+    changes, every flush_interval seconds and when flush is called.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, root: str, depth: int, buffer_size: int = 1024, flush_interval: float = 300.0):
+        self._root = root
+        self._depth = depth
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._buffers: Dict[Tuple[str, str], _MarketDataBuffer] = {}
+        self._last_flush_time = self._time()
+        # Reused to read the top levels of the order books without allocating
+        self._bids = np.empty(depth, dtype=ORDER_BOOK_LEVEL_DTYPE)
+        self._asks = np.empty(depth, dtype=ORDER_BOOK_LEVEL_DTYPE)
+
+    @property
+    def root(self) -> str:
+        return self._root
+
+    @property
+    def pending_snapshots(self) -> int:
+        return sum(buffer.size for buffer in self._buffers.values())
+
+    def append(self,
+               exchange: str,
+               trading_pair: str,
+               timestamp: float,
+               mid_price: float,
+               best_bid: float,
+               best_ask: float,
+               order_book: OrderBook):
+        """
+        Adds a snapshot of the market.
+
+        :param timestamp: the time of the snapshot in seconds
+        """
+        buffer = self._buffers.get((exchange, trading_pair))
+        if buffer is None:
+            buffer = _MarketDataBuffer(capacity=self._buffer_size, depth=self._depth)
+            self._buffers[(exchange, trading_pair)] = buffer
+        day_index = int(timestamp // SECONDS_PER_DAY)
+        if buffer.day_index != day_index:
+            self._flush_buffer(buffer)
+            buffer = self._open_day(buffer, exchange, trading_pair, timestamp, day_index)
+
+        row = buffer.size
+        columns = buffer.columns
+        columns["timestamp"][row] = timestamp
+        columns["mid_price"][row] = mid_price
+        columns["best_bid"][row] = best_bid
+        columns["best_ask"][row] = best_ask
+        bids_count, asks_count = order_book.fill_top_levels(self._bids, self._asks)
+        self._copy_levels(self._bids, bids_count, columns["bid_price"][row], columns["bid_amount"][row])
+        self._copy_levels(self._asks, asks_count, columns["ask_price"][row], columns["ask_amount"][row])
+        buffer.size += 1
+
+        if buffer.size == buffer.capacity:
+            self._flush_buffer(buffer)
+        elif self._time() - self._last_flush_time >= self._flush_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Appends all the buffered snapshots to their files.
+        """
+        for buffer in self._buffers.values():
+            self._flush_buffer(buffer)
+        self._last_flush_time = self._time()
+
+    def _time(self) -> float:
+        return time.time()
+
+    @staticmethod
+    def _copy_levels(levels: np.ndarray, count: int, prices: np.ndarray, amounts: np.ndarray):
+        count = min(count, prices.shape[0])
+        prices[:count] = levels["price"][:count]
+        amounts[:count] = levels["amount"][:count]
+        prices[count:] = np.nan
+        amounts[count:] = np.nan
+
+    def _open_day(self,
+                  buffer: _MarketDataBuffer,
+                  exchange: str,
+                  trading_pair: str,
+                  timestamp: float,
+                  day_index: int) -> _MarketDataBuffer:
+        directory = market_data_directory(self._root, exchange, trading_pair, day_name(timestamp))
+        os.makedirs(directory, exist_ok=True)
+        metadata_path = os.path.join(directory, METADATA_FILE_NAME)
+        if os.path.exists(metadata_path):
+            depth = read_depth(directory)
+            if depth != self._depth:
+                self.logger().warning(f"The market data files in {directory} have depth {depth}. The snapshots of "
+                                      f"the day are stored with that depth instead of {self._depth}.")
+            # A write interrupted between the columns leaves some of them longer, they are cut to the same length
+            rows = complete_rows(directory, depth)
+            for column, path in column_paths(directory).items():
+                if os.path.exists(path):
+                    os.truncate(path, rows * 8 * (1 if column in COLUMNS else depth))
+        else:
+            depth = self._depth
+            with open(metadata_path, "w") as metadata_file:
+                json.dump({"depth": depth}, metadata_file)
+        if depth != buffer.depth:
+            buffer = _MarketDataBuffer(capacity=self._buffer_size, depth=depth)
+            self._buffers[(exchange, trading_pair)] = buffer
+        buffer.directory = directory
+        buffer.day_index = day_index
+        return buffer
+
+    def _flush_buffer(self, buffer: _MarketDataBuffer):
+        if buffer.size == 0:
+            return
+        try:
+            for column, values in buffer.columns.items():
+                with open(os.path.join(buffer.directory, column + COLUMN_FILE_EXTENSION), "ab") as column_file:
+                    column_file.write(values[:buffer.size].tobytes())
+        except Exception:
+            self.logger().error(f"Unexpected error writing the market data files in {buffer.directory}.",
+                                exc_info=True)
+        buffer.size = 0
+
+
+class ColumnarMarketDataReader:
+    """
+    Reads the market data files stored by ColumnarMarketDataWriter. The columns are memory-mapped, so reading a time
+    range of a single day does not copy the data.
+    """
+
+    def __init__(self, root: str):
+        self._root = root
+
+    def days(self, exchange: str, trading_pair: str) -> List[str]:
+        directory = os.path.join(self._root, exchange, trading_pair)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(day for day in os.listdir(directory)
+                      if os.path.exists(os.path.join(directory, day, METADATA_FILE_NAME)))
+
+    def read(self,
+             exchange: str,
+             trading_pair: str,
+             start_time: Optional[float] = None,
+             end_time: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Returns the snapshots with start_time <= timestamp < end_time as a dictionary of arrays by column name. The
+        depth columns are two-dimensional arrays (snapshots x levels).
+        """
+        days = self.days(exchange, trading_pair)
+        if start_time is not None:
+            days = [day for day in days if day >= day_name(start_time)]
+        if end_time is not None:
+            days = [day for day in days if day <= day_name(end_time)]
+
+        chunks = []
+        depth = None
+        for day in days:
+            columns = self._map_day(market_data_directory(self._root, exchange, trading_pair, day))
+            timestamps = columns["timestamp"]
+            start = 0 if start_time is None else np.searchsorted(timestamps, start_time, side="left")
+            end = len(timestamps) if end_time is None else np.searchsorted(timestamps, end_time, side="left")
+            if end > start:
+                if depth is not None and columns["bid_price"].shape[1] != depth:
+                    raise ValueError(f"The market data of {exchange} {trading_pair} in {day} have depth "
+                                     f"{columns['bid_price'].shape[1]} instead of {depth}.")
+                depth = columns["bid_price"].shape[1]
+                chunks.append({column: values[start:end] for column, values in columns.items()})
+
+        if len(chunks) == 0:
+            result = {column: np.empty(0, dtype=np.float64) for column in COLUMNS}
+            result.update({column: np.empty((0, 0), dtype=np.float64) for column in DEPTH_COLUMNS})
+            return result
+        if len(chunks) == 1:
+            return chunks[0]
+        return {column: np.concatenate([chunk[column] for chunk in chunks]) for column in COLUMNS + DEPTH_COLUMNS}
+
+    @staticmethod
+    def _map_day(directory: str) -> Dict[str, np.ndarray]:
+        depth = read_depth(directory)
+        rows = complete_rows(directory, depth)
+        columns = {}
+        for column, path in column_paths(directory).items():
+            shape = (rows,) if column in COLUMNS else (rows, depth)
+            if rows == 0:
+                columns[column] = np.empty(shape, dtype=np.float64)
+            else:
+                columns[column] = np.memmap(path, dtype=np.float64, mode="r", shape=shape)
+        return columns
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+
+from . import HummingbotBase
+
+
+class MarketStateUpdate(HummingbotBase):
+    """
+    Journal of the changes of the tracking states of a market since its last MarketState snapshot. Each record has the
+    serialized state of a single order, or no state if the order is not tracked anymore.
+    """
+    __tablename__ = "MarketStateUpdate"
+    __table_args__ = (Index("msu_config_market_index",
+                            "config_file_path", "market"),)
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    order_id = Column(Text, nullable=False)
+    saved_state = Column(JSON, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"MarketStateUpdate(id='{self.id}', config_file_path='{self.config_file_path}', " \
+            f"market='{self.market}', timestamp={self.timestamp}, order_id='{self.order_id}', " \
+            f"saved_state={self.saved_state})"
@@ -0,0 +1,170 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+WriteOperation = Callable[[Session], None]
+
+
+@dataclass
+class WriteBehindMetrics:
+    """
+    Statistics of the batches written by a WriteBehindQueue (times in seconds).
+    """
+    flushes: int = 0
+    written_operations: int = 0
+    failed_operations: int = 0
+    full_queue_waits: int = 0
+    total_flush_time: float = 0.0
+    max_flush_time: float = 0.0
+    last_flush_time: float = 0.0
+
+    @property
+    def average_flush_time(self) -> float:
+        return self.total_flush_time / self.flushes if self.flushes > 0 else 0.0
+
+    def record_flush(self, operations: int, failed_operations: int, elapsed: float):
+        self.flushes += 1
+        self.written_operations += operations - failed_operations
+        self.failed_operations += failed_operations
+        self.total_flush_time += elapsed
+        self.last_flush_time = elapsed
+        self.max_flush_time = max(self.max_flush_time, elapsed)
+
+
+class WriteBehindQueue:
+    """
+    Executes database write operations in batches from a background thread, so the event loop does not wait for the
+    database transactions (and the disk synchronization of each commit).
+
+    The operations are functions receiving the session where they have to add or update their records. They are
+    buffered in a bounded queue (submitting blocks when it is full) and written in a single transaction when the batch
+    reaches max_batch_size operations or flush_interval seconds after its first operation. If the transaction fails,
+    the operations of the batch are retried one by one so a wrong record does not discard the rest.
+    While the writer thread is not running the operations are executed right away.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _FLUSH = object()
+    _STOP = object()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 sql_manager: SQLConnectionManager,
+                 max_batch_size: int = 500,
+                 flush_interval: float = 0.5,
+                 max_queue_size: int = 10000):
+        self._sql_manager = sql_manager
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self.metrics = WriteBehindMetrics()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._write_loop, name="WriteBehindQueue", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Writes all the pending operations and stops the writer thread.
+        """
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, operation: WriteOperation):
+        if self._thread is None:
+            self._execute([operation])
+            return
+        try:
+            self._queue.put_nowait(operation)
+        except queue.Full:
+            self.metrics.full_queue_waits += 1
+            self._queue.put(operation)
+
+    def flush(self):
+        """
+        Writes the pending operations right away, and waits until they are written.
+        """
+        if self._thread is not None:
+            self._queue.put(self._FLUSH)
+            self._queue.join()
+
+    def _write_loop(self):
+        stopping = False
+        while not stopping:
+            operation = self._queue.get()
+            batch: List[WriteOperation] = []
+            dequeued = 1
+            deadline = time.monotonic() + self._flush_interval
+            while True:
+                if operation is self._STOP:
+                    stopping = True
+                    break
+                if operation is self._FLUSH:
+                    break
+                batch.append(operation)
+                timeout = deadline - time.monotonic()
+                if len(batch) >= self._max_batch_size or timeout <= 0:
+                    break
+                try:
+                    operation = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                dequeued += 1
+            if len(batch) > 0:
+                self._execute(batch)
+            for _ in range(dequeued):
+                self._queue.task_done()
+
+    def _execute(self, batch: List[WriteOperation]):
+        start = time.perf_counter()
+        failed_operations = 0
+        try:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    for operation in batch:
+                        operation(session)
+        except Exception:
+            if len(batch) == 1:
+                self.logger().error("Unexpected error while writing to the database.", exc_info=True)
+                failed_operations = 1
+            else:
+                self.logger().warning(f"Error writing a batch of {len(batch)} operations to the database. "
+                                      f"Writing them one by one.", exc_info=True)
+                failed_operations = sum(0 if self._execute_operation(operation) else 1 for operation in batch)
+        self.metrics.record_flush(operations=len(batch),
+                                  failed_operations=failed_operations,
+                                  elapsed=time.perf_counter() - start)
+
+    def _execute_operation(self, operation: WriteOperation) -> bool:
+        try:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    operation(session)
+            return True
+        except Exception:
+            self.logger().error("Unexpected error while writing to the database.", exc_info=True)
+            return False
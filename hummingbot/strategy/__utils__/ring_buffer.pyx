@@ -1,11 +1,20 @@
 import numpy as np
 import logging
+from libc.math cimport isfinite, sqrt
 cimport numpy as np
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the last values added.
+
+    The mean and variance of the values and the sum of the squared differences between consecutive values are updated
+    in O(1) when a value is added (Welford's algorithm, removing the value that leaves the buffer). The running sums
+    accumulate rounding errors, so they are recomputed from the values every time the whole buffer has been replaced,
+    or after a non finite value.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -18,63 +27,122 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_statistics()
 
     def __dealloc__(self):
         self._buffer = None
 
     cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+        cdef:
+            double value = val
+            double removed_value
+            double previous_mean
+            double delta
+            int64_t size
+
+        if self._length > 1 and not self.c_is_empty():
+            delta = value - self._buffer[(self._delimiter + self._length - 1) % self._length]
+            self._sum_squared_diffs += delta * delta
+        if self._is_full:
+            removed_value = self._buffer[self._delimiter]
+            if self._length > 1:
+                delta = self._buffer[(self._delimiter + 1) % self._length] - removed_value
+                self._sum_squared_diffs -= delta * delta
+            previous_mean = self._mean
+            self._mean += (value - removed_value) / self._length
+            self._m2 += (value - removed_value) * (value - self._mean + removed_value - previous_mean)
+        else:
+            size = self._delimiter + 1
+            delta = value - self._mean
+            self._mean += delta / size
+            self._m2 += delta * (value - self._mean)
+
+        self._buffer[self._delimiter] = value
         self.c_increment_delimiter()
 
+        self._updates += 1
+        if (self._is_full and self._updates >= self._length) or not isfinite(self._m2):
+            self.c_recompute_statistics()
+
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_reset_statistics(self):
+        self._mean = 0
+        self._m2 = 0
+        self._sum_squared_diffs = 0
+        self._updates = 0
+
+    cdef void c_recompute_statistics(self):
+        values = self.c_get_as_numpy_array()
+        self._updates = 0
+        if values.size == 0:
+            self.c_reset_statistics()
+            return
+        self._mean = np.mean(values)
+        self._m2 = np.sum(np.square(values - self._mean))
+        self._sum_squared_diffs = np.sum(np.square(np.diff(values)))
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
         return self._buffer[self._delimiter-1]
 
+    cdef double c_get_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._buffer[self._delimiter if self._is_full else 0]
+
     cdef bint c_is_full(self):
         return self._is_full
 
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self._mean
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_running_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_running_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef double c_running_variance(self):
+        # Population variance of the values in the buffer, even if it is not full yet
+        if self.c_is_empty():
+            return np.nan
+        return max(self._m2, 0) / self.c_size()
+
+    cdef double c_sum_squared_diffs(self):
+        return self._sum_squared_diffs
 
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        buffer = np.asarray(self._buffer)
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
-        else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            return buffer[:self._delimiter].copy()
+        return np.concatenate((buffer[self._delimiter:], buffer[:self._delimiter]))
 
     def __init__(self, length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_statistics()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -85,6 +153,9 @@ cdef class RingBuffer:
     def get_last_value(self):
         return self.c_get_last_value()
 
+    def get_first_value(self):
+        return self.c_get_first_value()
+
     @property
     def is_full(self):
         return self.c_is_full()
@@ -101,6 +172,21 @@ cdef class RingBuffer:
     def variance(self):
         return self.c_variance()
 
+    @property
+    def running_variance(self) -> float:
+        return self.c_running_variance()
+
+    @property
+    def sum_squared_diffs(self) -> float:
+        """
+        Sum of the squared differences between each value and the previous one.
+        """
+        return self.c_sum_squared_diffs()
+
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
     @property
     def length(self) -> int:
         return self._length
@@ -113,6 +199,7 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_statistics()
 
         for val in data[-value:]:
             self.add_value(val)
@@ -1,5 +1,4 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
@@ -7,11 +6,39 @@ class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        # Weighted sum of the samples and sum of the weights of the adjusted EMA (the same as
+        # pandas ewm(span=sampling_length, adjust=True) over the sampling buffer), updated in O(1) with each sample
+        self._weighted_sum = 0.0
+        self._weights_sum = 0.0
+
+    def add_sample(self, value: float):
+        decay = 1 - 2 / (self._sampling_buffer.length + 1)
+        self._weighted_sum = decay * self._weighted_sum + value
+        self._weights_sum = decay * self._weights_sum + 1
+        if self._sampling_buffer.is_full:
+            # The oldest sample leaves the buffer
+            removed_weight = decay ** self._sampling_buffer.length
+            self._weighted_sum -= removed_weight * self._sampling_buffer.get_first_value()
+            self._weights_sum -= removed_weight
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        return self._weighted_sum / self._weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        # The weights depend on the length, the sums are recalculated from the samples kept
+        decay = 1 - 2 / (value + 1)
+        self._weighted_sum = 0.0
+        self._weights_sum = 0.0
+        for sample in self._sampling_buffer.get_as_numpy_array():
+            self._weighted_sum = decay * self._weighted_sum + sample
+            self._weights_sum = decay * self._weights_sum + 1
@@ -1,18 +1,33 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Log returns between the prices of the sampling buffer, their variance is updated in O(1) by the buffer
+        self._returns_buffer = RingBuffer(max(sampling_length - 1, 1))
+
+    def add_sample(self, value: float):
+        previous_price = self._sampling_buffer.get_last_value()
+        if not np.isnan(previous_price) and self._sampling_buffer.length > 1:
+            self._returns_buffer.add_value(np.log(value) - np.log(previous_price))
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        return self._returns_buffer.running_variance
 
     def _processing_calculation(self) -> float:
         processing_array = self._processing_buffer.get_as_numpy_array()
         if processing_array.size > 0:
             return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._returns_buffer.length = max(value - 1, 1)
@@ -20,10 +20,27 @@ cdef class TradingIntensityIndicator:
         list _last_quotes
         int _sampling_length
         int _samples_length
+        str _estimator
+        object _refit_executor
+        object _refit_future
+        dict _level_amounts
+        int _histogram_trades
+        int _histogram_removals
+        double _fit_weights
+        double _fit_x
+        double _fit_xx
+        double _fit_y
+        double _fit_xy
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
     cdef c_estimate_intensity(self)
+    cdef c_update_histogram(self, double price_level, double amount, bint remove)
+    cdef c_update_fit_sums(self, double price_level, double amount, double sign)
+    cdef c_rebuild_histogram(self)
+    cdef bint c_estimate_log_linear(self)
+    cdef c_start_refit(self)
+    cdef c_apply_refit_result(self)
 
 cdef class TradesForwarder(EventListener):
     cdef:
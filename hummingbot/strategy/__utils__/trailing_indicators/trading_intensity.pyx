@@ -2,10 +2,11 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
-from decimal import Decimal
-from typing import Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 import numpy as np
+from libc.math cimport exp, log
 from scipy.optimize import curve_fit
 from scipy.optimize import OptimizeWarning
 
@@ -17,6 +18,41 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+TRADING_INTENSITY_ESTIMATORS = ("curve_fit", "log_linear")
+
+shared_refit_executor = None
+
+
+def get_shared_refit_executor() -> ThreadPoolExecutor:
+    """
+    Worker thread shared by the indicators that run the nonlinear fit in the background.
+    """
+    global shared_refit_executor
+    if shared_refit_executor is None:
+        shared_refit_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TradingIntensityRefit")
+    return shared_refit_executor
+
+
+def fit_trading_intensity(price_levels: List[float],
+                          lambdas: List[float],
+                          initial_alpha: float,
+                          initial_kappa: float) -> Tuple[float, float]:
+    """
+    Nonlinear least squares fit of the exponential arrival model lambda = alpha * exp(-kappa * price_level).
+    It is a module function so it can also be run by a process pool.
+    """
+    warnings.simplefilter("ignore", OptimizeWarning)
+    # Adjust to be able to calculate log
+    lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+    params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
+                       price_levels,
+                       lambdas_adj,
+                       p0=(initial_alpha, initial_kappa),
+                       method='dogbox',
+                       bounds=([0, 0], [np.inf, np.inf]))
+    return float(params[0][0]), float(params[0][1])
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,8 +62,28 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the parameters of the exponential arrival model of the trades, lambda = alpha * exp(-kappa * delta),
+    where lambda is the amount traded at a distance delta from the mid price, over the last sampling_length ticks.
+
+    The amounts traded are kept in a histogram by price level, updated with every trade that enters or leaves the
+    sampling window. The estimators are:
+    - curve_fit: nonlinear least squares fit of the histogram. If a refit_executor (a thread or process pool) is
+      provided the fit runs in it, and the current value is replaced by its result once it finishes. Until the first
+      result is available the log linear estimate is used.
+    - log_linear: closed form weighted linear regression of log(lambda) on delta (weighted by lambda), updated in
+      O(1) with every trade.
+    """
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 estimator: str = "curve_fit",
+                 refit_executor: Optional[Executor] = None):
+        if estimator not in TRADING_INTENSITY_ESTIMATORS:
+            raise ValueError(f"Invalid trading intensity estimator {estimator}, it must be one of "
+                             f"{TRADING_INTENSITY_ESTIMATORS}.")
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
@@ -39,13 +95,29 @@ cdef class TradingIntensityIndicator:
         self._sampling_length = sampling_length
         self._samples_length = 0
         self._last_quotes = []
+        self._estimator = estimator
+        self._refit_executor = refit_executor
+        self._refit_future = None
+        self._level_amounts = {}
+        self._histogram_trades = 0
+        self._histogram_removals = 0
+        self._fit_weights = self._fit_x = self._fit_xx = self._fit_y = self._fit_xy = 0
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
     @property
     def current_value(self) -> Tuple[float, float]:
+        self.c_apply_refit_result()
         return self._alpha, self._kappa
 
+    @property
+    def estimator(self) -> str:
+        return self._estimator
+
+    @property
+    def is_refit_running(self) -> bool:
+        return self._refit_future is not None and not self._refit_future.done()
+
     @property
     def is_sampling_buffer_full(self) -> bool:
         return len(self._trade_samples.keys()) == self._sampling_length
@@ -95,6 +167,7 @@ cdef class TradingIntensityIndicator:
                         self._trade_samples[quote["timestamp"] + 1] = []
 
                     self._trade_samples[quote["timestamp"] + 1] += [trade]
+                    self.c_update_histogram(trade["price_level"], trade["amount"], False)
                     break
 
         # THere are no trades left to process
@@ -106,12 +179,12 @@ cdef class TradingIntensityIndicator:
         if len(self._trade_samples.keys()) > self._sampling_length:
             timestamps = list(self._trade_samples.keys())
             timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
-
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+            for timestamp in timestamps[:-self._sampling_length]:
+                for trade in self._trade_samples.pop(timestamp):
+                    self.c_update_histogram(trade["price_level"], trade["amount"], True)
+            # The removals accumulate rounding errors, the histogram is rebuilt once they outnumber the trades in it
+            if self._histogram_removals > self._histogram_trades:
+                self.c_rebuild_histogram()
 
         if self.is_sampling_buffer_full:
             self.c_estimate_intensity()
@@ -125,42 +198,111 @@ cdef class TradingIntensityIndicator:
 
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
             list lambdas
             list price_levels
 
-        # Calculate lambdas / trading intensities
-        lambdas = []
+        if self._estimator == "log_linear":
+            self.c_estimate_log_linear()
+            return
+        if self._refit_executor is not None:
+            self.c_start_refit()
+            return
 
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
-
-        # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        price_levels = sorted(self._level_amounts.keys(), reverse=True)
+        lambdas = [self._level_amounts[price_level][0] for price_level in price_levels]
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
-                               price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
-                               method='dogbox',
-                               bounds=([0, 0], [np.inf, np.inf]))
-
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
+            self._alpha, self._kappa = fit_trading_intensity(price_levels, lambdas, self._alpha, self._kappa)
         except (RuntimeError, ValueError) as e:
             pass
+
+    cdef c_update_histogram(self, double price_level, double amount, bint remove):
+        cdef list level = self._level_amounts.get(price_level)
+
+        if level is None:
+            level = [0.0, 0]
+            self._level_amounts[price_level] = level
+        self.c_update_fit_sums(price_level, level[0], -1)
+        if remove:
+            level[0] -= amount
+            level[1] -= 1
+            self._histogram_trades -= 1
+            self._histogram_removals += 1
+        else:
+            level[0] += amount
+            level[1] += 1
+            self._histogram_trades += 1
+        if level[1] == 0:
+            del self._level_amounts[price_level]
+        else:
+            self.c_update_fit_sums(price_level, level[0], 1)
+
+    cdef c_update_fit_sums(self, double price_level, double amount, double sign):
+        cdef:
+            double weight
+            double log_amount
+
+        if amount <= 0:
+            return
+        weight = sign * amount
+        log_amount = log(amount)
+        self._fit_weights += weight
+        self._fit_x += weight * price_level
+        self._fit_xx += weight * price_level * price_level
+        self._fit_y += weight * log_amount
+        self._fit_xy += weight * price_level * log_amount
+
+    cdef c_rebuild_histogram(self):
+        self._level_amounts = {}
+        self._histogram_trades = 0
+        self._histogram_removals = 0
+        self._fit_weights = self._fit_x = self._fit_xx = self._fit_y = self._fit_xy = 0
+        for trades in self._trade_samples.values():
+            for trade in trades:
+                self.c_update_histogram(trade["price_level"], trade["amount"], False)
+
+    cdef bint c_estimate_log_linear(self):
+        cdef:
+            double denominator = self._fit_weights * self._fit_xx - self._fit_x * self._fit_x
+            double slope
+
+        # At least two price levels are required
+        if len(self._level_amounts) < 2 or self._fit_weights <= 0 or denominator <= 0:
+            return False
+        slope = (self._fit_weights * self._fit_xy - self._fit_x * self._fit_y) / denominator
+        # The same bounds as the nonlinear fit, kappa >= 0
+        if slope > 0:
+            slope = 0
+        self._kappa = -slope
+        self._alpha = exp((self._fit_y - slope * self._fit_x) / self._fit_weights)
+        return True
+
+    cdef c_start_refit(self):
+        cdef list price_levels
+
+        self.c_apply_refit_result()
+        if self._refit_future is not None:
+            # The previous fit is still running, the next one will use the latest trades
+            return
+        if self._alpha == 0 and self._kappa == 0:
+            # No fit finished yet, the log linear estimate is used meanwhile and as initial values
+            self.c_estimate_log_linear()
+        price_levels = sorted(self._level_amounts.keys(), reverse=True)
+        self._refit_future = self._refit_executor.submit(
+            fit_trading_intensity,
+            price_levels,
+            [self._level_amounts[price_level][0] for price_level in price_levels],
+            self._alpha,
+            self._kappa)
+
+    cdef c_apply_refit_result(self):
+        # Only the event loop replaces the values, when the fit has finished, so alpha and kappa are always updated
+        # together
+        if self._refit_future is None or not self._refit_future.done():
+            return
+        future = self._refit_future
+        self._refit_future = None
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._alpha, self._kappa = future.result()
@@ -24,7 +24,10 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils import map_df_to_str
 from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
-from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import (
+    TradingIntensityIndicator,
+    get_shared_refit_executor,
+)
 from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_config_map_pydantic import (
     AvellanedaMarketMakingConfigMap,
     DailyBetweenTimesModel,
@@ -425,10 +428,13 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 self._trading_intensity.sampling_length = trading_intensity_buffer_size
 
         if self._trading_intensity is None and self.market_info.market.ready:
+            estimator = self._config_map.trading_intensity_estimator
             self._trading_intensity = TradingIntensityIndicator(
                 order_book=self.market_info.order_book,
                 price_delegate=self._price_delegate,
                 sampling_length=self._trading_intensity_buffer_size,
+                estimator="log_linear" if estimator == "log_linear" else "curve_fit",
+                refit_executor=get_shared_refit_executor() if estimator == "background_curve_fit" else None,
             )
 
         self._ticks_to_be_ready += (ticks_to_be_ready_after - ticks_to_be_ready_before)
@@ -175,6 +175,8 @@ HANGING_ORDER_MODELS = {
     IgnoreHangingOrdersModel.Config.title: IgnoreHangingOrdersModel,
 }
 
+TRADING_INTENSITY_ESTIMATOR_MODES = ("curve_fit", "background_curve_fit", "log_linear")
+
 
 class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
     strategy: str = Field(default="avellaneda_market_making", client_data=None)
@@ -311,6 +313,18 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             prompt=lambda mi: "Enter amount of ticks that will be stored to estimate order book liquidity",
         ),
     )
+    trading_intensity_estimator: str = Field(
+        default="curve_fit",
+        description="How the order book liquidity parameters are estimated: curve_fit (nonlinear fit on every tick),"
+                    " background_curve_fit (the same fit run in a worker thread) or log_linear (closed form fit of the"
+                    " log of the traded amounts, the fastest).",
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                "Enter the estimator of the order book liquidity parameters "
+                f"({'/'.join(TRADING_INTENSITY_ESTIMATOR_MODES)})"
+            ),
+        ),
+    )
     order_levels_mode: Union[SingleOrderLevelModel, MultiOrderLevelModel] = Field(
         default=SingleOrderLevelModel.construct(),
         description="Allows activating multi-order levels.",
@@ -390,6 +404,12 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             raise ValueError(ret)
         return v
 
+    @validator("trading_intensity_estimator", pre=True)
+    def validate_trading_intensity_estimator(cls, v: str):
+        if v not in TRADING_INTENSITY_ESTIMATOR_MODES:
+            raise ValueError(f"Invalid estimator, please choose value from {list(TRADING_INTENSITY_ESTIMATOR_MODES)}.")
+        return v
+
     @validator("order_levels_mode", pre=True)
     def validate_order_levels_mode(cls, v: Union[str, SingleOrderLevelModel, MultiOrderLevelModel]):
         if isinstance(v, (SingleOrderLevelModel, MultiOrderLevelModel, Dict)):
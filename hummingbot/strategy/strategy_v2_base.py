@@ -33,6 +33,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
     StoreExecutorAction,
 )
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
 
 
 class StrategyV2ConfigBase(BaseClientModel):
@@ -73,6 +74,14 @@ class StrategyV2ConfigBase(BaseClientModel):
             prompt=lambda mi: "Enter the config update interval in seconds (e.g. 60): ",
         )
     )
+    use_runnable_scheduler: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt_on_new=False,
+            prompt=lambda mi: "Run the controllers and executors in a shared scheduler instead of one loop each "
+                              "(True/False): ",
+        )
+    )
 
     @validator("controllers_config", pre=True, always=True)
     def parse_controllers_config(cls, v):
@@ -194,7 +203,9 @@ class StrategyV2Base(ScriptStrategyBase):
         super().__init__(connectors, config)
         # Initialize the executor orchestrator
         self.config = config
-        self.executor_orchestrator = ExecutorOrchestrator(strategy=self)
+        self.runnable_scheduler: Optional[RunnableScheduler] = RunnableScheduler() \
+            if config.use_runnable_scheduler else None
+        self.executor_orchestrator = ExecutorOrchestrator(strategy=self, scheduler=self.runnable_scheduler)
 
         self.executors_info: Dict[str, List[ExecutorInfo]] = {}
         self.positions_held: Dict[str, List] = {}
@@ -221,6 +232,7 @@ class StrategyV2Base(ScriptStrategyBase):
     def add_controller(self, config: ControllerConfigBase):
         try:
             controller = config.get_controller_class()(config, self.market_data_provider, self.actions_queue)
+            controller.scheduler = self.runnable_scheduler
             controller.start()
             self.controllers[config.id] = controller
         except Exception as e:
@@ -1,5 +1,9 @@
 from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_sweep import BacktestingSweep
+from hummingbot.strategy_v2.backtesting.candles_disk_cache import CandlesDiskCache
 
 __all__ = [
     "BacktestingDataProvider",
+    "BacktestingSweep",
+    "CandlesDiskCache",
 ]
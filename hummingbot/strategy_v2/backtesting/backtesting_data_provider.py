@@ -1,6 +1,6 @@
 import logging
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List, Optional
 
 import pandas as pd
 
@@ -11,8 +11,10 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_indicators import IncrementalIndicator, add_indicators_to_df
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.strategy_v2.backtesting.candles_disk_cache import CandlesDiskCache
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -26,8 +28,9 @@ class BacktestingDataProvider(MarketDataProvider):
                            "polkadex", "coinbase_advanced_trade", "kraken", "dydx_v4_perpetual", "hitbtc",
                            "hyperliquid"]
 
-    def __init__(self, connectors: Dict[str, ConnectorBase]):
+    def __init__(self, connectors: Dict[str, ConnectorBase], candles_cache: Optional[CandlesDiskCache] = None):
         super().__init__(connectors)
+        self.candles_cache = candles_cache
         self.start_time = None
         self.end_time = None
         self.prices = {}
@@ -103,27 +106,40 @@ class BacktestingDataProvider(MarketDataProvider):
         # Create a new feed or restart the existing one with updated max_records
         candle_feed = CandlesFactory.get_candle(config)
         candles_buffer = config.max_records * CandlesBase.interval_to_seconds[config.interval]
-        candles_df = await candle_feed.get_historical_candles(config=HistoricalCandlesConfig(
+        historical_candles_config = HistoricalCandlesConfig(
             connector_name=config.connector,
             trading_pair=config.trading_pair,
             interval=config.interval,
             start_time=self.start_time - candles_buffer,
             end_time=self.end_time,
-        ))
+        )
+        if self.candles_cache is not None:
+            candles_df = await self.candles_cache.get_candles(candle_feed, historical_candles_config)
+        else:
+            candles_df = await candle_feed.get_historical_candles_concurrently(config=historical_candles_config)
         self.candles_feeds[key] = candles_df
         return candles_df
 
-    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
+    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500,
+                       indicators: Optional[List[IncrementalIndicator]] = None):
         """
         Retrieves the candles for a trading pair from the specified connector.
         :param connector_name: str
         :param trading_pair: str
         :param interval: str
         :param max_records: int
+        :param indicators: indicators to append as columns, computed over all the backtesting candles.
         :return: Candles dataframe.
         """
         candles_df = self.candles_feeds.get(f"{connector_name}_{trading_pair}_{interval}")
-        return candles_df[(candles_df["timestamp"] >= self.start_time) & (candles_df["timestamp"] <= self.end_time)]
+        if candles_df is None and self.candles_cache is not None:
+            candles_df = self.candles_cache.read(connector_name, trading_pair, interval, self.start_time, self.end_time)
+        else:
+            candles_df = candles_df[(candles_df["timestamp"] >= self.start_time) &
+                                    (candles_df["timestamp"] <= self.end_time)]
+        if indicators:
+            candles_df = add_indicators_to_df(candles_df.copy(), indicators)
+        return candles_df
 
     def get_price_by_type(self, connector_name: str, trading_pair: str, price_type: PriceType):
         """
@@ -2,7 +2,7 @@ import importlib
 import inspect
 import os
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Mapping, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -13,6 +13,7 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.exceptions import InvalidController
 from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.candles_disk_cache import CandlesDiskCache
 from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
 from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
 from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
@@ -30,10 +31,10 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
 class BacktestingEngineBase:
-    def __init__(self):
+    def __init__(self, candles_cache: Optional[CandlesDiskCache] = None):
         self.controller = None
         self.backtesting_resolution = None
-        self.backtesting_data_provider = BacktestingDataProvider(connectors={})
+        self.backtesting_data_provider = BacktestingDataProvider(connectors={}, candles_cache=candles_cache)
         self.position_executor_simulator = PositionExecutorSimulator()
         self.dca_executor_simulator = DCAExecutorSimulator()
 
@@ -122,11 +123,15 @@ class BacktestingEngineBase:
         processed_features = self.prepare_market_data()
         self.active_executor_simulations: List[ExecutorSimulation] = []
         self.stopped_executors_info: List[ExecutorInfo] = []
-        for i, row in processed_features.iterrows():
+        columns = list(processed_features.columns)
+        for position, values in enumerate(processed_features.itertuples(index=False, name=None)):
+            row = dict(zip(columns, values))
             await self.update_state(row)
             for action in self.controller.determine_executor_actions():
                 if isinstance(action, CreateExecutorAction):
-                    executor_simulation = self.simulate_executor(action.executor_config, processed_features.loc[i:], trade_cost)
+                    executor_simulation = self.simulate_executor(action.executor_config,
+                                                                 processed_features.iloc[position:],
+                                                                 trade_cost)
                     if executor_simulation.close_type != CloseType.FAILED:
                         self.manage_active_executors(executor_simulation)
                 elif isinstance(action, StopExecutorAction):
@@ -134,24 +139,24 @@ class BacktestingEngineBase:
 
         return self.controller.executors_info
 
-    async def update_state(self, row):
+    async def update_state(self, row: Mapping):
         key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
         self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
         self.controller.market_data_provider._time = row["timestamp"]
-        self.controller.processed_data.update(row.to_dict())
+        self.controller.processed_data.update(row)
         self.update_executors_info(row["timestamp"])
 
     def update_executors_info(self, timestamp: float):
         active_executors_info = []
-        simulations_to_remove = []
+        active_executor_simulations = []
         for executor in self.active_executor_simulations:
             executor_info = executor.get_executor_info_at_timestamp(timestamp)
             if executor_info.status == RunnableStatus.TERMINATED:
                 self.stopped_executors_info.append(executor_info)
-                simulations_to_remove.append(executor.config.id)
             else:
                 active_executors_info.append(executor_info)
-        self.active_executor_simulations = [es for es in self.active_executor_simulations if es.config.id not in simulations_to_remove]
+                active_executor_simulations.append(executor)
+        self.active_executor_simulations = active_executor_simulations
         self.controller.executors_info = active_executors_info + self.stopped_executors_info
 
     async def update_processed_data(self, row: pd.Series):
@@ -0,0 +1,143 @@
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import pandas as pd
+
+from hummingbot.client import settings
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.candles_disk_cache import CandlesDiskCache
+
+logger = logging.getLogger(__name__)
+
+# Engine reused by all the runs executed in the same process, so the connectors, trading rules and candles already
+# loaded by the data provider are shared between them.
+_engine: Optional[BacktestingEngineBase] = None
+_ev_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _initialize_engine(candles_cache_path: Optional[str]):
+    global _engine, _ev_loop
+    _engine = BacktestingEngineBase(candles_cache=CandlesDiskCache(cache_path=candles_cache_path))
+    _ev_loop = asyncio.new_event_loop()
+
+
+def _run_backtesting(config_data: Dict[str, Any], controllers_module: str, start: int, end: int,
+                     backtesting_resolution: str, trade_cost: float) -> Dict[str, Any]:
+    controller_config = BacktestingEngineBase.get_controller_config_instance_from_dict(config_data, controllers_module)
+    backtesting_result = _ev_loop.run_until_complete(
+        _engine.run_backtesting(controller_config=controller_config,
+                                start=start,
+                                end=end,
+                                backtesting_resolution=backtesting_resolution,
+                                trade_cost=trade_cost))
+    return backtesting_result["results"]
+
+
+class BacktestingSweep:
+    """
+    Runs the backtesting of a controller for every combination of a parameter grid, fanning the runs out over a pool
+    of processes.
+
+    The candles are shared by all the runs through a CandlesDiskCache: the first combination is run in the current
+    process to download them, then every worker process keeps its own engine, so the trading rules are only requested
+    once per worker. Each result is appended to the results file as soon as the run finishes; the file is also the
+    checkpoint, the combinations already in it are skipped when the sweep is run again.
+    """
+
+    def __init__(self,
+                 base_config: Dict[str, Any],
+                 parameter_grid: Dict[str, List[Any]],
+                 start: int,
+                 end: int,
+                 results_path: str,
+                 backtesting_resolution: str = "1m",
+                 trade_cost: float = 0.0006,
+                 max_workers: Optional[int] = None,
+                 candles_cache_path: Optional[str] = None,
+                 controllers_module: str = settings.CONTROLLERS_MODULE):
+        self.base_config = base_config
+        self.parameter_grid = parameter_grid
+        self.start = start
+        self.end = end
+        self.results_path = results_path
+        self.backtesting_resolution = backtesting_resolution
+        self.trade_cost = trade_cost
+        self.max_workers = max_workers or os.cpu_count()
+        self.candles_cache_path = candles_cache_path
+        self.controllers_module = controllers_module
+
+    @staticmethod
+    def run_id(parameters: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(parameters, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+    def parameter_combinations(self) -> List[Dict[str, Any]]:
+        keys = list(self.parameter_grid.keys())
+        return [dict(zip(keys, values)) for values in itertools.product(*self.parameter_grid.values())]
+
+    def completed_run_ids(self) -> Set[str]:
+        if not os.path.exists(self.results_path):
+            return set()
+        return set(pd.read_csv(self.results_path, usecols=["run_id"], dtype={"run_id": str})["run_id"])
+
+    def load_results(self) -> pd.DataFrame:
+        if not os.path.exists(self.results_path):
+            return pd.DataFrame()
+        return pd.read_csv(self.results_path, dtype={"run_id": str})
+
+    def _record_result(self, parameters: Dict[str, Any], results: Dict[str, Any]) -> Dict[str, Any]:
+        row = {"run_id": self.run_id(parameters), **parameters}
+        row.update({key: json.dumps(value) if isinstance(value, dict) else value for key, value in results.items()})
+        pd.DataFrame([row]).to_csv(self.results_path, mode="a", header=not os.path.exists(self.results_path),
+                                   index=False)
+        return row
+
+    def _run_arguments(self, parameters: Dict[str, Any]) -> tuple:
+        return ({**self.base_config, **parameters}, self.controllers_module, self.start, self.end,
+                self.backtesting_resolution, self.trade_cost)
+
+    def run(self, on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> pd.DataFrame:
+        """
+        Runs the pending combinations and returns the results of the whole sweep, including the ones recorded by
+        previous executions. It blocks until all the runs finish, so it can't be called from a running event loop.
+
+        :param on_result: function called with the results row of every run as soon as it finishes
+        """
+        completed_run_ids = self.completed_run_ids()
+        pending = [parameters for parameters in self.parameter_combinations()
+                   if self.run_id(parameters) not in completed_run_ids]
+        logger.info(f"Backtesting sweep: {len(completed_run_ids)} runs already completed, {len(pending)} pending.")
+        if len(pending) == 0:
+            return self.load_results()
+
+        def handle_result(parameters: Dict[str, Any], get_results: Callable[[], Dict[str, Any]]):
+            try:
+                row = self._record_result(parameters, get_results())
+            except Exception:
+                logger.exception(f"Backtesting run failed for parameters {parameters}.")
+                return
+            if on_result is not None:
+                on_result(row)
+
+        # The first run downloads the candles to the shared cache before the workers start
+        _initialize_engine(self.candles_cache_path)
+        first_parameters, pending = pending[0], pending[1:]
+        handle_result(first_parameters, lambda: _run_backtesting(*self._run_arguments(first_parameters)))
+
+        if self.max_workers <= 1:
+            for parameters in pending:
+                handle_result(parameters, lambda: _run_backtesting(*self._run_arguments(parameters)))
+        elif len(pending) > 0:
+            with ProcessPoolExecutor(max_workers=self.max_workers,
+                                     initializer=_initialize_engine,
+                                     initargs=(self.candles_cache_path,)) as executor:
+                futures = {executor.submit(_run_backtesting, *self._run_arguments(parameters)): parameters
+                           for parameters in pending}
+                for future in as_completed(futures):
+                    handle_result(futures[future], future.result)
+        return self.load_results()
@@ -0,0 +1,231 @@
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class CandlesDiskCache:
+    """
+    Persistent candles store shared by the backtesting runs.
+
+    The candles of every connector, trading pair and interval are stored as a contiguous period, one .npy file per
+    column, so any time slice can be read through memory-mapped arrays without loading the whole history. The index
+    keeps both the timestamps of the stored candles and the period that was requested to the exchange (the covered
+    period), which can be longer when the exchange has no candles before or after some time. Only the periods missing
+    before or after the covered one are downloaded.
+
+    Every write goes to a new generation directory and is published by atomically replacing the index file, so
+    readers always see a complete set of columns. Writers of the same candles hold a lock file while they merge and
+    publish, so the candles downloaded by concurrent processes are all kept.
+    """
+    INDEX_FILE_NAME = "index.json"
+    LOCK_FILE_NAME = "index.lock"
+    READ_ATTEMPTS = 3
+
+    def __init__(self, cache_path: Optional[str] = None):
+        self._cache_path = cache_path or os.path.join(data_path(), "candles_cache")
+
+    @property
+    def cache_path(self) -> str:
+        return self._cache_path
+
+    def _key_path(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return os.path.join(self._cache_path, connector_name, trading_pair, interval)
+
+    def _read_index(self, connector_name: str, trading_pair: str, interval: str) -> Optional[Dict]:
+        index_path = os.path.join(self._key_path(connector_name, trading_pair, interval), self.INDEX_FILE_NAME)
+        try:
+            with open(index_path) as index_file:
+                return json.load(index_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    @contextmanager
+    def _lock(self, key_path: str) -> Iterator[None]:
+        with open(os.path.join(key_path, self.LOCK_FILE_NAME), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def last_closed_candle_time(interval: str) -> int:
+        """
+        :return: the timestamp of the last candle whose interval has finished
+        """
+        interval_in_seconds = CandlesBase.interval_to_seconds[interval]
+        return int(time.time() // interval_in_seconds) * interval_in_seconds - interval_in_seconds
+
+    def cached_period(self, connector_name: str, trading_pair: str, interval: str) -> Optional[Tuple[int, int]]:
+        """
+        :return: the timestamps of the first and last stored candles, None if nothing is stored
+        """
+        index = self._read_index(connector_name, trading_pair, interval)
+        if index is None or index["start_time"] is None:
+            return None
+        return index["start_time"], index["end_time"]
+
+    def covered_period(self, connector_name: str, trading_pair: str, interval: str) -> Optional[Tuple[int, int]]:
+        """
+        :return: the period whose candles have been downloaded (it includes the stored candles), None if none
+        """
+        index = self._read_index(connector_name, trading_pair, interval)
+        if index is None:
+            return None
+        return index.get("covered_start_time", index["start_time"]), index.get("covered_end_time", index["end_time"])
+
+    def missing_periods(self, connector_name: str, trading_pair: str, interval: str,
+                        start_time: int, end_time: int) -> List[Tuple[int, int]]:
+        """
+        Calculates the periods that have to be downloaded to cover from start_time to end_time. The end time is
+        limited to the last closed candle. The periods always reach the covered one, so the stored candles remain
+        contiguous.
+        """
+        end_time = min(end_time, self.last_closed_candle_time(interval))
+        if end_time < start_time:
+            return []
+        covered_period = self.covered_period(connector_name, trading_pair, interval)
+        if covered_period is None:
+            return [(start_time, end_time)]
+        covered_start_time, covered_end_time = covered_period
+        missing_periods = []
+        if start_time < covered_start_time:
+            missing_periods.append((start_time, covered_start_time))
+        if end_time > covered_end_time:
+            missing_periods.append((covered_end_time, end_time))
+        return missing_periods
+
+    def read_columns(self, connector_name: str, trading_pair: str, interval: str,
+                     start_time: Optional[int] = None, end_time: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Returns the memory-mapped columns of the candles between start_time and end_time (both included). The arrays
+        are read only views of the stored files.
+        """
+        for attempt in range(self.READ_ATTEMPTS):
+            index = self._read_index(connector_name, trading_pair, interval)
+            if index is None:
+                return {}
+            generation_path = os.path.join(self._key_path(connector_name, trading_pair, interval), index["generation"])
+            try:
+                columns = {column: np.load(os.path.join(generation_path, f"{column}.npy"), mmap_mode="r")
+                           for column in index["columns"]}
+                break
+            except FileNotFoundError:
+                # Another process published a new generation and removed this one after the index was read
+                if attempt == self.READ_ATTEMPTS - 1:
+                    raise
+        timestamps = columns["timestamp"]
+        first = 0 if start_time is None else np.searchsorted(timestamps, start_time, side="left")
+        last = len(timestamps) if end_time is None else np.searchsorted(timestamps, end_time, side="right")
+        return {column: values[first:last] for column, values in columns.items()}
+
+    def read(self, connector_name: str, trading_pair: str, interval: str,
+             start_time: Optional[int] = None, end_time: Optional[int] = None) -> pd.DataFrame:
+        columns = self.read_columns(connector_name, trading_pair, interval, start_time, end_time)
+        if len(columns) == 0:
+            return pd.DataFrame(columns=CandlesBase.columns)
+        return pd.DataFrame({column: np.asarray(values) for column, values in columns.items()})
+
+    def write(self, connector_name: str, trading_pair: str, interval: str, candles_df: pd.DataFrame,
+              covered_period: Optional[Tuple[int, int]] = None):
+        """
+        Merges the candles with the stored ones and publishes the result as a new generation. Candles still open
+        (whose interval has not finished yet) are not stored.
+
+        :param covered_period: the period requested to download the candles (the period of the candles by default).
+        It has to overlap or be contiguous to the covered period already stored.
+        """
+        if candles_df.empty:
+            candles_df = pd.DataFrame(columns=CandlesBase.columns)
+        last_closed_candle_time = self.last_closed_candle_time(interval)
+        candles_df = candles_df[candles_df["timestamp"] <= last_closed_candle_time]
+        if covered_period is None:
+            if candles_df.empty:
+                return
+            covered_period = (int(candles_df["timestamp"].iloc[0]), int(candles_df["timestamp"].iloc[-1]))
+        covered_start_time, covered_end_time = covered_period[0], min(covered_period[1], last_closed_candle_time)
+        if covered_end_time < covered_start_time:
+            return
+
+        key_path = self._key_path(connector_name, trading_pair, interval)
+        os.makedirs(key_path, exist_ok=True)
+        with self._lock(key_path):
+            index = self._read_index(connector_name, trading_pair, interval)
+            if index is not None:
+                stored_df = self.read(connector_name, trading_pair, interval)
+                candles_df = pd.concat([stored_df, candles_df[stored_df.columns]])
+                stored_covered_start_time, stored_covered_end_time = self.covered_period(
+                    connector_name, trading_pair, interval)
+                covered_start_time = min(covered_start_time, stored_covered_start_time)
+                covered_end_time = max(covered_end_time, stored_covered_end_time)
+            merged_df = candles_df.drop_duplicates(subset=["timestamp"], keep="last").sort_values("timestamp")
+            if merged_df.empty:
+                merged_df = pd.DataFrame(columns=CandlesBase.columns)
+
+            generation = uuid.uuid4().hex
+            generation_path = os.path.join(key_path, generation)
+            os.makedirs(generation_path)
+            for column in merged_df.columns:
+                np.save(os.path.join(generation_path, f"{column}.npy"), merged_df[column].to_numpy(dtype=float))
+            new_index = {
+                "generation": generation,
+                "columns": list(merged_df.columns),
+                "start_time": int(merged_df["timestamp"].iloc[0]) if len(merged_df) > 0 else None,
+                "end_time": int(merged_df["timestamp"].iloc[-1]) if len(merged_df) > 0 else None,
+                "covered_start_time": int(covered_start_time),
+                "covered_end_time": int(covered_end_time),
+            }
+            temporary_index_path = os.path.join(key_path, f"{self.INDEX_FILE_NAME}.{generation}")
+            with open(temporary_index_path, "w") as index_file:
+                json.dump(new_index, index_file)
+            os.replace(temporary_index_path, os.path.join(key_path, self.INDEX_FILE_NAME))
+
+            # Readers with a previous generation memory-mapped keep their data until they release it. The files
+            # left by interrupted writes are removed as well.
+            for entry in os.listdir(key_path):
+                entry_path = os.path.join(key_path, entry)
+                if entry != generation and os.path.isdir(entry_path):
+                    shutil.rmtree(entry_path, ignore_errors=True)
+                elif entry.startswith(f"{self.INDEX_FILE_NAME}."):
+                    os.remove(entry_path)
+
+    async def get_candles(self, candle_feed: CandlesBase, config: HistoricalCandlesConfig) -> pd.DataFrame:
+        """
+        Returns the candles of the configured period, downloading with the candle feed only the missing periods.
+        """
+        for start_time, end_time in self.missing_periods(config.connector_name, config.trading_pair, config.interval,
+                                                         config.start_time, config.end_time):
+            logger.info(f"Downloading candles for {config.connector_name} {config.trading_pair} {config.interval} "
+                        f"from {start_time} to {end_time}.")
+            candles_df = await candle_feed.get_historical_candles_concurrently(config=HistoricalCandlesConfig(
+                connector_name=config.connector_name,
+                trading_pair=config.trading_pair,
+                interval=config.interval,
+                start_time=start_time,
+                end_time=end_time,
+            ))
+            self.write(config.connector_name, config.trading_pair, config.interval, candles_df,
+                       covered_period=(start_time, end_time))
+        return self.read(config.connector_name, config.trading_pair, config.interval,
+                         config.start_time, config.end_time)
@@ -1,8 +1,9 @@
 from decimal import Decimal
-from typing import Union
+from typing import Dict, Mapping, Optional, Union
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
 
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
@@ -15,6 +16,9 @@ class ExecutorSimulation(BaseModel):
     config: Union[PositionExecutorConfig, DCAExecutorConfig]
     executor_simulation: pd.DataFrame
     close_type: CloseType
+    _columns: Optional[Dict[str, np.ndarray]] = PrivateAttr(default=None)
+    _last_timestamp: Optional[float] = PrivateAttr(default=None)
+    _position: int = PrivateAttr(default=-1)
 
     class Config:
         arbitrary_types_allowed = True  # Allow arbitrary types
@@ -26,9 +30,8 @@ class ExecutorSimulation(BaseModel):
         return v
 
     def get_executor_info_at_timestamp(self, timestamp: float) -> ExecutorInfo:
-        # Filter the DataFrame up to the specified timestamp
-        df_up_to_timestamp = self.executor_simulation[self.executor_simulation['timestamp'] <= timestamp]
-        if df_up_to_timestamp.empty:
+        position = self._position_at_timestamp(timestamp)
+        if position < 0:
             return ExecutorInfo(
                 id=self.config.id,
                 timestamp=self.config.timestamp,
@@ -44,8 +47,8 @@ class ExecutorSimulation(BaseModel):
                 custom_info={}
             )
 
-        last_entry = df_up_to_timestamp.iloc[-1]
-        is_active = last_entry['timestamp'] < self.executor_simulation['timestamp'].max()
+        last_entry = {column: values[position] for column, values in self._columns.items()}
+        is_active = last_entry['timestamp'] < self._last_timestamp
         return ExecutorInfo(
             id=self.config.id,
             timestamp=self.config.timestamp,
@@ -63,7 +66,28 @@ class ExecutorSimulation(BaseModel):
             custom_info=self.get_custom_info(last_entry)
         )
 
-    def get_custom_info(self, last_entry: pd.Series) -> dict:
+    def _position_at_timestamp(self, timestamp: float) -> int:
+        """
+        Returns the position of the last simulation row with a timestamp lower or equal than the given one, -1 if
+        there is none. The backtesting loop asks for increasing timestamps, so the position is kept between calls and
+        only moved forward instead of filtering the whole simulation every time.
+        """
+        if self._columns is None:
+            self._columns = {column: self.executor_simulation[column].to_numpy()
+                             for column in self.executor_simulation.columns}
+            timestamps = self._columns["timestamp"]
+            self._last_timestamp = timestamps.max() if len(timestamps) > 0 else None
+        timestamps = self._columns["timestamp"]
+        position = self._position
+        if position >= 0 and timestamps[position] > timestamp:
+            position = int(np.searchsorted(timestamps, timestamp, side="right")) - 1
+        else:
+            while position + 1 < len(timestamps) and timestamps[position + 1] <= timestamp:
+                position += 1
+        self._position = position
+        return position
+
+    def get_custom_info(self, last_entry: Mapping) -> dict:
         current_position_average_price = last_entry['current_position_average_price'] if "current_position_average_price" in last_entry else None
         return {
             "close_price": last_entry['close'],
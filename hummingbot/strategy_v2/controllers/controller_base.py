@@ -10,7 +10,6 @@ from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import BaseClientModel, ClientFieldData
 from hummingbot.core.data_type.trade_fee import TokenAmount
-from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.strategy_v2.models.base import RunnableStatus
@@ -122,6 +121,9 @@ class ControllerBase(RunnableBase):
     """
     Base class for controllers.
     """
+    # Controllers are ticked after the executors so they see their latest state
+    SCHEDULER_PRIORITY = 1
+
     def __init__(self, config: ControllerConfigBase, market_data_provider: MarketDataProvider,
                  actions_queue: asyncio.Queue, update_interval: float = 1.0):
         super().__init__(update_interval=update_interval)
@@ -142,7 +144,7 @@ class ControllerBase(RunnableBase):
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
             self.executors_update_event.set()
-            safe_ensure_future(self.control_loop())
+            self._start_control_loop()
         self.initialize_candles()
 
     def initialize_candles(self):
@@ -1,17 +1,15 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
-    MarketEvent,
     MarketOrderFailureEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
@@ -20,6 +18,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
@@ -48,25 +47,10 @@ class ExecutorBase(RunnableBase):
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
-        # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
-
-        # Pairs of market events and their corresponding event forwarders
-        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
-            (MarketEvent.OrderCancelled, self._cancel_order_forwarder),
-            (MarketEvent.BuyOrderCreated, self._create_buy_order_forwarder),
-            (MarketEvent.SellOrderCreated, self._create_sell_order_forwarder),
-            (MarketEvent.OrderFilled, self._fill_order_forwarder),
-            (MarketEvent.BuyOrderCompleted, self._complete_buy_order_forwarder),
-            (MarketEvent.SellOrderCompleted, self._complete_sell_order_forwarder),
-            (MarketEvent.OrderFailure, self._failed_order_forwarder),
-        ]
+        # Routers that deliver the order events of each connector only to the executor that placed the order
+        self._order_event_routers: Dict[str, OrderEventRouter] = {
+            connector_name: OrderEventRouter.for_connector(connector)
+            for connector_name, connector in self.connectors.items()}
 
     @property
     def status(self):
@@ -245,19 +229,17 @@ class ExecutorBase(RunnableBase):
 
     def register_events(self):
         """
-        Registers the events with the connectors.
+        Registers the executor in the order event routers of the connectors.
         """
-        for connector in self.connectors.values():
-            for event_pair in self._event_pairs:
-                connector.add_listener(event_pair[0], event_pair[1])
+        for router in self._order_event_routers.values():
+            router.add_executor(self)
 
     def unregister_events(self):
         """
-        Unregisters the events from the connectors.
+        Unregisters the executor from the order event routers of the connectors.
         """
-        for connector in self.connectors.values():
-            for event_pair in self._event_pairs:
-                connector.remove_listener(event_pair[0], event_pair[1])
+        for router in self._order_event_routers.values():
+            router.remove_executor(self)
 
     def adjust_order_candidates(self, exchange: str, order_candidates: List[OrderCandidate]) -> List[OrderCandidate]:
         """
@@ -287,9 +269,13 @@ class ExecutorBase(RunnableBase):
         :return: The result of the order placement.
         """
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        router = self._order_event_routers.get(connector_name)
+        if router is not None:
+            router.register_order(executor=self, order_id=order_id)
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         """
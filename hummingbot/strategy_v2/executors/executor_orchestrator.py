@@ -2,7 +2,7 @@ import logging
 import uuid
 from copy import deepcopy
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from pydantic.main import BaseModel
 
@@ -31,6 +31,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
 )
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
 
 
 class PositionSummary(BaseModel):
@@ -107,9 +108,11 @@ class ExecutorOrchestrator:
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0):
+    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0,
+                 scheduler: Optional[RunnableScheduler] = None):
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
+        self.scheduler = scheduler
         self.active_executors = {}
         self.archived_executors = {}
         self.positions_held = {}
@@ -243,6 +246,7 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.scheduler = self.scheduler
         executor.start()
         self.active_executors[controller_id].append(executor)
         # MarketsRecorder.get_instance().store_or_update_executor(executor)
@@ -0,0 +1,112 @@
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+from weakref import WeakKeyDictionary
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+
+
+class OrderEventRouter:
+    """
+    Delivers the order events of a connector to the executors using it.
+
+    There is a single router per connector, registered as the only executors listener of the order events. The router
+    indexes the executors by the client order id of the orders they place, so each event is delivered only to the
+    executor that owns the order. The events of orders with an unknown id (e.g. created before the id was registered,
+    or placed outside the executors) are delivered to all the executors, as the connector listeners would do.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _routers: "WeakKeyDictionary[ConnectorBase, OrderEventRouter]" = WeakKeyDictionary()
+
+    EVENT_HANDLERS: Dict[MarketEvent, str] = {
+        MarketEvent.OrderCancelled: "process_order_canceled_event",
+        MarketEvent.BuyOrderCreated: "process_order_created_event",
+        MarketEvent.SellOrderCreated: "process_order_created_event",
+        MarketEvent.OrderFilled: "process_order_filled_event",
+        MarketEvent.BuyOrderCompleted: "process_order_completed_event",
+        MarketEvent.SellOrderCompleted: "process_order_completed_event",
+        MarketEvent.OrderFailure: "process_order_failed_event",
+    }
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def for_connector(cls, connector: ConnectorBase) -> "OrderEventRouter":
+        """
+        Returns the router of the connector, creating it the first time.
+        """
+        router = cls._routers.get(connector)
+        if router is None:
+            router = cls(connector=connector)
+            cls._routers[connector] = router
+        return router
+
+    def __init__(self, connector: ConnectorBase):
+        self._connector = connector
+        self._handlers: Dict[int, str] = {event.value: handler for event, handler in self.EVENT_HANDLERS.items()}
+        self._event_forwarder = SourceInfoEventForwarder(self._route_event)
+        # Executors in subscription order, with the ids of the orders they own
+        self._executors: Dict["ExecutorBase", Set[str]] = {}
+        self._executors_by_order_id: Dict[str, "ExecutorBase"] = {}
+
+    @property
+    def executors_count(self) -> int:
+        return len(self._executors)
+
+    def add_executor(self, executor: "ExecutorBase"):
+        """
+        Subscribes the executor to the order events. The router starts listening to the connector with the first one.
+        """
+        if executor in self._executors:
+            return
+        if len(self._executors) == 0:
+            for event in self.EVENT_HANDLERS:
+                self._connector.add_listener(event, self._event_forwarder)
+        self._executors[executor] = set()
+
+    def remove_executor(self, executor: "ExecutorBase"):
+        """
+        Unsubscribes the executor and forgets its orders. The router stops listening when no executor is left.
+        """
+        order_ids = self._executors.pop(executor, None)
+        if order_ids is None:
+            return
+        for order_id in order_ids:
+            if self._executors_by_order_id.get(order_id) is executor:
+                del self._executors_by_order_id[order_id]
+        if len(self._executors) == 0:
+            for event in self.EVENT_HANDLERS:
+                self._connector.remove_listener(event, self._event_forwarder)
+
+    def register_order(self, executor: "ExecutorBase", order_id: str):
+        """
+        Registers the executor as the owner of the order, so only it receives the order events.
+        """
+        order_ids = self._executors.get(executor)
+        if order_ids is not None:
+            order_ids.add(order_id)
+            self._executors_by_order_id[order_id] = executor
+
+    def _route_event(self, event_tag: int, market: ConnectorBase, event: Any):
+        handler = self._handlers.get(event_tag)
+        if handler is None:
+            return
+        executor = self._executors_by_order_id.get(getattr(event, "order_id", None))
+        if executor is not None:
+            getattr(executor, handler)(event_tag, market, event)
+        else:
+            for executor in list(self._executors):
+                try:
+                    getattr(executor, handler)(event_tag, market, event)
+                except Exception:
+                    self.logger().error(f"Unexpected error while processing event {event_tag} in executor "
+                                        f"{executor.config.id}.", exc_info=True)
@@ -1,11 +1,15 @@
 import asyncio
 import logging
 from abc import ABC
+from typing import TYPE_CHECKING, Optional
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
+
 
 class RunnableBase(ABC):
     """
@@ -13,6 +17,8 @@ class RunnableBase(ABC):
     This class provides a basic structure for components that need to perform tasks at regular intervals.
     """
     _logger = None
+    # Order in which the shared scheduler ticks the runnables with the same update interval (lower first)
+    SCHEDULER_PRIORITY = 0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -29,6 +35,8 @@ class RunnableBase(ABC):
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
         self.terminated = asyncio.Event()
+        # Shared scheduler that executes the control task when set before starting, instead of the own control loop
+        self.scheduler: Optional["RunnableScheduler"] = None
 
     @property
     def status(self):
@@ -47,6 +55,15 @@ class RunnableBase(ABC):
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
+            self._start_control_loop()
+
+    def _start_control_loop(self):
+        """
+        Registers the smart component in the shared scheduler, or starts its own control loop if there is none.
+        """
+        if self.scheduler is not None:
+            self.scheduler.add(self)
+        else:
             safe_ensure_future(self.control_loop())
 
     def stop(self):
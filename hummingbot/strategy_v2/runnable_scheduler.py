@@ -0,0 +1,172 @@
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+@dataclass
+class RunnableTickStats:
+    """
+    Execution times (in seconds) of the control task of a runnable ticked by the scheduler.
+    """
+    ticks: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    last_time: float = 0.0
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.ticks if self.ticks > 0 else 0.0
+
+    def record(self, elapsed: float):
+        self.ticks += 1
+        self.total_time += elapsed
+        self.last_time = elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+
+class _IntervalGroup:
+    """
+    Runnables that share the same update interval, by scheduler priority.
+    """
+    __slots__ = ("interval", "runnables", "skipped_ticks", "task")
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.runnables: Dict[int, List["RunnableBase"]] = {}
+        self.skipped_ticks = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def add(self, runnable: "RunnableBase"):
+        self.runnables.setdefault(runnable.SCHEDULER_PRIORITY, []).append(runnable)
+
+    def is_empty(self) -> bool:
+        return all(len(runnables) == 0 for runnables in self.runnables.values())
+
+
+class RunnableScheduler:
+    """
+    Shared scheduler for the control tasks of the runnables (executors and controllers), used instead of a control
+    loop task with its own timer per runnable.
+
+    The runnables with the same update interval are ticked together, by priority classes: the classes are executed
+    one after the other in ascending SCHEDULER_PRIORITY (executors before controllers), and the control tasks of the
+    same class run concurrently. When a batch lasts longer than the interval the missed ticks are skipped instead of
+    executed one after the other. The execution time of each control task is recorded in its RunnableTickStats.
+    """
+    def __init__(self):
+        self._groups: Dict[float, _IntervalGroup] = {}
+        self._stats: Dict["RunnableBase", RunnableTickStats] = {}
+
+    @property
+    def runnables_count(self) -> int:
+        return len(self._stats)
+
+    def stats(self, runnable: "RunnableBase") -> Optional[RunnableTickStats]:
+        return self._stats.get(runnable)
+
+    def skipped_ticks(self, update_interval: float) -> int:
+        group = self._groups.get(update_interval)
+        return group.skipped_ticks if group is not None else 0
+
+    def add(self, runnable: "RunnableBase"):
+        """
+        Registers the runnable. Its on_start method is executed right away, and the control task is executed in the
+        ticks of its update interval until the runnable is terminated. Then its on_stop method is executed.
+        """
+        if runnable in self._stats:
+            return
+        self._stats[runnable] = RunnableTickStats()
+        safe_ensure_future(self._start_runnable(runnable))
+
+    def stop(self):
+        """
+        Stops ticking all the registered runnables.
+        """
+        for group in self._groups.values():
+            if group.task is not None:
+                group.task.cancel()
+        self._groups.clear()
+        self._stats.clear()
+
+    def _time(self) -> float:
+        return time.time()
+
+    async def _start_runnable(self, runnable: "RunnableBase"):
+        try:
+            await runnable.on_start()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            runnable.logger().error(e, exc_info=True)
+            self._stats.pop(runnable, None)
+            return
+
+        if runnable not in self._stats:
+            # The scheduler was stopped while the runnable was starting
+            return
+        group = self._groups.get(runnable.update_interval)
+        if group is None:
+            group = _IntervalGroup(interval=runnable.update_interval)
+            self._groups[runnable.update_interval] = group
+            group.add(runnable)
+            group.task = safe_ensure_future(self._interval_loop(group))
+        else:
+            group.add(runnable)
+
+    async def _interval_loop(self, group: _IntervalGroup):
+        next_tick = self._time()
+        while True:
+            await self._tick(group)
+            if group.is_empty():
+                break
+            now = self._time()
+            next_tick += group.interval
+            if next_tick < now:
+                skipped_ticks = math.ceil((now - next_tick) / group.interval)
+                group.skipped_ticks += skipped_ticks
+                next_tick += skipped_ticks * group.interval
+            await asyncio.sleep(next_tick - now)
+        if self._groups.get(group.interval) is group:
+            del self._groups[group.interval]
+
+    async def _tick(self, group: _IntervalGroup):
+        for priority in sorted(group.runnables):
+            active_runnables = []
+            for runnable in group.runnables[priority]:
+                if runnable.terminated.is_set():
+                    self._finish_runnable(runnable)
+                else:
+                    active_runnables.append(runnable)
+            # Runnables added while this batch runs are appended to the new list
+            group.runnables[priority] = active_runnables
+            if len(active_runnables) > 0:
+                await asyncio.gather(*[self._tick_runnable(runnable) for runnable in active_runnables])
+
+    async def _tick_runnable(self, runnable: "RunnableBase"):
+        stats = self._stats.get(runnable)
+        start = time.perf_counter()
+        try:
+            await runnable.control_task()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            runnable.logger().error(e, exc_info=True)
+            if stats is not None:
+                stats.errors += 1
+        if stats is not None:
+            stats.record(time.perf_counter() - start)
+
+    def _finish_runnable(self, runnable: "RunnableBase"):
+        self._stats.pop(runnable, None)
+        try:
+            runnable.on_stop()
+        except Exception as e:
+            runnable.logger().error(e, exc_info=True)
@@ -0,0 +1,92 @@
+"""
+Compares the memory usage and the `candles_df` latency of the deque based candles storage and the ring buffer storage
+used by CandlesBase.
+
+Usage:
+    python -m test.benchmarks.benchmark_candles_storage [--feeds 50] [--max-records 5000] [--ticks 200]
+
+Each tick updates the last candle of every feed (or appends a new one every `--new-candle-every` ticks) and reads the
+candles DataFrame of every feed, like controllers do in `update_processed_data`.
+"""
+import argparse
+import time
+import tracemalloc
+from collections import deque
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+COLUMNS = CandlesBase.columns
+
+
+class DequeStorage:
+    def __init__(self, max_records: int):
+        self.candles = deque(maxlen=max_records)
+
+    def candles_df(self) -> pd.DataFrame:
+        return pd.DataFrame(self.candles, columns=COLUMNS, dtype=float)
+
+
+class RingBufferStorage:
+    def __init__(self, max_records: int):
+        self.candles = CandlesRingBuffer(maxlen=max_records, columns=len(COLUMNS))
+        self._cache = None
+        self._version = -1
+
+    def candles_df(self) -> pd.DataFrame:
+        # Same caching logic as CandlesBase.candles_df
+        if self._version != self.candles.version:
+            self._cache = pd.DataFrame(self.candles.values, columns=COLUMNS, dtype=float)
+            self._version = self.candles.version
+        return self._cache.copy()
+
+
+def candle(timestamp: float) -> np.ndarray:
+    return np.array([timestamp, 100., 101., 99., 100.5, 10., 1000., 5., 4., 400.])
+
+
+def run(name: str, storage_factory: Callable, feeds: int, max_records: int, ticks: int, new_candle_every: int):
+    tracemalloc.start()
+    storages: List = [storage_factory(max_records) for _ in range(feeds)]
+    for storage in storages:
+        storage.candles.extend(candle(timestamp * 60.) for timestamp in range(max_records))
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = []
+    timestamp = max_records * 60.
+    for tick in range(ticks):
+        if tick % new_candle_every == 0:
+            timestamp += 60.
+            for storage in storages:
+                storage.candles.append(candle(timestamp))
+        else:
+            for storage in storages:
+                storage.candles[-1] = candle(timestamp)
+        start = time.perf_counter()
+        for storage in storages:
+            storage.candles_df()
+        latencies.append(time.perf_counter() - start)
+
+    print(f"{name:<12} memory: {memory / 1024 ** 2:8.1f} MiB | candles_df for {feeds} feeds: "
+          f"mean {np.mean(latencies) * 1e3:8.2f} ms, p99 {np.percentile(latencies, 99) * 1e3:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--feeds", type=int, default=50)
+    parser.add_argument("--max-records", type=int, default=5000)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--new-candle-every", type=int, default=60)
+    args = parser.parse_args()
+
+    for name, factory in (("deque", DequeStorage), ("ring buffer", RingBufferStorage)):
+        run(name, factory, args.feeds, args.max_records, args.ticks, args.new_candle_every)
+
+
+if __name__ == "__main__":
+    main()
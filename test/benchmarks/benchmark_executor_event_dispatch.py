@@ -0,0 +1,84 @@
+"""
+Measures the cost of delivering order fill events to the strategy v2 executors as the number of executors grows.
+
+Usage:
+    python -m test.benchmarks.benchmark_executor_event_dispatch [--events 10000] [--executors 10 100 400]
+
+Compares the executors registering their own listeners in the connector, where every event is delivered to every
+executor and each one checks if the order is its own, with the OrderEventRouter, that delivers each event only to the
+executor that placed the order.
+"""
+import argparse
+import time
+from decimal import Decimal
+from typing import List
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
+
+
+class BenchmarkExecutor:
+    """
+    Executor stand-in that, like the real ones, ignores the events of orders it did not place
+    """
+
+    def __init__(self, order_id: str):
+        self.order_id = order_id
+        self.fills = 0
+        self.fill_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
+
+    def process_order_filled_event(self, event_tag: int, market: PubSub, event: OrderFilledEvent):
+        if event.order_id == self.order_id:
+            self.fills += 1
+
+
+def fill_events(executors: List[BenchmarkExecutor], events: int) -> List[OrderFilledEvent]:
+    return [OrderFilledEvent(
+        timestamp=1700000000,
+        order_id=executors[i % len(executors)].order_id,
+        trading_pair="ETH-USDT",
+        trade_type=TradeType.BUY,
+        order_type=OrderType.LIMIT,
+        price=Decimal("1000"),
+        amount=Decimal("1"),
+        trade_fee=AddedToCostTradeFee(percent=Decimal("0.001")),
+    ) for i in range(events)]
+
+
+def run(name: str, connector: PubSub, events: List[OrderFilledEvent], executors_count: int):
+    start = time.perf_counter()
+    for event in events:
+        connector.trigger_event(MarketEvent.OrderFilled, event)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<20} {executors_count:>6} executors {elapsed / len(events) * 1e6:>10.1f} us/event")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=10000, help="Number of fill events to dispatch")
+    parser.add_argument("--executors", type=int, nargs="+", default=[10, 100, 400], help="Numbers of executors")
+    args = parser.parse_args()
+
+    for executors_count in args.executors:
+        executors = [BenchmarkExecutor(order_id=f"OID-{i}") for i in range(executors_count)]
+        events = fill_events(executors, args.events)
+
+        connector = PubSub()
+        for executor in executors:
+            connector.add_listener(MarketEvent.OrderFilled, executor.fill_forwarder)
+        run("Listener per executor", connector, events, executors_count)
+
+        connector = PubSub()
+        router = OrderEventRouter.for_connector(connector)
+        for executor in executors:
+            router.add_executor(executor)
+            router.register_order(executor=executor, order_id=executor.order_id)
+        run("OrderEventRouter", connector, events, executors_count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Compares the cost of storing the tracking states of a market on every order event as a full snapshot (what
+MarketsRecorder did before) and as a journal of the changes of single orders, and the time to restore them.
+
+Usage:
+    python -m test.benchmarks.benchmark_market_states [--open-orders 1000] [--events 2000]
+
+The market keeps `--open-orders` orders open: each event fills an order, or cancels one and creates a new one. The
+records are written by the write behind queue to an SQLite database in a temporary directory.
+"""
+import argparse
+import os
+import random
+import time
+from decimal import Decimal
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, Optional
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+CONFIG_FILE_PATH = "benchmark_config.yml"
+
+
+class BenchmarkMarket:
+    display_name = "benchmark_exchange"
+
+    def __init__(self):
+        self.orders: Dict[str, InFlightOrder] = {}
+        self._order_count = 0
+
+    @property
+    def tracking_states(self) -> Dict[str, Any]:
+        return {order_id: order.to_json() for order_id, order in self.orders.items()}
+
+    def tracking_state(self, order_id: str) -> Optional[Dict[str, Any]]:
+        order = self.orders.get(order_id)
+        return order.to_json() if order is not None else None
+
+    def restore_tracking_states(self, saved_states: Dict[str, Any]):
+        self.orders = {order_id: InFlightOrder.from_json(order_json) for order_id, order_json in saved_states.items()}
+
+    def add_trade_fills_from_market_recorder(self, _):
+        pass
+
+    def add_exchange_order_ids_from_market_recorder(self, _):
+        pass
+
+    def create_order(self) -> str:
+        self._order_count += 1
+        order_id = f"OID-{self._order_count}"
+        self.orders[order_id] = InFlightOrder(client_order_id=order_id,
+                                              trading_pair="COINALPHA-HBOT",
+                                              order_type=OrderType.LIMIT,
+                                              trade_type=TradeType.BUY,
+                                              amount=Decimal("10"),
+                                              creation_timestamp=time.time(),
+                                              price=Decimal("100"),
+                                              exchange_order_id=f"EOID-{self._order_count}")
+        return order_id
+
+
+def create_recorder(db_path: str) -> MarketsRecorder:
+    sql = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path=db_path)
+    return MarketsRecorder(sql=sql,
+                           markets=[],
+                           config_file_path=CONFIG_FILE_PATH,
+                           strategy_name="benchmark",
+                           market_data_collection=MarketDataCollectionConfigMap(market_data_collection_enabled=False))
+
+
+def run(name: str, journal: bool, open_orders: int, events: int):
+    random.seed(42)
+    with TemporaryDirectory() as directory:
+        recorder = create_recorder(os.path.join(directory, "benchmark.sqlite"))
+        recorder.start()
+        market = BenchmarkMarket()
+        for _ in range(open_orders):
+            market.create_order()
+        recorder._snapshot_market_states(market)
+        recorder.flush()
+
+        event_time = 0.0
+        start = time.perf_counter()
+        for _ in range(events):
+            event_start = time.perf_counter()
+            order_id = random.choice(list(market.orders))
+            if random.random() < 0.5:
+                market.orders[order_id].executed_amount_base += Decimal("0.1")
+                changed_order_ids = [order_id]
+            else:
+                del market.orders[order_id]
+                changed_order_ids = [order_id, market.create_order()]
+            for changed_order_id in changed_order_ids:
+                if journal:
+                    order_state_update = recorder._record_order_state(market, changed_order_id)
+                    if order_state_update is not None:
+                        recorder._write_queue.submit(lambda session, record=order_state_update: session.add(record))
+                else:
+                    recorder._snapshot_market_states(market)
+            event_time += time.perf_counter() - event_start
+        recorder.flush()
+        total_time = time.perf_counter() - start
+
+        restored_market = BenchmarkMarket()
+        start = time.perf_counter()
+        recorder.restore_market_states(CONFIG_FILE_PATH, restored_market)
+        restore_time = time.perf_counter() - start
+        recorder.stop()
+        assert restored_market.tracking_states == market.tracking_states
+
+    print(f"{name:<10} per event: {event_time / events * 1e3:8.3f} ms on the event loop, "
+          f"{total_time / events * 1e3:8.3f} ms written | restore: {restore_time * 1e3:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--open-orders", type=int, default=1000, help="Number of open orders")
+    parser.add_argument("--events", type=int, default=2000, help="Number of order events")
+    args = parser.parse_args()
+
+    print(f"{args.open_orders} open orders, {args.events} events")
+    run("snapshot", journal=False, open_orders=args.open_orders, events=args.events)
+    run("journal", journal=True, open_orders=args.open_orders, events=args.events)
+
+
+if __name__ == "__main__":
+    main()
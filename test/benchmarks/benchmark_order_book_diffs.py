@@ -0,0 +1,100 @@
+"""
+Measures the throughput (diffs/sec) of the different order book diff ingestion paths.
+
+Usage:
+    python -m test.benchmarks.benchmark_order_book_diffs [--stream recorded_diffs.jsonl] [--messages 50000]
+
+The recorded stream is a JSON lines file where every line has the ``update_id``, ``bids`` and ``asks`` keys, with the
+levels in the exchange format (``[["price", "amount"], ...]``). When no stream is provided a Binance-like stream is
+generated with a fixed seed.
+"""
+import argparse
+import json
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+def generate_stream(messages: int, levels_per_side: int = 20, seed: int = 42) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    mid_price = 30000.0
+    stream = []
+    for update_id in range(1, messages + 1):
+        mid_price += rng.uniform(-0.5, 0.5)
+        bids = [[f"{mid_price - 0.01 * rng.randint(1, 500):.2f}",
+                 "0" if rng.random() < 0.2 else f"{rng.uniform(0.001, 5):.5f}"]
+                for _ in range(rng.randint(1, levels_per_side))]
+        asks = [[f"{mid_price + 0.01 * rng.randint(1, 500):.2f}",
+                 "0" if rng.random() < 0.2 else f"{rng.uniform(0.001, 5):.5f}"]
+                for _ in range(rng.randint(1, levels_per_side))]
+        stream.append({"update_id": update_id, "bids": bids, "asks": asks})
+    return stream
+
+
+def load_stream(path: str) -> List[Dict[str, Any]]:
+    with open(path) as stream_file:
+        return [json.loads(line) for line in stream_file if line.strip()]
+
+
+def initial_order_book(stream: List[Dict[str, Any]]) -> OrderBook:
+    order_book = OrderBook()
+    first_message = stream[0]
+    order_book.apply_snapshot(
+        [OrderBookRow(float(price), float(amount), 0) for price, amount, *_ in first_message["bids"]],
+        [OrderBookRow(float(price), float(amount), 0) for price, amount, *_ in first_message["asks"]],
+        0)
+    return order_book
+
+
+def run(name: str, stream: List[Dict[str, Any]], apply_function: Callable[[OrderBook, Any], None], inputs: List[Any]):
+    order_book = initial_order_book(stream)
+    start = time.perf_counter()
+    for message_input in inputs:
+        apply_function(order_book, message_input)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40} {len(inputs) / elapsed:>14,.0f} diffs/sec ({elapsed:.3f} s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stream", type=str, default=None, help="JSON lines file with recorded diff messages")
+    parser.add_argument("--messages", type=int, default=50000, help="Number of generated messages")
+    args = parser.parse_args()
+
+    stream = load_stream(args.stream) if args.stream else generate_stream(args.messages)
+    messages = [
+        OrderBookMessage(OrderBookMessageType.DIFF, {**content, "trading_pair": "BTC-USDT"}, 0)
+        for content in stream
+    ]
+    arrays = [
+        (np.array([float(bid[0]) for bid in content["bids"]]),
+         np.array([float(bid[1]) for bid in content["bids"]]),
+         np.array([float(ask[0]) for ask in content["asks"]]),
+         np.array([float(ask[1]) for ask in content["asks"]]),
+         content["update_id"])
+        for content in stream
+    ]
+
+    print(f"{len(stream)} diff messages")
+    run("OrderBookRow lists (apply_diffs)",
+        stream,
+        lambda order_book, msg: order_book.apply_diffs(msg.bids, msg.asks, msg.update_id),
+        messages)
+    run("Raw levels (apply_raw_diffs)",
+        stream,
+        lambda order_book, msg: order_book.apply_raw_diffs(msg.raw_bids, msg.raw_asks, msg.update_id),
+        messages)
+    run("Pre-parsed arrays (apply_diff_arrays)",
+        stream,
+        lambda order_book, diff_arrays: order_book.apply_diff_arrays(*diff_arrays),
+        arrays)
+
+
+if __name__ == "__main__":
+    main()
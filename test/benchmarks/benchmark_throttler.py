@@ -0,0 +1,63 @@
+"""
+Measures the overhead of the throttlers when the rate limit window is filled at 10k requests per minute.
+
+Usage:
+    python -m test.benchmarks.benchmark_throttler [--requests 10000] [--skip-async-throttler]
+
+Every request is associated to an endpoint limit linked to a shared pool limit (like most exchange connectors), and
+all of them fit in the window, so the measured time is the cost of checking and recording the capacity. The
+AsyncThrottler cost grows with the number of requests already in the window, use --skip-async-throttler to only
+measure the SlidingWindowThrottler with big numbers of requests.
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+
+POOL_LIMIT_ID = "REQUEST_WEIGHT"
+ENDPOINTS = ["/order", "/openOrders", "/account", "/depth"]
+
+
+def rate_limits(requests_per_minute: int) -> List[RateLimit]:
+    limits = [RateLimit(limit_id=POOL_LIMIT_ID, limit=requests_per_minute * 2, time_interval=60)]
+    limits.extend(RateLimit(limit_id=endpoint, limit=requests_per_minute, time_interval=60,
+                            linked_limits=[LinkedLimitWeightPair(POOL_LIMIT_ID, 2)])
+                  for endpoint in ENDPOINTS)
+    return limits
+
+
+async def execute_requests(throttler: AsyncThrottlerBase, requests: int):
+    async def request(endpoint: str):
+        async with throttler.execute_task(limit_id=endpoint):
+            pass
+
+    await asyncio.gather(*[request(ENDPOINTS[i % len(ENDPOINTS)]) for i in range(requests)])
+
+
+def run(name: str, throttler: AsyncThrottlerBase, requests: int):
+    start = time.perf_counter()
+    asyncio.get_event_loop().run_until_complete(execute_requests(throttler, requests))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<25} {requests / elapsed:>12,.0f} requests/sec ({elapsed:.3f} s, "
+          f"{elapsed / requests * 1e6:.1f} us/request)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=10000, help="Number of requests in the one minute window")
+    parser.add_argument("--skip-async-throttler", action="store_true", help="Do not measure the AsyncThrottler")
+    args = parser.parse_args()
+
+    print(f"{args.requests} requests per minute")
+    run("SlidingWindowThrottler", SlidingWindowThrottler(rate_limits=rate_limits(args.requests)), args.requests)
+    if not args.skip_async_throttler:
+        run("AsyncThrottler", AsyncThrottler(rate_limits=rate_limits(args.requests)), args.requests)
+
+
+if __name__ == "__main__":
+    main()
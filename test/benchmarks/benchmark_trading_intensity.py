@@ -0,0 +1,103 @@
+"""
+Compares the estimators of TradingIntensityIndicator: the time spent in calculate() on the event loop and the
+(alpha, kappa) estimates, against the nonlinear fit run on every tick.
+
+Usage:
+    python -m test.benchmarks.benchmark_trading_intensity [--ticks 2000] [--sampling-length 200]
+
+The trades are generated from the exponential arrival model with known parameters, with a fixed seed.
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+
+MID_PRICE = 100.0
+PRICE_STEP = 0.01
+
+
+class FixedPriceDelegate:
+    def get_price_by_type(self, _):
+        return MID_PRICE
+
+
+def generate_trades(ticks: int, alpha: float, kappa: float, seed: int = 42) -> List[List[OrderBookTradeEvent]]:
+    rng = np.random.default_rng(seed)
+    trades = []
+    for tick in range(ticks):
+        price_levels = np.round(rng.exponential(1 / kappa, rng.integers(1, 10)) / PRICE_STEP) * PRICE_STEP
+        trades.append([
+            OrderBookTradeEvent(trading_pair="COINALPHA-HBOT",
+                                timestamp=tick + 1,
+                                type=TradeType.SELL,
+                                price=MID_PRICE - price_level,
+                                amount=alpha * rng.uniform(0.5, 1.5) / 10)
+            for price_level in price_levels
+        ])
+    return trades
+
+
+def run(name: str,
+        trades: List[List[OrderBookTradeEvent]],
+        sampling_length: int,
+        estimator: str = "curve_fit",
+        refit_executor: Optional[ThreadPoolExecutor] = None) -> List[Tuple[float, float]]:
+    indicator = TradingIntensityIndicator(OrderBook(), FixedPriceDelegate(), sampling_length,
+                                          estimator=estimator, refit_executor=refit_executor)
+    indicator.last_quotes = [{"timestamp": 0, "price": MID_PRICE}]
+    elapsed_times = []
+    values = []
+    for tick, tick_trades in enumerate(trades):
+        for trade in tick_trades:
+            indicator.register_trade(trade)
+        start = time.perf_counter()
+        indicator.calculate(tick + 1)
+        elapsed_times.append(time.perf_counter() - start)
+        values.append(indicator.current_value)
+    if refit_executor is not None:
+        refit_executor.shutdown(wait=True)
+        values[-1] = indicator.current_value
+    elapsed_times = np.array(elapsed_times) * 1e3
+    print(f"{name:<28} calculate: {elapsed_times.mean():8.3f} ms average {elapsed_times.max():8.3f} ms max, "
+          f"final alpha {values[-1][0]:.4f} kappa {values[-1][1]:.4f}")
+    return values
+
+
+def compare(name: str, values: List[Tuple[float, float]], reference: List[Tuple[float, float]], sampling_length: int):
+    # Only the ticks where both have estimates, once the sampling buffer is full
+    pairs = [(value, reference_value)
+             for value, reference_value in zip(values[sampling_length:], reference[sampling_length:])
+             if value[0] > 0 and reference_value[0] > 0]
+    alpha_errors = [abs(value[0] / reference_value[0] - 1) for value, reference_value in pairs]
+    kappa_errors = [abs(value[1] / reference_value[1] - 1) for value, reference_value in pairs]
+    print(f"{name:<28} relative difference with curve_fit: alpha {np.mean(alpha_errors):.2%} average "
+          f"{np.max(alpha_errors):.2%} max, kappa {np.mean(kappa_errors):.2%} average {np.max(kappa_errors):.2%} max")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=2000, help="Number of ticks")
+    parser.add_argument("--sampling-length", type=int, default=200, help="Sampling length of the indicators")
+    parser.add_argument("--alpha", type=float, default=2.0, help="Alpha of the generated trades")
+    parser.add_argument("--kappa", type=float, default=5.0, help="Kappa of the generated trades")
+    args = parser.parse_args()
+
+    trades = generate_trades(args.ticks, args.alpha, args.kappa)
+    print(f"{args.ticks} ticks, {sum(len(tick_trades) for tick_trades in trades)} trades")
+    reference = run("curve_fit", trades, args.sampling_length)
+    log_linear = run("log_linear", trades, args.sampling_length, estimator="log_linear")
+    background = run("curve_fit (background)", trades, args.sampling_length,
+                     refit_executor=ThreadPoolExecutor(max_workers=1))
+    compare("log_linear", log_linear, reference, args.sampling_length)
+    compare("curve_fit (background)", background, reference, args.sampling_length)
+
+
+if __name__ == "__main__":
+    main()
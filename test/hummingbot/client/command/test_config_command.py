@@ -95,10 +95,12 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ other_commands_timeout          | 30                   |\n"
                            "    | tables_format                     | psql                 |\n"
                            "    | tick_size                         | 1.0                  |\n"
+                           "    | clock_min_wake_interval           | 0.0                  |\n"
                            "    | market_data_collection            |                      |\n"
                            "    | ∟ market_data_collection_enabled  | False                |\n"
                            "    | ∟ market_data_collection_interval | 60                   |\n"
                            "    | ∟ market_data_collection_depth    | 20                   |\n"
+                           "    | ∟ market_data_collection_format   | database             |\n"
                            "    +-----------------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
@@ -22,6 +22,7 @@ from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_derivat
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -1644,11 +1645,12 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
     @aioresponses()
     def test_cancel_all_successful(self, mocked_api):
         url = web_utils.private_rest_url(
-            CONSTANTS.ORDER_URL, domain=self.domain
+            CONSTANTS.BATCH_ORDERS_URL, domain=self.domain
         )
         regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
 
-        cancel_response = {"code": 200, "msg": "success", "status": "CANCELED"}
+        cancel_response = [{"clientOrderId": "OID1", "orderId": 8886774, "status": "CANCELED"},
+                           {"clientOrderId": "OID2", "orderId": 8886775, "status": "CANCELED"}]
         mocked_api.delete(regex_url, body=json.dumps(cancel_response))
 
         self.exchange.start_tracking_order(
@@ -1689,11 +1691,11 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
     def test_cancel_all_unknown_order(self, req_mock):
         self._simulate_trading_rules_initialized()
         url = web_utils.private_rest_url(
-            CONSTANTS.ORDER_URL, domain=self.domain
+            CONSTANTS.BATCH_ORDERS_URL, domain=self.domain
         )
         regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
 
-        cancel_response = {"code": -2011, "msg": "Unknown order sent."}
+        cancel_response = [{"code": -2011, "msg": "Unknown order sent."}]
         req_mock.delete(regex_url, body=json.dumps(cancel_response))
 
         self.exchange.start_tracking_order(
@@ -1719,9 +1721,8 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
         self.assertEqual("OID1", cancellation_results[0].order_id)
 
         self.assertTrue(self._is_logged(
-            "DEBUG",
-            "The order OID1 does not exist on Binance Perpetuals. "
-            "No cancelation needed."
+            "WARNING",
+            "Failed to cancel order OID1 (order not found)"
         ))
 
         self.assertTrue("OID1" in self.exchange._order_tracker._order_not_found_records)
@@ -1729,7 +1730,7 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
     @aioresponses()
     def test_cancel_all_exception(self, req_mock):
         url = web_utils.private_rest_url(
-            CONSTANTS.ORDER_URL, domain=self.domain
+            CONSTANTS.BATCH_ORDERS_URL, domain=self.domain
         )
         regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
 
@@ -1764,6 +1765,106 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
 
         self.assertTrue("OID1" in self.exchange._order_tracker._in_flight_orders)
 
+    @aioresponses()
+    def test_cancel_all_sends_the_orders_in_one_request(self, req_mock):
+        url = web_utils.private_rest_url(
+            CONSTANTS.BATCH_ORDERS_URL, domain=self.domain
+        )
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        cancel_response = [{"clientOrderId": "OID1", "orderId": 8886774, "status": "CANCELED"},
+                           {"code": -2011, "msg": "Unknown order sent."}]
+        req_mock.delete(regex_url, body=json.dumps(cancel_response))
+
+        for order_id, exchange_order_id in (("OID1", "8886774"), ("OID2", "8886775")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+                leverage=1,
+                position_action=PositionAction.OPEN,
+            )
+            self.exchange._order_tracker.fetch_order(order_id).current_state = OrderState.OPEN
+
+        cancellation_results = self.async_run_with_timeout(self.exchange.cancel_all(timeout_seconds=1))
+
+        cancel_request = next(((key, value) for key, value in req_mock.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        request_params = cancel_request[1][0].kwargs["params"]
+        self.assertEqual(self.symbol, request_params["symbol"])
+        self.assertEqual(["OID1", "OID2"], json.loads(request_params["origClientOrderIdList"]))
+
+        self.assertEqual([CancellationResult("OID1", True), CancellationResult("OID2", False)], cancellation_results)
+        self.assertEqual(1, len(self.order_cancelled_logger.event_log))
+        self.assertTrue("OID2" in self.exchange._order_tracker._order_not_found_records)
+
+    @aioresponses()
+    def test_batch_order_create(self, req_mock):
+        url = web_utils.private_rest_url(
+            CONSTANTS.BATCH_ORDERS_URL, domain=self.domain
+        )
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        create_response = [{"clientOrderId": "OID1",
+                            "updateTime": int(self.start_timestamp),
+                            "status": "NEW",
+                            "orderId": "8886774"},
+                           {"code": -2019, "msg": "Margin is insufficient."}]
+        req_mock.post(regex_url, body=json.dumps(create_response))
+        self._simulate_trading_rules_initialized()
+
+        orders = [
+            LimitOrder(
+                client_order_id=client_order_id,
+                trading_pair=self.trading_pair,
+                is_buy=is_buy,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=Decimal("10000"),
+                quantity=Decimal("10000"),
+                position=position_action,
+            )
+            for client_order_id, is_buy, position_action in (("OID1", True, PositionAction.OPEN),
+                                                             ("OID2", False, PositionAction.CLOSE))
+        ]
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders))
+
+        create_request = next(((key, value) for key, value in req_mock.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        request_data = create_request[1][0].kwargs["data"]
+        batch_orders = json.loads(request_data["batchOrders"])
+        self.assertEqual(["OID1", "OID2"], [order_params["newClientOrderId"] for order_params in batch_orders])
+        self.assertEqual(["BUY", "SELL"], [order_params["side"] for order_params in batch_orders])
+
+        self.assertEqual("8886774", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual(PositionAction.OPEN, self.exchange.in_flight_orders["OID1"].position)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+
+    def test_batch_order_create_rejects_orders_without_valid_position_action(self):
+        self._simulate_trading_rules_initialized()
+        order = LimitOrder(
+            client_order_id="OID1",
+            trading_pair=self.trading_pair,
+            is_buy=True,
+            base_currency=self.base_asset,
+            quote_currency=self.quote_asset,
+            price=Decimal("10000"),
+            quantity=Decimal("10000"),
+        )
+
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=[order]))
+
+        self.assertNotIn("OID1", self.exchange.in_flight_orders)
+        self.assertTrue(self._is_logged(
+            "ERROR",
+            f"Invalid position action {PositionAction.NIL} for order OID1. "
+            f"Must be one of {self.exchange.VALID_POSITION_ACTIONS}"
+        ))
+
     @aioresponses()
     def test_cancel_order_successful(self, mock_api):
         self._simulate_trading_rules_initialized()
@@ -915,6 +915,141 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
             f"Recreating missing trade in TradeFill: {trade_fill_non_tracked_order}"
         ))
 
+    @aioresponses()
+    def test_update_order_status_requests_the_open_orders_of_the_trading_pair(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+
+        for order_id, exchange_order_id in (("OID1", "100234"), ("OID2", "100235")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        open_order = self.exchange.in_flight_orders["OID1"]
+        canceled_order = self.exchange.in_flight_orders["OID2"]
+
+        trades_url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        regex_url = re.compile(f"^{trades_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(regex_url, body=json.dumps([]), repeat=True)
+
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        regex_url = re.compile(f"^{open_orders_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(regex_url, body=json.dumps([self._order_status_request_open_mock_response(order=open_order)]))
+
+        order_url = self.configure_canceled_order_status_response(order=canceled_order, mock_api=mock_api)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        open_orders_request = self._all_executed_requests(mock_api, open_orders_url)[0]
+        self.validate_auth_credentials_present(open_orders_request)
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                         open_orders_request.kwargs["params"]["symbol"])
+
+        order_requests = self._all_executed_requests(mock_api, order_url)
+        self.assertEqual(1, len(order_requests))
+        self.validate_order_status_request(order=canceled_order, request_call=order_requests[0])
+
+        self.assertEqual(OrderState.OPEN, open_order.current_state)
+        self.assertIn(open_order.client_order_id, self.exchange.in_flight_orders)
+        self.assertNotIn(canceled_order.client_order_id, self.exchange.in_flight_orders)
+
+    @aioresponses()
+    def test_update_orders_fills_requests_the_trades_of_the_trading_pair(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        last_trades_update_timestamp = 1640779990
+        self.exchange._last_trades_update_timestamps[self.trading_pair] = last_trades_update_timestamp
+
+        for order_id, exchange_order_id in (("OID1", "100234"), ("OID2", "100235")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        filled_order = self.exchange.in_flight_orders["OID1"]
+        open_order = self.exchange.in_flight_orders["OID2"]
+
+        trade_of_untracked_order = self._order_fills_request_full_fill_mock_response(order=filled_order)[0].copy()
+        trade_of_untracked_order["id"] = 30001
+        trade_of_untracked_order["orderId"] = 99999
+
+        url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(
+            regex_url,
+            body=json.dumps(self._order_fills_request_full_fill_mock_response(order=filled_order)
+                            + [trade_of_untracked_order]))
+
+        self.async_run_with_timeout(self.exchange._update_orders_fills(orders=[filled_order, open_order]))
+
+        trades_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(trades_requests))
+        request_params = trades_requests[0].kwargs["params"]
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset), request_params["symbol"])
+        self.assertEqual(
+            int((last_trades_update_timestamp - self.exchange.BULK_TRADES_UPDATE_TIME_MARGIN) * 1e3),
+            request_params["startTime"])
+        self.assertEqual(CONSTANTS.MAX_MY_TRADES_LIMIT, request_params["limit"])
+
+        self.assertEqual(filled_order.amount, filled_order.executed_amount_base)
+        self.assertEqual(Decimal("0"), open_order.executed_amount_base)
+        self.assertEqual(1, len(self.order_filled_logger.event_log))
+        self.assertEqual(filled_order.client_order_id, self.order_filled_logger.event_log[0].order_id)
+        self.assertGreater(self.exchange._last_trades_update_timestamps[self.trading_pair],
+                           last_trades_update_timestamp)
+
+    @aioresponses()
+    @patch("hummingbot.connector.exchange.binance.binance_constants.MAX_MY_TRADES_LIMIT", 2)
+    def test_update_orders_fills_requests_the_next_trades_page_when_the_response_is_full(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange._last_trades_update_timestamps[self.trading_pair] = 1640779990
+
+        for order_id, exchange_order_id in (("OID1", "100234"), ("OID2", "100235")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("3"),
+            )
+        filled_order = self.exchange.in_flight_orders["OID1"]
+        open_order = self.exchange.in_flight_orders["OID2"]
+
+        trades = []
+        for trade_id in (30001, 30002, 30003):
+            trade = self._order_fills_request_full_fill_mock_response(order=filled_order)[0].copy()
+            trade["id"] = trade_id
+            trade["qty"] = "1"
+            trade["quoteQty"] = "10000"
+            trades.append(trade)
+
+        url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(regex_url, body=json.dumps(trades[:2]))
+        mock_api.get(regex_url, body=json.dumps(trades[2:]))
+
+        self.async_run_with_timeout(self.exchange._update_orders_fills(orders=[filled_order, open_order]))
+
+        trades_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(2, len(trades_requests))
+        self.assertIn("startTime", trades_requests[0].kwargs["params"])
+        second_request_params = trades_requests[1].kwargs["params"]
+        self.assertNotIn("startTime", second_request_params)
+        self.assertEqual(30003, second_request_params["fromId"])
+        self.assertEqual(2, second_request_params["limit"])
+
+        self.assertEqual(Decimal("3"), filled_order.executed_amount_base)
+        self.assertEqual(3, len(self.order_filled_logger.event_log))
+
     @aioresponses()
     def test_update_order_status_when_failed(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
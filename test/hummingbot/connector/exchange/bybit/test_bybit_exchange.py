@@ -18,6 +18,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -797,17 +798,23 @@ class TestBybitExchange(unittest.TestCase):
         self.assertIn("OID1", self.exchange.in_flight_orders)
         order = self.exchange.in_flight_orders["OID1"]
 
-        url = web_utils.rest_url(CONSTANTS.ORDER_CANCEL_PATH_URL)
+        url = web_utils.rest_url(CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL)
         regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
 
         response = {
             "retCode": 0,
             "retMsg": "OK",
             "result": {
-                "orderId": order.exchange_order_id,
-                "orderLinkId": order.client_order_id
+                "list": [
+                    {
+                        "category": "spot",
+                        "symbol": self.ex_trading_pair,
+                        "orderId": order.exchange_order_id,
+                        "orderLinkId": order.client_order_id
+                    }
+                ]
             },
-            "retExtInfo": {},
+            "retExtInfo": {"list": [{"code": 0, "msg": "OK"}]},
             "time": 1640780000
         }
 
@@ -829,6 +836,58 @@ class TestBybitExchange(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_batch_order_create(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.rest_url(CONSTANTS.BATCH_ORDER_PLACE_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "list": [
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "1001", "orderLinkId": "OID1",
+                     "createAt": "1640780000000"},
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "", "orderLinkId": "OID2",
+                     "createAt": ""},
+                ]
+            },
+            "retExtInfo": {"list": [{"code": 0, "msg": "OK"}, {"code": 170131, "msg": "Insufficient balance."}]},
+            "time": 1640780000000
+        }
+        mock_api.post(regex_url, body=json.dumps(response))
+
+        orders = [
+            LimitOrder(
+                client_order_id=client_order_id,
+                trading_pair=self.trading_pair,
+                is_buy=is_buy,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=Decimal("10000"),
+                quantity=Decimal("100"),
+            )
+            for client_order_id, is_buy in (("OID1", True), ("OID2", False))
+        ]
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders))
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        self._validate_auth_credentials_present(order_request[1][0])
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual("spot", request_data["category"])
+        self.assertEqual(["OID1", "OID2"], [order_data["orderLinkId"] for order_data in request_data["request"]])
+        self.assertEqual([CONSTANTS.SIDE_BUY, CONSTANTS.SIDE_SELL],
+                         [order_data["side"] for order_data in request_data["request"]])
+
+        self.assertEqual("1001", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        create_event: BuyOrderCreatedEvent = self.buy_order_created_logger.event_log[0]
+        self.assertEqual("OID1", create_event.order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual("OID2", failure_event.order_id)
+
     @aioresponses()
     @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
     def test_update_time_synchronizer_successfully(self, mock_api, seconds_counter_mock):
@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.trade_fee import TokenAmount
@@ -941,17 +942,13 @@ class TestGateIoExchange(unittest.TestCase):
         self.assertIn("OID2", self.exchange.in_flight_orders)
         order2 = self.exchange.in_flight_orders["OID2"]
 
-        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_DELETE_PATH_URL.format(order_id=order1.exchange_order_id)}"
-        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
-
-        response = self.get_order_create_response_mock(cancelled=True, exchange_order_id=order1.exchange_order_id)
-
-        mock_api.delete(regex_url, body=json.dumps(response))
-
-        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_DELETE_PATH_URL.format(order_id=order2.exchange_order_id)}"
-        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
-
-        mock_api.delete(regex_url, status=400)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL}"
+        response = [
+            {"currency_pair": self.ex_trading_pair, "id": order1.exchange_order_id, "succeeded": True},
+            {"currency_pair": self.ex_trading_pair, "id": order2.exchange_order_id, "succeeded": False,
+             "label": "INVALID_PARAM_VALUE", "message": "Invalid parameter"},
+        ]
+        mock_api.post(url, body=json.dumps(response))
 
         cancellation_results = self.async_run_with_timeout(self.exchange.cancel_all(10))
 
@@ -971,6 +968,74 @@ class TestGateIoExchange(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_batch_order_create(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CREATE_PATH_URL}"
+        buy_response = self.get_order_create_response_mock(exchange_order_id="1001")
+        buy_response.update({"text": "t-OID1", "succeeded": True})
+        response = [
+            buy_response,
+            {"text": "t-OID2", "succeeded": False, "label": "BALANCE_NOT_ENOUGH", "message": "Not enough balance"},
+        ]
+        mock_api.post(url, body=json.dumps(response))
+
+        orders = [
+            LimitOrder(
+                client_order_id=client_order_id,
+                trading_pair=self.trading_pair,
+                is_buy=is_buy,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=Decimal("5.1"),
+                quantity=Decimal("1"),
+            )
+            for client_order_id, is_buy in (("t-OID1", True), ("t-OID2", False))
+        ]
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders))
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(["t-OID1", "t-OID2"], [order_data["text"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data])
+
+        self.assertEqual("1001", self.exchange.in_flight_orders["t-OID1"].exchange_order_id)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertNotIn("t-OID2", self.exchange.in_flight_orders)
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual("t-OID2", failure_event.order_id)
+
+    @aioresponses()
+    def test_batch_order_cancel_processes_orders_not_found(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id=None,
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        order = self.exchange.in_flight_orders["OID1"]
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL}"
+        response = [{"currency_pair": self.ex_trading_pair, "id": "OID1", "succeeded": False,
+                     "label": CONSTANTS.ERR_LABEL_ORDER_NOT_FOUND, "message": "Order not found"}]
+        mock_api.post(url, body=json.dumps(response))
+
+        cancellation_results = self.async_run_with_timeout(
+            self.exchange._execute_batch_cancel(orders_to_cancel=[order.to_limit_order()]))
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual([{"currency_pair": self.ex_trading_pair, "id": "OID1"}], request_data)
+        self.assertEqual([CancellationResult("OID1", False)], cancellation_results)
+        self.assertEqual(1, self.exchange._order_tracker._order_not_found_records["OID1"])
+        self.assertTrue(self._is_logged("WARNING", "Failed to cancel order OID1 (order not found)"))
+
     @aioresponses()
     def test_update_balances(self, mock_api):
         url = f"{CONSTANTS.REST_URL}/{CONSTANTS.USER_BALANCES_PATH_URL}"
@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase, TradeFeeSchema
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -1020,6 +1021,57 @@ class KucoinExchangeTests(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_batch_order_create(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(CONSTANTS.ORDERS_MULTI_PATH_URL)
+        creation_response = {
+            "code": "200000",
+            "data": {
+                "data": [
+                    {"symbol": self.exchange_trading_pair, "type": "limit", "side": "buy", "price": "10000",
+                     "size": "100", "id": "5bd6e9286d99522a52e458de", "status": "success", "failMsg": None,
+                     "clientOid": "OID1"},
+                    {"symbol": self.exchange_trading_pair, "type": "limit", "side": "sell", "price": "11000",
+                     "size": "100", "id": None, "status": "fail", "failMsg": "Balance insufficient!",
+                     "clientOid": "OID2"},
+                ]
+            }
+        }
+        mock_api.post(url, body=json.dumps(creation_response))
+
+        orders = [
+            LimitOrder(
+                client_order_id=client_order_id,
+                trading_pair=self.trading_pair,
+                is_buy=is_buy,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=price,
+                quantity=Decimal("100"),
+            )
+            for client_order_id, is_buy, price in (("OID1", True, Decimal("10000")),
+                                                   ("OID2", False, Decimal("11000")))
+        ]
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders))
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        self._validate_auth_credentials_present(order_request[1][0])
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(self.exchange_trading_pair, request_data["symbol"])
+        self.assertEqual(["OID1", "OID2"], [order_data["clientOid"] for order_data in request_data["orderList"]])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data["orderList"]])
+        self.assertNotIn("symbol", request_data["orderList"][0])
+
+        self.assertEqual("5bd6e9286d99522a52e458de", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        create_event: BuyOrderCreatedEvent = self.buy_order_created_logger.event_log[0]
+        self.assertEqual("OID1", create_event.order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual("OID2", failure_event.order_id)
+
     @aioresponses()
     @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
     def test_update_time_synchronizer_successfully(self, mock_api, seconds_counter_mock):
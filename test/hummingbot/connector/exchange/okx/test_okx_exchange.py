@@ -15,9 +15,17 @@ from hummingbot.connector.exchange.okx.okx_exchange import OkxExchange
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.cancellation_result import CancellationResult
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
-from hummingbot.core.event.events import BuyOrderCreatedEvent, OrderCancelledEvent, OrderType, TradeType
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketOrderFailureEvent,
+    OrderCancelledEvent,
+    OrderType,
+    TradeType,
+)
 
 
 class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
@@ -545,12 +553,19 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": successful_order.client_order_id, "ordId": successful_order.exchange_order_id,
+                 "sCode": "0", "sMsg": ""},
+                {"clOrdId": erroneous_order.client_order_id, "ordId": erroneous_order.exchange_order_id,
+                 "sCode": "1", "sMsg": "Error"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+        return [url]
 
     def configure_order_not_found_error_cancelation_response(
             self, order: InFlightOrder, mock_api: aioresponses,
@@ -1283,3 +1298,105 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
                 f"{Decimal('100.000000')} {self.trading_pair} at {Decimal('10000')}."
             )
         )
+
+    @aioresponses()
+    def test_batch_order_create(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        buy_order, sell_order = [
+            LimitOrder(
+                client_order_id=client_order_id,
+                trading_pair=self.trading_pair,
+                is_buy=is_buy,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=price,
+                quantity=Decimal("100"),
+            )
+            for client_order_id, is_buy, price in (("OID1", True, Decimal("10000")),
+                                                   ("OID2", False, Decimal("11000")))
+        ]
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": "OID1", "ordId": "1001", "tag": "", "sCode": "0", "sMsg": ""},
+                {"clOrdId": "OID2", "ordId": "", "tag": "", "sCode": "51008", "sMsg": "Insufficient balance"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=[buy_order, sell_order]))
+
+        request_data = json.loads(self._all_executed_requests(mock_api, url)[0].kwargs["data"])
+        self.assertEqual(["OID1", "OID2"], [order_data["clOrdId"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data])
+        self.assertEqual(["10000", "11000"], [order_data["px"] for order_data in request_data])
+
+        self.assertEqual("1001", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual(OrderState.OPEN, self.exchange.in_flight_orders["OID1"].current_state)
+        create_event: BuyOrderCreatedEvent = self.buy_order_created_logger.event_log[0]
+        self.assertEqual("OID1", create_event.order_id)
+
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual("OID2", failure_event.order_id)
+
+    def test_batch_order_create_assigns_the_order_ids(self):
+        self.exchange._set_current_timestamp(1640780000)
+        order = LimitOrder(
+            client_order_id="",
+            trading_pair=self.trading_pair,
+            is_buy=True,
+            base_currency=self.base_asset,
+            quote_currency=self.quote_asset,
+            price=Decimal("10000"),
+            quantity=Decimal("100"),
+        )
+
+        with patch.object(self.exchange, "_execute_batch_order_create") as execute_batch_order_create_mock:
+            created_orders = self.exchange.batch_order_create(orders_to_create=[order])
+            self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.assertEqual(1, len(created_orders))
+        self.assertTrue(created_orders[0].client_order_id.startswith(CONSTANTS.CLIENT_ID_PREFIX))
+        execute_batch_order_create_mock.assert_called_once_with(orders_to_create=created_orders)
+
+    @aioresponses()
+    def test_batch_order_cancel(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in (("OID1", "1001"), ("OID2", "1002")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+        orders = [self.exchange.in_flight_orders["OID1"], self.exchange.in_flight_orders["OID2"]]
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": "OID1", "ordId": "1001", "sCode": "0", "sMsg": ""},
+                {"clOrdId": "OID2", "ordId": "1002", "sCode": "51402", "sMsg": "Order has been completed"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        cancellation_results = self.async_run_with_timeout(
+            self.exchange._execute_batch_cancel(orders_to_cancel=[order.to_limit_order() for order in orders]))
+
+        request_data = json.loads(self._all_executed_requests(mock_api, url)[0].kwargs["data"])
+        self.assertEqual([{"clOrdId": "OID1", "instId": self.exchange_symbol_for_tokens(self.base_asset,
+                                                                                        self.quote_asset)},
+                          {"clOrdId": "OID2", "instId": self.exchange_symbol_for_tokens(self.base_asset,
+                                                                                        self.quote_asset)}],
+                         request_data)
+        self.assertEqual([CancellationResult("OID1", True), CancellationResult("OID2", False)], cancellation_results)
+        self.assertTrue(orders[0].is_pending_cancel_confirmation)
+        self.assertFalse(orders[1].is_pending_cancel_confirmation)
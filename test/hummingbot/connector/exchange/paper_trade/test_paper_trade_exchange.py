@@ -1,11 +1,19 @@
+from decimal import Decimal
 from unittest import TestCase
 
+import numpy as np
+
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -23,9 +31,87 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(BinanceAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+        self.assertFalse(paper_exchange.queue_position_fills)
 
         paper_exchange = create_paper_trade_market(
             exchange_name="kucoin",
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+
+class PaperTradeExchangeQueuePositionFillsTests(TestCase):
+    start_timestamp = 1640000000
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.start_timestamp + 100)
+        self.market = MockPaperExchange(ClientConfigAdapter(ClientConfigMap()), queue_position_fills=True)
+        # Bids at 99.5 (10), 98.5 (20), ... and asks at 100.5 (10), 101.5 (20), ...
+        self.market.set_balanced_order_book(trading_pair=self.trading_pair, mid_price=100, min_price=50,
+                                            max_price=150, price_step_size=1, volume_step_size=10)
+        self.market.set_balance("COINALPHA", 100)
+        self.market.set_balance("HBOT", 10000)
+        self.clock.add_iterator(self.market)
+        self.clock.backtest_til(self.start_timestamp)
+        self.fill_logger = EventLogger()
+        self.buy_order_completed_logger = EventLogger()
+        self.market.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        self.market.add_listener(MarketEvent.BuyOrderCompleted, self.buy_order_completed_logger)
+
+    def _trade(self, price: float, amount: float):
+        self.market.match_trade_to_limit_orders(OrderBookTradeEvent(
+            trading_pair=self.trading_pair,
+            timestamp=self.start_timestamp,
+            type=TradeType.SELL,
+            price=price,
+            amount=amount))
+
+    def test_limit_order_is_filled_by_the_volume_traded_after_its_queue_position(self):
+        order_id = self.market.buy(self.trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("99.5"))
+        self.assertEqual(10, self.market.queue_positions[order_id].volume_ahead)
+
+        self._trade(price=99.5, amount=8)
+
+        self.assertEqual(2, self.market.queue_positions[order_id].volume_ahead)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+
+        self._trade(price=99.5, amount=4)
+
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("2"), self.fill_logger.event_log[0].amount)
+        self.assertEqual(Decimal("3"), self.market.limit_orders[0].quantity)
+        self.assertEqual(Decimal("2") + 100, self.market.get_balance("COINALPHA"))
+        self.assertEqual(0, len(self.buy_order_completed_logger.event_log))
+
+        # A trade through the price of the order fills the rest
+        self._trade(price=98.5, amount=1)
+
+        self.assertEqual(2, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("3"), self.fill_logger.event_log[1].amount)
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual(0, len(self.market.queue_positions))
+        completed_event = self.buy_order_completed_logger.event_log[0]
+        self.assertEqual(Decimal("5"), completed_event.base_asset_amount)
+        self.assertEqual(Decimal("497.5"), completed_event.quote_asset_amount)
+        self.assertEqual(Decimal("10000") - Decimal("497.5"), self.market.get_balance("HBOT"))
+
+    def test_volume_ahead_is_reduced_when_the_level_amount_decreases(self):
+        order_id = self.market.buy(self.trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("99.5"))
+
+        self.market.order_books[self.trading_pair].apply_numpy_diffs(
+            np.array([[99.5, 4, 2]], dtype=np.float64), np.array([[100.5, 10, 2]], dtype=np.float64))
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+        self.assertEqual(4, self.market.queue_positions[order_id].volume_ahead)
+
+    def test_crossed_limit_order_is_filled_in_full(self):
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.market.buy(self.trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("101"))
+
+        self.clock.backtest_til(self.start_timestamp + 2)
+
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("5"), self.fill_logger.event_log[0].amount)
+        self.assertEqual(0, len(self.market.limit_orders))
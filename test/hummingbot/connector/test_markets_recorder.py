@@ -1,29 +1,38 @@
 import asyncio
+import os
 import time
 from decimal import Decimal
+from tempfile import TemporaryDirectory
 from typing import Awaitable
 from unittest import TestCase
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import numpy as np
 from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
+from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
+    OrderCancelledEvent,
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.columnar_market_data import ColumnarMarketDataReader
 from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_update import MarketStateUpdate
 from hummingbot.model.order import Order
 from hummingbot.model.position import Position
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
@@ -85,6 +94,13 @@ class MarketsRecorderTests(TestCase):
         )
 
         self.tracking_states = dict()
+        self.restored_tracking_states = None
+
+    def tracking_state(self, order_id):
+        return self.tracking_states.get(order_id)
+
+    def restore_tracking_states(self, saved_states):
+        self.restored_tracking_states = saved_states
 
     def add_trade_fills_from_market_recorder(self, current_trade_fills):
         pass
@@ -349,6 +365,76 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(self.config_file_path, trade_fills[0].config_file_path)
         self.assertEqual(fill_event.order_id, trade_fills[0].order_id)
 
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def test_event_records_are_written_in_batches_while_started(self, engine_mock):
+        # The records are written from another thread, that has to use the same in memory database
+        engine_mock.return_value = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        recorder._write_queue.start()
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        self.tracking_states = {"OID1": "created"}
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        self.tracking_states = {"OID1": "filled"}
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        recorder.flush()
+
+        with manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            order_status = orders[0].status
+            trade_fills = orders[0].trade_fills
+            market_states = session.query(MarketState).all()
+            market_state_updates = session.query(MarketStateUpdate).all()
+        recorder.restore_market_states(self.config_file_path, self)
+        recorder._write_queue.stop()
+
+        self.assertEqual(0, recorder.pending_writes)
+        # The snapshot of the tracking states on the first event, and the records of the two events
+        self.assertEqual(3, recorder.write_metrics.written_operations)
+        self.assertEqual(1, len(orders))
+        self.assertEqual(MarketEvent.OrderFilled.name, orders[0].last_status)
+        self.assertEqual(2, len(order_status))
+        self.assertEqual(1, len(trade_fills))
+        self.assertEqual(1, len(market_states))
+        self.assertEqual({"OID1": "created"}, market_states[0].saved_state)
+        self.assertEqual(1, len(market_state_updates))
+        self.assertEqual({"OID1": "filled"}, self.restored_tracking_states)
+
     def test_create_order_and_completed(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -401,6 +487,185 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
 
+    def _create_order(self, recorder: MarketsRecorder, order_id: str):
+        self.tracking_states[order_id] = {"id": order_id, "state": "created"}
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=order_id,
+            creation_timestamp=1640001112.223,
+            exchange_order_id=f"E{order_id}",
+        ))
+
+    def _cancel_order(self, recorder: MarketsRecorder, order_id: str):
+        del self.tracking_states[order_id]
+        recorder._did_cancel_order(MarketEvent.OrderCancelled.value, self, OrderCancelledEvent(
+            timestamp=1642020000,
+            order_id=order_id,
+        ))
+
+    def test_tracking_states_changes_are_journaled_and_restored(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            min_market_state_updates_to_compact=10,
+        )
+
+        self._create_order(recorder, "OID1")
+        self._create_order(recorder, "OID2")
+        self._create_order(recorder, "OID3")
+        self.tracking_states["OID2"] = {"id": "OID2", "state": "partially_filled"}
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID2",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1000),
+            amount=Decimal("0.5"),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        ))
+        self._cancel_order(recorder, "OID1")
+
+        with self.manager.get_new_session() as session:
+            market_states = session.query(MarketState).all()
+            market_state_updates = session.query(MarketStateUpdate).order_by(MarketStateUpdate.id).all()
+
+        # Only the first event writes all the tracking states
+        self.assertEqual(1, len(market_states))
+        self.assertEqual({"OID1": {"id": "OID1", "state": "created"}}, market_states[0].saved_state)
+        self.assertEqual(["OID2", "OID3", "OID2", "OID1"], [update.order_id for update in market_state_updates])
+        self.assertIsNone(market_state_updates[-1].saved_state)
+
+        recorder.restore_market_states(self.config_file_path, self)
+
+        self.assertEqual(self.tracking_states, self.restored_tracking_states)
+
+    def test_tracking_states_journal_is_compacted_into_a_snapshot(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            min_market_state_updates_to_compact=3,
+        )
+
+        for i in range(4):
+            self._create_order(recorder, f"OID{i}")
+        self._cancel_order(recorder, "OID0")
+        self._create_order(recorder, "OID4")
+
+        with self.manager.get_new_session() as session:
+            market_states = session.query(MarketState).all()
+            market_state_updates = session.query(MarketStateUpdate).all()
+
+        # The snapshot of the first event is followed by 3 changes, then the fifth event writes a new snapshot
+        self.assertEqual(1, len(market_states))
+        self.assertEqual(["OID1", "OID2", "OID3"], sorted(market_states[0].saved_state))
+        self.assertEqual(["OID4"], [update.order_id for update in market_state_updates])
+
+        recorder.restore_market_states(self.config_file_path, self)
+
+        self.assertEqual(["OID1", "OID2", "OID3", "OID4"], sorted(self.restored_tracking_states))
+
+    def test_restore_without_saved_states_does_not_change_the_market(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+
+        recorder.restore_market_states(self.config_file_path, self)
+
+        self.assertIsNone(self.restored_tracking_states)
+
+    def _create_exchange(self) -> BinanceExchange:
+        exchange = BinanceExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                                   binance_api_key="",
+                                   binance_api_secret="",
+                                   trading_pairs=[self.trading_pair],
+                                   trading_required=False)
+        exchange._set_current_timestamp(1640000000)
+        return exchange
+
+    def _update_exchange_order(self, exchange: BinanceExchange, order_id: str, new_state: OrderState):
+        self.async_run_with_timeout(exchange._order_tracker.process_order_update(OrderUpdate(
+            client_order_id=order_id,
+            exchange_order_id=f"E{order_id}",
+            trading_pair=self.trading_pair,
+            update_timestamp=1640000000,
+            new_state=new_state,
+        )))
+
+    def test_done_orders_are_not_restored_from_the_tracking_states_journal(self):
+        exchange = self._create_exchange()
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[exchange],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        for event, forwarder in recorder._event_pairs:
+            exchange.add_listener(event, forwarder)
+
+        for order_id in ("OID1", "OID2"):
+            exchange.start_tracking_order(order_id=order_id,
+                                          exchange_order_id=f"E{order_id}",
+                                          trading_pair=self.trading_pair,
+                                          trade_type=TradeType.BUY,
+                                          price=Decimal("1000"),
+                                          amount=Decimal("1"),
+                                          order_type=OrderType.LIMIT)
+            self._update_exchange_order(exchange, order_id, OrderState.OPEN)
+        exchange._order_tracker.process_trade_update(TradeUpdate(
+            trade_id="1",
+            client_order_id="OID1",
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            fill_timestamp=1640000000,
+            fill_price=Decimal("1000"),
+            fill_base_amount=Decimal("1"),
+            fill_quote_amount=Decimal("1000"),
+            fee=AddedToCostTradeFee(),
+        ))
+        self._update_exchange_order(exchange, "OID1", OrderState.FILLED)
+        self._update_exchange_order(exchange, "OID2", OrderState.FAILED)
+
+        self.assertEqual(0, len(exchange.tracking_states))
+
+        restored_exchange = self._create_exchange()
+        recorder.restore_market_states(self.config_file_path, restored_exchange)
+
+        self.assertEqual(0, len(restored_exchange._order_tracker._in_flight_orders))
+        self.assertEqual(0, len(restored_exchange._order_tracker._lost_orders))
+
     @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
     def test_market_data_collection_enabled(self, sleep_mock):
         sleep_mock.side_effect = [0.1, asyncio.CancelledError]
@@ -441,6 +706,49 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_ask, Decimal("101"))
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
+        self.assertEqual([[3, 1, 3], [2, 1, 2], [1, 1, 1]], market_data[0].order_book["bid"])
+        self.assertEqual([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], market_data[0].order_book["ask"])
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    def test_market_data_collection_in_columnar_files(self, sleep_mock):
+        sleep_mock.side_effect = [0.1, asyncio.CancelledError]
+        temporary_directory = TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        with patch("hummingbot.connector.markets_recorder.data_path", return_value=temporary_directory.name):
+            recorder = MarketsRecorder(
+                sql=self.manager,
+                markets=[self],
+                config_file_path=self.config_file_path,
+                strategy_name=self.strategy_name,
+                market_data_collection=MarketDataCollectionConfigMap(
+                    market_data_collection_enabled=True,
+                    market_data_collection_interval=1,
+                    market_data_collection_depth=3,
+                    market_data_collection_format="columnar",
+                ),
+            )
+        prices = {PriceType.MidPrice: Decimal("100"),
+                  PriceType.BestBid: Decimal("99"),
+                  PriceType.BestAsk: Decimal("101")}
+        order_book = OrderBook(dex=False)
+        order_book.apply_numpy_snapshot(np.array([[3, 1, 3], [2, 1, 2], [1, 1, 1]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64))
+        with patch.object(self, "get_price_by_type", side_effect=lambda trading_pair, price_type: prices[price_type]):
+            with patch.object(self, "get_order_book", return_value=order_book):
+                with self.assertRaises(asyncio.CancelledError):
+                    self.async_run_with_timeout(recorder._record_market_data())
+        recorder._market_data_writer.flush()
+
+        data = ColumnarMarketDataReader(root=os.path.join(temporary_directory.name, "market_data")).read(
+            self.display_name, self.trading_pair)
+        self.assertEqual(2, len(data["timestamp"]))
+        np.testing.assert_array_equal([100, 100], data["mid_price"])
+        np.testing.assert_array_equal([99, 99], data["best_bid"])
+        np.testing.assert_array_equal([101, 101], data["best_ask"])
+        np.testing.assert_array_equal([[3, 2, 1]] * 2, data["bid_price"])
+        np.testing.assert_array_equal([[4, 5, 6]] * 2, data["ask_price"])
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(MarketData).count())
 
     def test_store_position(self):
         recorder = MarketsRecorder(
@@ -0,0 +1,139 @@
+import asyncio
+import math
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import RateLimitBucket, SlidingWindowThrottler
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+TEST_FAST_ID = "/fast"
+
+
+class SlidingWindowThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+            RateLimit(limit_id=TEST_FAST_ID, limit=1, time_interval=0.1),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = SlidingWindowThrottler(rate_limits=self.rate_limits, safety_margin_pct=0)
+
+    def async_run_with_timeout(self, coroutine, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def _execute(self, limit_id: str, executed: List[str], name: str):
+        async with self.throttler.execute_task(limit_id=limit_id):
+            executed.append(name)
+
+    def test_bucket_expires_entries_out_of_the_window(self):
+        bucket = RateLimitBucket(RateLimit(limit_id=TEST_POOL_ID, limit=3, time_interval=1.0), safety_margin_pct=0.1)
+        bucket.add(100.0, 1)
+        bucket.add(100.5, 2)
+
+        bucket.expire(101.1)
+        self.assertEqual(3, bucket.used)
+        self.assertFalse(bucket.has_capacity(1))
+        self.assertEqual(100.0 + 1.1, bucket.available_at(1))
+        self.assertEqual(100.5 + 1.1, bucket.available_at(3))
+        self.assertEqual(math.inf, bucket.available_at(4))
+
+        bucket.expire(101.2)
+        self.assertEqual(2, bucket.used)
+        self.assertEqual(1, len(bucket))
+        self.assertTrue(bucket.has_capacity(1))
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        now = time.time()
+        self.throttler._buckets[TEST_WEIGHTED_POOL_ID].add(now, 5)
+        self.throttler._buckets[TEST_WEIGHTED_POOL_ID].add(now, 1)
+
+        # Another Task 1(weight=5) will exceed the capacity(11/10)
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        # However Task 2(weight=1) will not exceed the capacity(7/10)
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_within_capacity_for_throttler_without_configured_limits(self):
+        throttler = SlidingWindowThrottler(rate_limits=[])
+        context = throttler.execute_task(limit_id="test_limit_id")
+
+        self.assertTrue(context.within_capacity())
+        self.async_run_with_timeout(context.acquire())
+
+    def test_acquire_records_the_task_and_its_linked_limits(self):
+        self.async_run_with_timeout(self.throttler.execute_task(limit_id=TEST_PATH_URL).acquire())
+
+        self.assertEqual(1, self.throttler._buckets[TEST_PATH_URL].used)
+        self.assertEqual(1, self.throttler._buckets[TEST_POOL_ID].used)
+
+    def test_acquire_awaits_when_exceed_capacity_and_forgets_cancelled_waiters(self):
+        self.throttler._buckets[TEST_POOL_ID].add(time.time(), 1)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire(), timeout=0.2)
+
+        self.assertEqual(0, len(self.throttler._waiters))
+        self.assertEqual(0, self.throttler._buckets[TEST_POOL_ID].waiting)
+
+    def test_waiting_tasks_are_woken_up_in_order_when_capacity_is_freed(self):
+        executed = []
+
+        start = time.time()
+        self.async_run_with_timeout(asyncio.gather(*[self._execute(TEST_FAST_ID, executed, str(i)) for i in range(3)]))
+        elapsed = time.time() - start
+
+        self.assertEqual(["0", "1", "2"], executed)
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 0.5)
+
+    def test_waiting_tasks_do_not_block_unrelated_limits(self):
+        executed = []
+        self.throttler._buckets[TEST_POOL_ID].add(time.time(), 1)
+
+        async def run():
+            blocked_task = asyncio.ensure_future(self._execute(TEST_POOL_ID, executed, "blocked"))
+            await asyncio.sleep(0)
+            await self._execute(TEST_WEIGHTED_TASK_2_ID, executed, "unrelated")
+            blocked_task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await blocked_task
+
+        self.async_run_with_timeout(run())
+
+        self.assertEqual(["unrelated"], executed)
+
+    def test_new_tasks_wait_behind_queued_tasks_on_the_same_limit(self):
+        executed = []
+        self.throttler._buckets[TEST_FAST_ID].add(time.time(), 1)
+
+        async def run():
+            first_task = asyncio.ensure_future(self._execute(TEST_FAST_ID, executed, "first"))
+            await asyncio.sleep(0)
+            self.assertEqual(1, self.throttler._buckets[TEST_FAST_ID].waiting)
+            await asyncio.gather(first_task, self._execute(TEST_FAST_ID, executed, "second"))
+
+        self.async_run_with_timeout(run())
+
+        self.assertEqual(["first", "second"], executed)
@@ -2,7 +2,14 @@
 
 import logging
 import unittest
-from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book import ORDER_BOOK_LEVEL_DTYPE, OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookDepthChangedEvent,
+    OrderBookEvent,
+    OrderBookTopOfBookChangedEvent,
+)
 import numpy as np
 
 
@@ -50,6 +57,274 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_raw_diffs(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1), OrderBookRow(2, 1, 1)],
+                                  [OrderBookRow(3, 1, 1), OrderBookRow(4, 1, 1)],
+                                  1)
+
+        order_book.apply_raw_diffs([["2", "0"], ["2.5", "3", "ignored"]], [[3, 2.5]], 2)
+
+        self.assertEqual([OrderBookRow(2.5, 3, 2), OrderBookRow(1, 1, 1)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(3, 2.5, 2), OrderBookRow(4, 1, 1)], list(order_book.ask_entries()))
+        self.assertEqual(2.5, order_book.get_price(False))
+        self.assertEqual(3, order_book.get_price(True))
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_apply_raw_diffs_matches_apply_diffs(self):
+        raw_bids = [["10.5", "1"], ["10.4", "0"], ["10.1", "7.25"]]
+        raw_asks = [["10.6", "2"], ["10.8", "0.5"]]
+        rows_order_book = OrderBook()
+        raw_order_book = OrderBook()
+
+        rows_order_book.apply_diffs([OrderBookRow(float(price), float(amount), 5) for price, amount in raw_bids],
+                                    [OrderBookRow(float(price), float(amount), 5) for price, amount in raw_asks],
+                                    5)
+        raw_order_book.apply_raw_diffs(raw_bids, raw_asks, 5)
+
+        self.assertEqual(list(rows_order_book.bid_entries()), list(raw_order_book.bid_entries()))
+        self.assertEqual(list(rows_order_book.ask_entries()), list(raw_order_book.ask_entries()))
+
+    def test_apply_diff_arrays(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1), OrderBookRow(2, 1, 1)],
+                                  [OrderBookRow(3, 1, 1), OrderBookRow(4, 1, 1)],
+                                  1)
+
+        order_book.apply_diff_arrays(np.array([2., 2.5]), np.array([0., 3.]),
+                                     np.array([3.]), np.array([2.5]),
+                                     2)
+
+        self.assertEqual([OrderBookRow(2.5, 3, 2), OrderBookRow(1, 1, 1)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(3, 2.5, 2), OrderBookRow(4, 1, 1)], list(order_book.ask_entries()))
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_apply_diff_arrays_with_different_lengths_raises_error(self):
+        order_book = OrderBook()
+
+        with self.assertRaises(ValueError):
+            order_book.apply_diff_arrays(np.array([1., 2.]), np.array([1.]), np.array([]), np.array([]), 1)
+
+    def _depth_test_order_book(self) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1), OrderBookRow(98, 2, 1), OrderBookRow(97, 3, 1)],
+                                  [OrderBookRow(101, 1, 1), OrderBookRow(102, 2, 1), OrderBookRow(103, 3, 1)],
+                                  1)
+        return order_book
+
+    def test_get_price_for_volume(self):
+        order_book = self._depth_test_order_book()
+
+        result = order_book.get_price_for_volume(True, 2)
+        self.assertEqual(102, result.result_price)
+        self.assertEqual(2, result.result_volume)
+
+        result = order_book.get_price_for_volume(False, 3)
+        self.assertEqual(98, result.result_price)
+        self.assertEqual(3, result.result_volume)
+
+        result = order_book.get_price_for_volume(True, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+    def test_get_vwap_for_volume(self):
+        order_book = self._depth_test_order_book()
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertAlmostEqual((101 + 102) / 2, result.result_price)
+        self.assertEqual(2, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(False, 4)
+        self.assertAlmostEqual((99 + 98 * 2 + 97) / 4, result.result_price)
+        self.assertEqual(4, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(False, 7)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+    def test_get_price_for_quote_volume(self):
+        order_book = self._depth_test_order_book()
+
+        result = order_book.get_price_for_quote_volume(True, 200)
+        self.assertEqual(102, result.result_price)
+        self.assertEqual(200, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(False, 10000)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(99 + 98 * 2 + 97 * 3, result.result_volume)
+
+    def test_get_quote_volume_for_base_amount(self):
+        order_book = self._depth_test_order_book()
+
+        self.assertAlmostEqual(101 + 102 * 1.5, order_book.get_quote_volume_for_base_amount(True, 2.5).result_volume)
+        self.assertAlmostEqual(99 * 0.5, order_book.get_quote_volume_for_base_amount(False, 0.5).result_volume)
+        self.assertAlmostEqual(99 + 98 * 2 + 97 * 3,
+                               order_book.get_quote_volume_for_base_amount(False, 100).result_volume)
+
+    def test_get_volume_for_price(self):
+        order_book = self._depth_test_order_book()
+
+        result = order_book.get_volume_for_price(True, 102.5)
+        self.assertEqual(102, result.result_price)
+        self.assertEqual(3, result.result_volume)
+
+        result = order_book.get_volume_for_price(False, 98)
+        self.assertEqual(98, result.result_price)
+        self.assertEqual(3, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+
+        result = order_book.get_quote_volume_for_price(False, 97)
+        self.assertEqual(97, result.result_price)
+        self.assertEqual(99 + 98 * 2 + 97 * 3, result.result_volume)
+
+    def test_depth_queries_are_updated_after_diffs_and_snapshots(self):
+        order_book = self._depth_test_order_book()
+        self.assertEqual(102, order_book.get_price_for_volume(True, 2).result_price)
+
+        order_book.apply_diffs([], [OrderBookRow(101, 5, 2)], 2)
+        self.assertEqual(101, order_book.get_price_for_volume(True, 2).result_price)
+
+        order_book.apply_snapshot([], [OrderBookRow(110, 1, 3)], 3)
+        self.assertEqual(110, order_book.get_price_for_volume(True, 1).result_price)
+        self.assertTrue(np.isnan(order_book.get_price_for_volume(False, 1).result_price))
+
+    def test_depth_queries_match_full_scan(self):
+        rng = np.random.default_rng(42)
+        bids = [OrderBookRow(float(price), float(amount), 1)
+                for price, amount in zip(np.arange(1, 200) * 0.5, rng.uniform(0.1, 5, 199))]
+        asks = [OrderBookRow(float(price), float(amount), 1)
+                for price, amount in zip(100 + np.arange(1, 200) * 0.5, rng.uniform(0.1, 5, 199))]
+        order_book = OrderBook()
+        order_book.apply_snapshot(bids, asks, 1)
+
+        for is_buy in (True, False):
+            rows = list(order_book.ask_entries() if is_buy else order_book.bid_entries())
+            for volume in rng.uniform(0, 600, 50):
+                cumulative_volume = 0
+                cumulative_cost = 0
+                expected_price = np.nan
+                for row in rows:
+                    if cumulative_volume + row.amount >= volume:
+                        expected_price = row.price
+                        cumulative_cost += (volume - cumulative_volume) * row.price
+                        cumulative_volume = volume
+                        break
+                    cumulative_volume += row.amount
+                    cumulative_cost += row.amount * row.price
+
+                price_result = order_book.get_price_for_volume(is_buy, volume)
+                vwap_result = order_book.get_vwap_for_volume(is_buy, volume)
+                quote_result = order_book.get_quote_volume_for_base_amount(is_buy, volume)
+                if np.isnan(expected_price):
+                    self.assertTrue(np.isnan(price_result.result_price))
+                    self.assertTrue(np.isnan(vwap_result.result_price))
+                else:
+                    self.assertEqual(expected_price, price_result.result_price)
+                    self.assertAlmostEqual(cumulative_cost / volume, vwap_result.result_price)
+                self.assertAlmostEqual(cumulative_cost, quote_result.result_volume)
+
+    def test_batch_depth_queries(self):
+        order_book = self._depth_test_order_book()
+
+        prices = order_book.get_prices_for_volumes(True, [0.5, 2, 10])
+        vwaps = order_book.get_vwaps_for_volumes(False, [1, 3])
+        volumes = order_book.get_volumes_for_prices(False, [99, 97])
+        quote_volumes = order_book.get_quote_volumes_for_base_amounts(True, [1, 2])
+
+        self.assertEqual([101, 102], [result.result_price for result in prices[:2]])
+        self.assertTrue(np.isnan(prices[2].result_price))
+        self.assertAlmostEqual(99, vwaps[0].result_price)
+        self.assertAlmostEqual((99 + 98 * 2) / 3, vwaps[1].result_price)
+        self.assertEqual([1, 6], [result.result_volume for result in volumes])
+        self.assertEqual([101, 101 + 102], [result.result_volume for result in quote_volumes])
+
+    def test_top_levels(self):
+        order_book = self._depth_test_order_book()
+
+        bids, asks = order_book.top_levels(2)
+
+        self.assertEqual(ORDER_BOOK_LEVEL_DTYPE, bids.dtype)
+        self.assertEqual([(99., 1., 1), (98., 2., 1)], bids.tolist())
+        self.assertEqual([(101., 1., 1), (102., 2., 1)], asks.tolist())
+        self.assertEqual([101., 102.], asks["price"].tolist())
+
+    def test_top_levels_with_less_levels_than_requested(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [], 1)
+
+        bids, asks = order_book.top_levels(5)
+
+        self.assertEqual([(99., 1., 1)], bids.tolist())
+        self.assertEqual(0, len(asks))
+
+    def test_fill_top_levels_reuses_buffers(self):
+        order_book = self._depth_test_order_book()
+        bids_buffer = np.zeros(4, dtype=ORDER_BOOK_LEVEL_DTYPE)
+        asks_buffer = np.zeros(2, dtype=ORDER_BOOK_LEVEL_DTYPE)
+
+        bids_count, asks_count = order_book.fill_top_levels(bids_buffer, asks_buffer)
+
+        self.assertEqual((3, 2), (bids_count, asks_count))
+        self.assertEqual([99., 98., 97., 0.], bids_buffer["price"].tolist())
+        self.assertEqual([101., 102.], asks_buffer["price"].tolist())
+
+        order_book.apply_diffs([OrderBookRow(99.5, 4, 2)], [], 2)
+        order_book.fill_top_levels(bids_buffer, asks_buffer)
+
+        self.assertEqual([(99.5, 4., 2), (99., 1., 1), (98., 2., 1), (97., 3., 1)], bids_buffer.tolist())
+
+    def test_top_of_book_changed_events(self):
+        order_book = self._depth_test_order_book()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookChangedEvent, event_logger)
+
+        order_book.apply_diffs([OrderBookRow(98, 5, 2)], [OrderBookRow(102, 0, 2)], 2)
+
+        self.assertEqual(0, len(event_logger.event_log))
+
+        order_book.apply_diffs([OrderBookRow(99.5, 4, 3)], [], 3)
+        order_book.apply_diffs([], [OrderBookRow(101, 0, 4)], 4)
+        order_book.apply_snapshot([OrderBookRow(99.5, 1, 5)], [OrderBookRow(103, 3, 5)], 5)
+        order_book.apply_snapshot([OrderBookRow(99, 1, 6)], [OrderBookRow(100, 3, 6)], 6)
+
+        self.assertEqual([OrderBookTopOfBookChangedEvent(3, 99.5, 101.),
+                          OrderBookTopOfBookChangedEvent(4, 99.5, 103.),
+                          OrderBookTopOfBookChangedEvent(6, 99., 100.)],
+                         event_logger.event_log)
+
+    def test_depth_changed_events(self):
+        order_book = self._depth_test_order_book()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.DepthChangedEvent, event_logger)
+        order_book.watch_depth_within_bps(150)
+        order_book.watch_depth_within_bps(150)
+
+        self.assertEqual([150], order_book.watched_depths_bps)
+        self.assertEqual(3, order_book.get_volume_within_bps(True, 150))
+        self.assertEqual(3, order_book.get_volume_within_bps(False, 150))
+
+        # Levels outside the depth
+        order_book.apply_diffs([OrderBookRow(97, 10, 2)], [OrderBookRow(103, 0, 2)], 2)
+
+        self.assertEqual(0, len(event_logger.event_log))
+
+        order_book.apply_diffs([OrderBookRow(98, 4, 3)], [OrderBookRow(102, 2, 3)], 3)
+        order_book.apply_diffs([OrderBookRow(98, 4, 4)], [], 4)
+        order_book.apply_diffs([], [OrderBookRow(101, 0, 5)], 5)
+
+        self.assertEqual([OrderBookDepthChangedEvent(3, 150, 5., 3.),
+                          OrderBookDepthChangedEvent(5, 150, 5., 2.)],
+                         event_logger.event_log)
+
+        order_book.unwatch_depth_within_bps(150)
+        order_book.apply_diffs([OrderBookRow(99, 3, 6)], [], 6)
+
+        self.assertEqual([], order_book.watched_depths_bps)
+        self.assertEqual(2, len(event_logger.event_log))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
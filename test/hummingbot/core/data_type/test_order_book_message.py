@@ -119,6 +119,22 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_raw_bids_and_asks(self):
+        asks = [("1", "2"), ("3", "4")]
+        bids = [("5", "6"), ("7", "8")]
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 1,
+                "asks": asks,
+                "bids": bids,
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertIs(asks, msg.raw_asks)
+        self.assertIs(bids, msg.raw_bids)
+
     def test_has_update_id(self):
         update_id = "someId"
 
@@ -0,0 +1,231 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class OrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+        self.snapshot_events: Dict[str, asyncio.Event] = {pair: asyncio.Event() for pair in self.trading_pairs}
+        self.requested_pairs: List[str] = []
+        self.log_records = []
+        self.tracker: Optional[OrderBookTracker] = None
+
+        self.data_source = MagicMock(spec=OrderBookTrackerDataSource)
+        self.data_source.get_new_order_book.side_effect = self._get_new_order_book
+
+    def tearDown(self) -> None:
+        if self.tracker is not None:
+            self.tracker.stop()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    async def _get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.requested_pairs.append(trading_pair)
+        await self.snapshot_events[trading_pair].wait()
+        return OrderBook()
+
+    def _create_tracker(self, concurrent_init: bool) -> OrderBookTracker:
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source,
+            trading_pairs=self.trading_pairs,
+            concurrent_init=concurrent_init)
+        self.tracker.logger().setLevel(1)
+        self.tracker.logger().addHandler(self)
+        return self.tracker
+
+    async def test_concurrent_init_requests_all_snapshots_without_waiting(self):
+        tracker = self._create_tracker(concurrent_init=True)
+
+        init_task = asyncio.create_task(tracker._init_order_books())
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.trading_pairs, self.requested_pairs)
+        self.assertEqual([], tracker.ready_trading_pairs)
+        self.assertFalse(tracker.ready)
+
+        init_task.cancel()
+
+    async def test_concurrent_init_exposes_each_order_book_as_soon_as_it_is_ready(self):
+        tracker = self._create_tracker(concurrent_init=True)
+
+        init_task = asyncio.create_task(tracker._init_order_books())
+        self.snapshot_events["COINBETA-HBOT"].set()
+        await asyncio.wait_for(tracker.wait_order_book_ready("COINBETA-HBOT"), timeout=1)
+
+        self.assertTrue(tracker.is_order_book_ready("COINBETA-HBOT"))
+        self.assertFalse(tracker.is_order_book_ready("COINALPHA-HBOT"))
+        self.assertEqual(["COINBETA-HBOT"], tracker.ready_trading_pairs)
+        self.assertIn("COINBETA-HBOT", tracker.order_books)
+        self.assertIn("COINBETA-HBOT", tracker._tracking_tasks)
+        self.assertFalse(tracker.ready)
+        self.assertTrue(self._is_logged("INFO", "Initialized order book for COINBETA-HBOT. 1/3 completed."))
+
+        for event in self.snapshot_events.values():
+            event.set()
+        await asyncio.wait_for(init_task, timeout=1)
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(self.trading_pairs, tracker.ready_trading_pairs)
+
+    async def test_concurrent_init_limits_requests_in_flight(self):
+        tracker = self._create_tracker(concurrent_init=True)
+        tracker._max_concurrent_snapshot_requests = 2
+
+        init_task = asyncio.create_task(tracker._init_order_books())
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.trading_pairs[:2], self.requested_pairs)
+
+        self.snapshot_events["COINALPHA-HBOT"].set()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.trading_pairs, self.requested_pairs)
+
+        init_task.cancel()
+
+    async def test_concurrent_init_retries_failed_snapshot(self):
+        tracker = self._create_tracker(concurrent_init=True)
+        tracker.SNAPSHOT_RETRY_INTERVAL = 0
+        for event in self.snapshot_events.values():
+            event.set()
+        self.data_source.get_new_order_book.side_effect = [Exception("Test Error"), OrderBook(), OrderBook(), OrderBook()]
+
+        await asyncio.wait_for(tracker._init_order_books(), timeout=1)
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(4, self.data_source.get_new_order_book.call_count)
+        self.assertTrue(self._is_logged("NETWORK", "Unexpected error initializing order book for COINALPHA-HBOT."))
+
+    async def test_stop_clears_order_book_readiness(self):
+        tracker = self._create_tracker(concurrent_init=True)
+        for event in self.snapshot_events.values():
+            event.set()
+
+        await asyncio.wait_for(tracker._init_order_books(), timeout=1)
+        self.assertTrue(tracker.is_order_book_ready("COINALPHA-HBOT"))
+
+        tracker.stop()
+
+        self.assertFalse(tracker.ready)
+        self.assertEqual([], tracker.ready_trading_pairs)
+
+    async def test_sequential_init_marks_order_books_ready(self):
+        tracker = self._create_tracker(concurrent_init=False)
+        tracker._sleep = MagicMock(side_effect=lambda delay: asyncio.sleep(0))
+        for event in self.snapshot_events.values():
+            event.set()
+
+        await asyncio.wait_for(tracker._init_order_books(), timeout=1)
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(self.trading_pairs, tracker.ready_trading_pairs)
+        self.assertEqual(3, tracker._sleep.call_count)
+
+    def _diff_message(self, update_id: int, bids: List, asks: List) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=update_id)
+
+    def test_coalesce_diff_messages_keeps_last_change_per_price_level(self):
+        messages = [
+            self._diff_message(update_id=2, bids=[["10", "1"], ["9", "2"]], asks=[["11", "1"]]),
+            self._diff_message(update_id=3, bids=[["10.0", "0"]], asks=[["11", "3"], ["12", "1"]]),
+            self._diff_message(update_id=4, bids=[["8", "5"]], asks=[["12", "0"]]),
+        ]
+
+        bids, asks, update_id = OrderBookTracker._coalesce_diff_messages(messages)
+
+        self.assertEqual(4, update_id)
+        self.assertEqual([OrderBookRow(10., 0., 3), OrderBookRow(9., 2., 2), OrderBookRow(8., 5., 4)], bids)
+        self.assertEqual([OrderBookRow(11., 3., 3), OrderBookRow(12., 0., 4)], asks)
+
+    def test_coalesce_diff_messages_resolves_by_update_id(self):
+        messages = [
+            self._diff_message(update_id=5, bids=[["10", "1"]], asks=[]),
+            self._diff_message(update_id=4, bids=[["10", "7"]], asks=[]),
+        ]
+
+        bids, asks, update_id = OrderBookTracker._coalesce_diff_messages(messages)
+
+        self.assertEqual(5, update_id)
+        self.assertEqual([OrderBookRow(10., 1., 5)], bids)
+        self.assertEqual([], asks)
+
+    async def test_drain_diff_messages_stops_at_snapshot(self):
+        queue = asyncio.Queue()
+        first_message = self._diff_message(update_id=1, bids=[], asks=[])
+        second_message = self._diff_message(update_id=2, bids=[], asks=[])
+        snapshot_message = OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"trading_pair": "COINALPHA-HBOT", "update_id": 3, "bids": [], "asks": []},
+            timestamp=3)
+        last_message = self._diff_message(update_id=4, bids=[], asks=[])
+        for message in (second_message, snapshot_message, last_message):
+            queue.put_nowait(message)
+
+        diff_messages, pending_message = OrderBookTracker._drain_diff_messages(first_message, queue)
+
+        self.assertEqual([first_message, second_message], diff_messages)
+        self.assertEqual(snapshot_message, pending_message)
+        self.assertEqual(1, queue.qsize())
+
+    async def test_track_single_book_coalesces_pending_diffs(self):
+        tracker = OrderBookTracker(data_source=self.data_source,
+                                   trading_pairs=["COINALPHA-HBOT"],
+                                   coalesce_diffs=True)
+        self.tracker = tracker
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(10., 1., 1)], [OrderBookRow(11., 1., 1)], 1)
+        tracker._order_books["COINALPHA-HBOT"] = order_book
+        tracker._tracking_message_queues["COINALPHA-HBOT"] = asyncio.Queue()
+        for message in [
+            self._diff_message(update_id=2, bids=[["10", "2"]], asks=[]),
+            self._diff_message(update_id=3, bids=[["10", "3"]], asks=[["11", "0"]]),
+            self._diff_message(update_id=4, bids=[["9.5", "1"]], asks=[["11.5", "4"]]),
+        ]:
+            tracker._tracking_message_queues["COINALPHA-HBOT"].put_nowait(message)
+
+        tracking_task = asyncio.create_task(tracker._track_single_book("COINALPHA-HBOT"))
+        await asyncio.sleep(0.01)
+        tracking_task.cancel()
+
+        self.assertEqual(3, tracker.diff_messages_received["COINALPHA-HBOT"])
+        self.assertEqual(1, tracker.diff_updates_applied["COINALPHA-HBOT"])
+        self.assertEqual([OrderBookRow(10., 3., 3), OrderBookRow(9.5, 1., 4)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(11.5, 4., 4)], list(order_book.ask_entries()))
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual(3, len(tracker._past_diffs_windows["COINALPHA-HBOT"]))
+
+    async def test_track_single_book_without_coalescing_applies_each_diff(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=["COINALPHA-HBOT"])
+        self.tracker = tracker
+        order_book = OrderBook()
+        tracker._order_books["COINALPHA-HBOT"] = order_book
+        tracker._tracking_message_queues["COINALPHA-HBOT"] = asyncio.Queue()
+        for update_id in range(2, 5):
+            tracker._tracking_message_queues["COINALPHA-HBOT"].put_nowait(
+                self._diff_message(update_id=update_id, bids=[[str(update_id), "1"]], asks=[]))
+
+        tracking_task = asyncio.create_task(tracker._track_single_book("COINALPHA-HBOT"))
+        await asyncio.sleep(0.01)
+        tracking_task.cancel()
+
+        self.assertEqual(3, tracker.diff_messages_received["COINALPHA-HBOT"])
+        self.assertEqual(3, tracker.diff_updates_applied["COINALPHA-HBOT"])
@@ -10,7 +10,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import ConversionRateGraph, find_rate
 
 
 class DummyRateSource(RateSourceBase):
@@ -82,6 +82,61 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_conversion_rate_graph_finds_the_same_rates(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+        graph = ConversionRateGraph(prices)
+
+        for pair in ["HBOT-USDT", "ZBOT-USDT", "USDT-HBOT", "HBOT-AAVE", "AAVE-HBOT", "HBOT-GBP", "USDT-USDT"]:
+            self.assertEqual(find_rate(prices, pair), find_rate(graph, pair))
+
+    def test_conversion_rate_graph_finds_multi_hop_routes(self):
+        graph = ConversionRateGraph({
+            "ETH-BTC": Decimal("0.05"),
+            "BTC-USDT": Decimal("60000"),
+            "USDT-GBP": Decimal("0.75"),
+            "GBP-EUR": Decimal("1.2"),
+        })
+
+        self.assertEqual(Decimal("2250"), graph.find_rate("ETH-GBP"))
+        self.assertEqual(Decimal("1") / Decimal("54000"), graph.find_rate("EUR-BTC"))
+        # Longer than ConversionRateGraph.MAX_ROUTE_HOPS
+        self.assertIsNone(graph.find_rate("EUR-ETH"))
+        self.assertIsNone(graph.find_rate("ETH-ZBOT"))
+
+    def test_conversion_rate_graph_prefers_the_most_liquid_intermediate_token(self):
+        graph = ConversionRateGraph({
+            "HBOT-DAI": Decimal("1"),
+            "HBOT-USDT": Decimal("2"),
+            "GBP-DAI": Decimal("10"),
+            "GBP-USDT": Decimal("5"),
+            "BTC-USDT": Decimal("60000"),
+            "ETH-USDT": Decimal("3000"),
+        })
+
+        self.assertEqual(Decimal("0.4"), graph.find_rate("HBOT-GBP"))
+
+    def test_conversion_rate_graph_updates_rates_when_prices_change(self):
+        graph = ConversionRateGraph({"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")})
+        self.assertEqual(Decimal("75"), graph.find_rate("HBOT-GBP"))
+
+        graph.update({"HBOT-USDT": Decimal("200")})
+        self.assertEqual(Decimal("150"), graph.find_rate("HBOT-GBP"))
+
+        del graph["USDT-GBP"]
+        self.assertIsNone(graph.find_rate("HBOT-GBP"))
+
+        graph["GBP-USDT"] = Decimal("2")
+        self.assertEqual(Decimal("100"), graph.find_rate("HBOT-GBP"))
+
+    def test_rate_oracle_indexes_the_stored_prices(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = {"HBOT-USDT": Decimal("100")}
+        rate_oracle._prices["USDT-GBP"] = Decimal("0.75")
+
+        self.assertIsInstance(rate_oracle._prices, ConversionRateGraph)
+        self.assertEqual(Decimal("75"), rate_oracle.get_pair_rate("HBOT-GBP"))
+        self.assertEqual({"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")}, rate_oracle.prices)
+
     def test_rate_oracle_single_instance_rate_source_reset_after_configuration_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
         config_map.rate_oracle_source = "binance"
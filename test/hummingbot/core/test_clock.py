@@ -1,14 +1,30 @@
 import asyncio
 import time
 import unittest
+from test.mock.mock_events import MockEvent, MockEventType
 
 import pandas as pd
 
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class TickRecorder(PyTimeIterator):
+
+    def __init__(self, tick_duration: float = 0):
+        super().__init__()
+        self.tick_duration = tick_duration
+        self.ticks = []
+
+    def tick(self, timestamp: float):
+        self.ticks.append(timestamp)
+        time.sleep(self.tick_duration)
+
+
 class ClockUnitTest(unittest.TestCase):
+    level = 0
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
     backtest_end_timestamp: float = pd.Timestamp("2021-01-01 01:00:00", tz="UTC").timestamp()
@@ -21,6 +37,7 @@ class ClockUnitTest(unittest.TestCase):
 
     def setUp(self):
         super().setUp()
+        self.log_records = []
         self.realtime_start_timestamp = int(time.time())
         self.realtime_end_timestamp = self.realtime_start_timestamp + 2.0  #
         self.clock_realtime = Clock(ClockMode.REALTIME, self.tick_size, self.realtime_start_timestamp, self.realtime_end_timestamp)
@@ -122,3 +139,72 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _run_realtime_clock(self, clock: Clock, coroutine):
+        with clock:
+            clock_task = self.ev_loop.create_task(clock.run())
+            try:
+                self.ev_loop.run_until_complete(coroutine)
+            finally:
+                clock_task.cancel()
+                try:
+                    self.ev_loop.run_until_complete(clock_task)
+                except asyncio.CancelledError:
+                    pass
+
+    def test_wake_up_ticks_before_the_tick_size_interval(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=60, min_wake_interval=0.05)
+        iterator = TickRecorder()
+        clock.add_iterator(iterator)
+        event_source = PubSub()
+        clock.add_wake_up_source(event_source, [MockEventType.EVENT_ZERO])
+
+        async def trigger_events():
+            await asyncio.sleep(0.1)
+            event_source.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=1))
+            await asyncio.sleep(0.01)
+            event_source.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=2))
+            await asyncio.sleep(0.2)
+
+        self._run_realtime_clock(clock, trigger_events())
+
+        early_ticks = [timestamp for timestamp in iterator.ticks if timestamp % 60 != 0]
+        self.assertEqual(2, len(early_ticks))
+        self.assertGreaterEqual(early_ticks[1] - early_ticks[0], 0.049)
+        self.assertEqual(len(iterator.ticks), clock.tick_stats(iterator).ticks)
+
+    def test_wake_up_is_ignored_when_disabled(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=60)
+        iterator = TickRecorder()
+        clock.add_iterator(iterator)
+
+        async def wake_up():
+            await asyncio.sleep(0.1)
+            clock.wake_up()
+            await asyncio.sleep(0.1)
+
+        self._run_realtime_clock(clock, wake_up())
+
+        self.assertTrue(all(timestamp % 60 == 0 for timestamp in iterator.ticks))
+
+    def test_late_ticks_are_recorded_and_logged(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        clock.logger().setLevel(1)
+        clock.logger().addHandler(self)
+        iterator = TickRecorder(tick_duration=0.15)
+        clock.add_iterator(iterator)
+
+        try:
+            self._run_realtime_clock(clock, asyncio.sleep(0.5))
+        finally:
+            clock.logger().removeHandler(self)
+
+        stats = clock.tick_stats(iterator)
+        self.assertGreater(stats.ticks, 0)
+        self.assertGreaterEqual(stats.max_time, 0.15)
+        self.assertGreater(clock.late_ticks, 0)
+        self.assertTrue(any(record.levelname == "WARNING" and "TickRecorder" in record.getMessage()
+                            for record in self.log_records))
@@ -0,0 +1,45 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.event.event_forwarder import ThrottledEventForwarder
+
+
+class ThrottledEventForwarderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.forwarded_events = []
+        self.forwarder = ThrottledEventForwarder(to_function=self.forwarded_events.append, min_interval=1)
+
+    @patch("hummingbot.core.event.event_forwarder.ThrottledEventForwarder._time")
+    def test_events_within_the_interval_are_coalesced(self, time_mock):
+        time_mock.return_value = 10
+        self.forwarder(1)
+        time_mock.return_value = 10.2
+        self.forwarder(2)
+        time_mock.return_value = 10.5
+        self.forwarder(3)
+
+        self.assertEqual([1], self.forwarded_events)
+        self.assertTrue(self.forwarder.has_pending_event)
+
+        time_mock.return_value = 11.2
+        self.forwarder(4)
+
+        self.assertEqual([1, 4], self.forwarded_events)
+        self.assertFalse(self.forwarder.has_pending_event)
+
+    def test_pending_event_is_forwarded_by_the_event_loop_when_the_interval_ends(self):
+        forwarder = ThrottledEventForwarder(to_function=self.forwarded_events.append, min_interval=0.05)
+
+        async def send_events():
+            forwarder(1)
+            forwarder(2)
+            forwarder(3)
+            self.assertEqual([1], self.forwarded_events)
+            await asyncio.sleep(0.1)
+
+        asyncio.get_event_loop().run_until_complete(send_events())
+
+        self.assertEqual([1, 3], self.forwarded_events)
+        self.assertFalse(forwarder.has_pending_event)
@@ -8,11 +8,13 @@ from collections import deque
 from typing import Awaitable
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pandas as pd
 from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
 class TestCandlesBase(unittest.TestCase, ABC):
@@ -93,6 +95,27 @@ class TestCandlesBase(unittest.TestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_candles_df_property_is_rebuilt_only_after_changes(self):
+        candles = self._candles_data_mock()
+        self.data_feed._candles.extend(candles)
+
+        first_df = self.data_feed.candles_df
+        cached_df = self.data_feed._candles_df_cache
+        first_df["new_column"] = 1
+        second_df = self.data_feed.candles_df
+
+        self.assertNotIn("new_column", second_df.columns)
+        self.assertIs(cached_df, self.data_feed._candles_df_cache)
+
+        last_candle = [float(value) for value in candles[-1]]
+        last_candle[4] += 1
+        self.data_feed._candles[-1] = last_candle
+        updated_df = self.data_feed.candles_df
+
+        self.assertIsNot(cached_df, self.data_feed._candles_df_cache)
+        self.assertEqual(last_candle[4], updated_df["close"].iloc[-1])
+        self.assertEqual(len(candles), len(updated_df))
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
@@ -174,6 +197,58 @@ class TestCandlesBase(unittest.TestCase, ABC):
         self.assertEqual(resp.shape[0], len(self.get_fetch_candles_data_mock()))
         self.assertEqual(resp.shape[1], 10)
 
+    def _historical_candles_config(self, number_of_candles: int) -> HistoricalCandlesConfig:
+        end_time = self.data_feed._round_timestamp_to_interval_multiple(1700000000)
+        return HistoricalCandlesConfig(connector_name=self.data_feed.name,
+                                       trading_pair=self.trading_pair,
+                                       interval=self.data_feed.interval,
+                                       start_time=end_time - (number_of_candles - 1) * self.data_feed.interval_in_seconds,
+                                       end_time=end_time)
+
+    async def _fetch_generated_candles(self, start_time=None, end_time=None, limit=None):
+        interval = self.data_feed.interval_in_seconds
+        timestamps = np.arange(end_time - limit * interval, end_time + interval, interval, dtype=float)
+        return np.column_stack([timestamps] + [np.ones(len(timestamps))] * (len(self.data_feed.columns) - 1))
+
+    def test_historical_candles_windows_cover_the_period(self):
+        config = self._historical_candles_config(int(2.5 * self.data_feed.candles_max_result_per_rest_request))
+
+        windows = self.data_feed._historical_candles_windows(config.start_time, config.end_time)
+
+        self.assertEqual(3, len(windows))
+        self.assertEqual(config.end_time, windows[0][0])
+        self.assertTrue(all(limit <= self.data_feed.candles_max_result_per_rest_request for _, limit in windows))
+        covered_candles = sum(limit for _, limit in windows)
+        self.assertEqual(int(2.5 * self.data_feed.candles_max_result_per_rest_request), covered_candles)
+
+    def test_get_historical_candles_concurrently(self):
+        number_of_candles = int(2.5 * self.data_feed.candles_max_result_per_rest_request)
+        config = self._historical_candles_config(number_of_candles)
+        self.data_feed.initialize_exchange_data = AsyncMock()
+        self.data_feed.fetch_candles = MagicMock(side_effect=self._fetch_generated_candles)
+        progress = []
+
+        candles_df = self.async_run_with_timeout(self.data_feed.get_historical_candles_concurrently(
+            config, max_concurrent_requests=2, progress_callback=lambda done, total: progress.append((done, total))))
+
+        self.assertEqual(3, self.data_feed.fetch_candles.call_count)
+        self.assertEqual([(1, 3), (2, 3), (3, 3)], progress)
+        self.assertEqual(number_of_candles, len(candles_df))
+        self.assertEqual(list(self.data_feed.columns), list(candles_df.columns))
+        self.assertEqual(config.start_time, candles_df["timestamp"].iloc[0])
+        self.assertEqual(config.end_time, candles_df["timestamp"].iloc[-1])
+        self.assertTrue((candles_df["timestamp"].diff().dropna() == self.data_feed.interval_in_seconds).all())
+
+    def test_get_historical_candles_concurrently_raises_fetch_errors(self):
+        config = self._historical_candles_config(self.data_feed.candles_max_result_per_rest_request)
+        self.data_feed.initialize_exchange_data = AsyncMock()
+        self.data_feed.fetch_candles = AsyncMock(side_effect=ValueError("Test Error"))
+
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(self.data_feed.get_historical_candles_concurrently(config))
+
+        self.assertTrue(self.is_logged("ERROR", "Error fetching historical candles: Test Error"))
+
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_listen_for_subscriptions_subscribes_to_klines(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
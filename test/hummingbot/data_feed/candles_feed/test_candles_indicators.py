@@ -0,0 +1,141 @@
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta  # noqa: F401
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_indicators import (
+    EMA,
+    MACD,
+    NATR,
+    RSI,
+    SMA,
+    BollingerBands,
+    CandlesIndicators,
+    DonchianChannel,
+    IncrementalIndicator,
+    add_indicators_to_df,
+)
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+
+class CandlesIndicatorsTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rng = np.random.default_rng(seed=42)
+        records = 300
+        close = 100 * np.cumprod(1 + rng.normal(0, 0.01, records))
+        high = close * (1 + np.abs(rng.normal(0, 0.005, records)))
+        low = close * (1 - np.abs(rng.normal(0, 0.005, records)))
+        candles = np.zeros((records, len(CandlesBase.columns)))
+        candles[:, 0] = np.arange(records) * 60
+        candles[:, 1] = close
+        candles[:, 2] = high
+        candles[:, 3] = low
+        candles[:, 4] = close
+        candles[:, 5] = rng.uniform(1, 10, records)
+        self.candles = candles
+        self.df = pd.DataFrame(candles, columns=CandlesBase.columns)
+
+    def _incremental_values(self, indicator: IncrementalIndicator, update_last_candle: bool = False) -> pd.DataFrame:
+        values = []
+        for candle in self.candles:
+            if update_last_candle:
+                # The candle is received while open, with other prices, and then updated with the final ones
+                open_candle = candle.copy()
+                open_candle[2:5] *= 1.02
+                indicator.update(open_candle, is_new=True)
+            values.append(indicator.update(candle, is_new=not update_last_candle))
+        return pd.DataFrame(values, columns=list(indicator.columns))
+
+    def _assert_matches_pandas_ta(self, indicator: IncrementalIndicator, expected: pd.DataFrame):
+        for update_last_candle in (False, True):
+            indicator.reset()
+            values = self._incremental_values(indicator, update_last_candle=update_last_candle)
+            for column in indicator.columns:
+                np.testing.assert_allclose(values[column].values, expected[column].values, rtol=1e-8, atol=1e-10,
+                                           equal_nan=True, err_msg=column)
+
+    def test_ema_matches_pandas_ta(self):
+        self._assert_matches_pandas_ta(EMA(length=20), self.df.ta.ema(length=20).to_frame())
+
+    def test_sma_matches_pandas_ta(self):
+        self._assert_matches_pandas_ta(SMA(length=20), self.df.ta.sma(length=20).to_frame())
+
+    def test_bollinger_bands_match_pandas_ta(self):
+        self._assert_matches_pandas_ta(BollingerBands(length=20, std=2.0), self.df.ta.bbands(length=20, std=2.0))
+
+    def test_macd_matches_pandas_ta(self):
+        self._assert_matches_pandas_ta(MACD(fast=12, slow=26, signal=9), self.df.ta.macd(fast=12, slow=26, signal=9))
+
+    def test_rsi_matches_pandas_ta(self):
+        self._assert_matches_pandas_ta(RSI(length=14), self.df.ta.rsi(length=14).to_frame())
+
+    def test_natr_matches_pandas_ta(self):
+        self._assert_matches_pandas_ta(NATR(length=14), self.df.ta.natr(length=14).to_frame())
+
+    def test_donchian_channel_matches_pandas_ta(self):
+        self._assert_matches_pandas_ta(DonchianChannel(lower_length=20, upper_length=10),
+                                       self.df.ta.donchian(lower_length=20, upper_length=10))
+
+    def test_indicators_are_registered_once_by_name(self):
+        indicators = CandlesIndicators(candles=CandlesRingBuffer(maxlen=10, columns=len(CandlesBase.columns)))
+
+        bollinger_bands = indicators.add(BollingerBands(length=5, std=2))
+
+        self.assertIs(bollinger_bands, indicators.add(BollingerBands(length=5, std=2.0)))
+        self.assertEqual(1, len(indicators.indicators))
+        self.assertEqual(["BBL_5_2.0", "BBM_5_2.0", "BBU_5_2.0", "BBB_5_2.0", "BBP_5_2.0"], indicators.columns)
+
+    def test_indicators_follow_the_candles_buffer(self):
+        candles = CandlesRingBuffer(maxlen=100, columns=len(CandlesBase.columns))
+        indicators = CandlesIndicators(candles=candles)
+        indicators.add(EMA(length=10))
+        indicators.add(DonchianChannel(lower_length=5, upper_length=5))
+
+        # Historical candles inserted before the first one received
+        candles.append(self.candles[150])
+        indicators.update()
+        candles.extendleft(self.candles[100:150][::-1])
+        indicators.update()
+        # New candles, received open and then updated
+        for candle in self.candles[151:]:
+            open_candle = candle.copy()
+            open_candle[2:5] *= 0.99
+            candles.append(open_candle)
+            indicators.update()
+            candles[-1] = candle
+        values = indicators.values()
+
+        expected = self.df.iloc[100:].copy()
+        expected.ta.ema(length=10, append=True)
+        expected.ta.donchian(lower_length=5, upper_length=5, append=True)
+        self.assertEqual((100, 4), values.shape)
+        np.testing.assert_allclose(values, expected[indicators.columns].values[-100:], rtol=1e-8, equal_nan=True)
+        latest_values = indicators.latest_values()
+        self.assertAlmostEqual(expected["EMA_10"].iloc[-1], latest_values["EMA_10"])
+        self.assertEqual(expected["DCU_5_5"].iloc[-1], latest_values["DCU_5_5"])
+
+    def test_indicators_values_are_reset_with_the_candles(self):
+        candles = CandlesRingBuffer(maxlen=100, columns=len(CandlesBase.columns))
+        indicators = CandlesIndicators(candles=candles)
+        indicators.add(EMA(length=10))
+        candles.extend(self.candles[:20])
+        indicators.update()
+
+        candles.clear()
+
+        self.assertEqual((0, 1), indicators.values().shape)
+        self.assertTrue(math.isnan(indicators.latest_values()["EMA_10"]))
+
+    def test_add_indicators_to_df(self):
+        df = add_indicators_to_df(self.df.copy(), [RSI(length=14), MACD(fast=12, slow=26, signal=9)])
+
+        expected = self.df.copy()
+        expected.ta.rsi(length=14, append=True)
+        expected.ta.macd(fast=12, slow=26, signal=9, append=True)
+        self.assertEqual(list(expected.columns), list(df.columns))
+        np.testing.assert_allclose(df.values, expected.values, rtol=1e-8, equal_nan=True)
@@ -0,0 +1,83 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+
+class CandlesRingBufferTests(unittest.TestCase):
+
+    @staticmethod
+    def _candle(timestamp: float) -> list:
+        return [timestamp, 1., 2., 0.5, 1.5, 10.]
+
+    def test_init_with_invalid_maxlen_raises_error(self):
+        with self.assertRaises(ValueError):
+            CandlesRingBuffer(maxlen=0, columns=6)
+
+    def test_append_keeps_last_records(self):
+        buffer = CandlesRingBuffer(maxlen=3, columns=6)
+
+        for timestamp in range(10):
+            buffer.append(self._candle(timestamp))
+
+        self.assertEqual(3, len(buffer))
+        self.assertEqual(3, buffer.maxlen)
+        self.assertEqual([7., 8., 9.], buffer.values[:, 0].tolist())
+        self.assertEqual(7., buffer[0][0])
+        self.assertEqual(9., buffer[-1][0])
+
+    def test_extendleft_has_deque_semantics(self):
+        buffer = CandlesRingBuffer(maxlen=4, columns=6)
+        buffer.append(self._candle(5))
+
+        buffer.extendleft([self._candle(4), self._candle(3), self._candle(2), self._candle(1)])
+
+        self.assertEqual([2., 3., 4., 5.], buffer.values[:, 0].tolist())
+
+    def test_appendleft_after_appends_moves_block(self):
+        buffer = CandlesRingBuffer(maxlen=3, columns=6)
+        buffer.extend([self._candle(timestamp) for timestamp in range(5, 11)])
+
+        buffer.appendleft(self._candle(7))
+
+        self.assertEqual([7., 8., 9.], buffer.values[:, 0].tolist())
+
+    def test_setitem_updates_candle_and_version(self):
+        buffer = CandlesRingBuffer(maxlen=3, columns=6)
+        buffer.extend([self._candle(1), self._candle(2)])
+        version = buffer.version
+
+        buffer[-1] = [2., 1., 3., 0.5, 2.5, 20.]
+
+        self.assertEqual(2.5, buffer[-1][4])
+        self.assertGreater(buffer.version, version)
+
+    def test_index_out_of_range(self):
+        buffer = CandlesRingBuffer(maxlen=3, columns=6)
+        buffer.append(self._candle(1))
+
+        with self.assertRaises(IndexError):
+            buffer[1]
+        with self.assertRaises(IndexError):
+            buffer[-2]
+
+    def test_clear(self):
+        buffer = CandlesRingBuffer(maxlen=3, columns=6)
+        buffer.extend([self._candle(1), self._candle(2)])
+
+        buffer.clear()
+
+        self.assertEqual(0, len(buffer))
+        self.assertEqual((0, 6), buffer.values.shape)
+
+    def test_values_is_a_read_only_view(self):
+        buffer = CandlesRingBuffer(maxlen=3, columns=6)
+        buffer.extend([self._candle(1), self._candle(2)])
+
+        values = buffer.values
+
+        self.assertFalse(values.flags.writeable)
+        self.assertTrue(np.shares_memory(values, buffer._data))
+        self.assertEqual([[1., 1., 2., 0.5, 1.5, 10.], [2., 1., 2., 0.5, 1.5, 10.]], np.asarray(buffer).tolist())
+        self.assertEqual([1., 2.], [candle[0] for candle in buffer])
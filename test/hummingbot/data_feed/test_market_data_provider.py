@@ -8,6 +8,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_indicators import EMA
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy.strategy_v2_base import MarketDataProvider
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
@@ -62,6 +63,20 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         result = self.provider.get_candles_df("binance", "BTC-USDT", "1m", 100)
         self.assertIsInstance(result, pd.DataFrame)
 
+    @patch.object(CandlesBase, "start", MagicMock())
+    def test_get_candles_df_with_indicators(self):
+        feed = self.provider.get_candles_feed(
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100))
+        for timestamp in range(20):
+            feed._candles.append([timestamp * 60, 1, 2, 0.5, 1.5, 10, 15, 5, 5, 7.5])
+
+        result = self.provider.get_candles_df("binance", "BTC-USDT", "1m", 10, indicators=[EMA(length=5)])
+
+        self.assertEqual(10, len(result))
+        self.assertEqual(CandlesBase.columns + ["EMA_5"], list(result.columns))
+        self.assertEqual(1.5, result["EMA_5"].iloc[-1])
+        self.assertEqual(1, len(feed._indicators.indicators))
+
     def test_get_trading_pairs(self):
         self.mock_connector.trading_pairs = ["BTC-USDT"]
         trading_pairs = self.provider.get_trading_pairs("mock_connector")
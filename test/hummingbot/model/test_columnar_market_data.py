@@ -0,0 +1,101 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.model.columnar_market_data import (
+    ColumnarMarketDataReader,
+    ColumnarMarketDataWriter,
+    market_data_directory,
+)
+
+
+class ColumnarMarketDataTests(unittest.TestCase):
+    day_start = 1704067200  # 2024-01-01 00:00:00 UTC
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = TemporaryDirectory()
+        self.root = self.temporary_directory.name
+        self.writer = ColumnarMarketDataWriter(root=self.root, depth=3, buffer_size=4, flush_interval=1e9)
+        self.reader = ColumnarMarketDataReader(root=self.root)
+        self.order_book = OrderBook(dex=False)
+        self.order_book.apply_numpy_snapshot(
+            np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64),
+            np.array([[101, 1, 1], [102, 2, 1], [103, 3, 1], [104, 4, 1]], dtype=np.float64))
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        super().tearDown()
+
+    def _append(self, timestamp: float, exchange: str = "binance", trading_pair: str = "BTC-USDT"):
+        self.writer.append(exchange=exchange, trading_pair=trading_pair, timestamp=timestamp,
+                           mid_price=100.0, best_bid=99.0, best_ask=101.0, order_book=self.order_book)
+
+    def test_snapshots_are_read_back_as_columns(self):
+        for i in range(3):
+            self._append(self.day_start + i)
+        self.writer.flush()
+
+        data = self.reader.read("binance", "BTC-USDT")
+
+        np.testing.assert_array_equal([self.day_start, self.day_start + 1, self.day_start + 2], data["timestamp"])
+        np.testing.assert_array_equal([100.0] * 3, data["mid_price"])
+        np.testing.assert_array_equal([99.0] * 3, data["best_bid"])
+        np.testing.assert_array_equal([101.0] * 3, data["best_ask"])
+        np.testing.assert_array_equal([[99, 98, np.nan]] * 3, data["bid_price"])
+        np.testing.assert_array_equal([[1, 2, np.nan]] * 3, data["bid_amount"])
+        np.testing.assert_array_equal([[101, 102, 103]] * 3, data["ask_price"])
+        np.testing.assert_array_equal([[1, 2, 3]] * 3, data["ask_amount"])
+        self.assertIsInstance(data["mid_price"], np.memmap)
+
+    def test_snapshots_are_buffered_until_the_buffer_is_full(self):
+        for i in range(5):
+            self._append(self.day_start + i)
+
+        self.assertEqual(1, self.writer.pending_snapshots)
+        self.assertEqual(4, len(self.reader.read("binance", "BTC-USDT")["timestamp"]))
+
+        self.writer.flush()
+
+        self.assertEqual(0, self.writer.pending_snapshots)
+        self.assertEqual(5, len(self.reader.read("binance", "BTC-USDT")["timestamp"]))
+
+    def test_files_are_split_by_day_and_read_by_time_range(self):
+        timestamps = [self.day_start + 86000, self.day_start + 86300, self.day_start + 86500, self.day_start + 172900]
+        for timestamp in timestamps:
+            self._append(timestamp)
+        self._append(self.day_start, trading_pair="ETH-USDT")
+        self.writer.flush()
+
+        self.assertEqual(["2024-01-01", "2024-01-02", "2024-01-03"], self.reader.days("binance", "BTC-USDT"))
+        np.testing.assert_array_equal(timestamps, self.reader.read("binance", "BTC-USDT")["timestamp"])
+        data = self.reader.read("binance", "BTC-USDT", start_time=self.day_start + 86300,
+                                end_time=self.day_start + 172900)
+        np.testing.assert_array_equal(timestamps[1:3], data["timestamp"])
+        self.assertEqual((2, 3), data["ask_price"].shape)
+        data = self.reader.read("binance", "BTC-USDT", start_time=self.day_start + 200000)
+        self.assertEqual(0, len(data["timestamp"]))
+        self.assertEqual(0, len(self.reader.read("kucoin", "BTC-USDT")["timestamp"]))
+
+    def test_incomplete_snapshots_are_discarded(self):
+        self._append(self.day_start)
+        self._append(self.day_start + 1)
+        self.writer.flush()
+        # A write interrupted after the first columns
+        directory = market_data_directory(self.root, "binance", "BTC-USDT", "2024-01-01")
+        with open(os.path.join(directory, "timestamp.f8"), "ab") as column_file:
+            column_file.write(np.array([self.day_start + 2], dtype=np.float64).tobytes())
+
+        self.assertEqual(2, len(self.reader.read("binance", "BTC-USDT")["timestamp"]))
+
+        writer = ColumnarMarketDataWriter(root=self.root, depth=3)
+        writer.append(exchange="binance", trading_pair="BTC-USDT", timestamp=self.day_start + 3,
+                      mid_price=100.0, best_bid=99.0, best_ask=101.0, order_book=self.order_book)
+        writer.flush()
+
+        data = self.reader.read("binance", "BTC-USDT")
+        np.testing.assert_array_equal([self.day_start, self.day_start + 1, self.day_start + 3], data["timestamp"])
+        np.testing.assert_array_equal([100.0] * 3, data["mid_price"])
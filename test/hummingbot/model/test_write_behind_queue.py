@@ -0,0 +1,95 @@
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.write_behind_queue import WriteBehindQueue
+
+
+class WriteBehindQueueTests(unittest.TestCase):
+    level = 0
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        self.log_records = []
+        # A single connection shared by the threads, so the writer thread uses the same in memory database
+        engine_mock.return_value = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.write_queue = WriteBehindQueue(sql_manager=self.manager, max_batch_size=3, flush_interval=10)
+        self.write_queue.logger().setLevel(1)
+        self.write_queue.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.write_queue.stop()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    @staticmethod
+    def _add_market_state(market: str):
+        def write(session: Session):
+            session.add(MarketState(config_file_path="test_config", market=market, timestamp=1, saved_state={}))
+        return write
+
+    def _stored_markets(self):
+        with self.manager.get_new_session() as session:
+            return sorted(market_state.market for market_state in session.query(MarketState).all())
+
+    def test_operations_are_written_right_away_when_not_started(self):
+        self.write_queue.submit(self._add_market_state("market_1"))
+
+        self.assertFalse(self.write_queue.is_running)
+        self.assertEqual(["market_1"], self._stored_markets())
+        self.assertEqual(1, self.write_queue.metrics.flushes)
+
+    def test_operations_are_written_in_batches(self):
+        self.write_queue.start()
+
+        for i in range(7):
+            self.write_queue.submit(self._add_market_state(f"market_{i}"))
+        self.write_queue.flush()
+
+        self.assertEqual([f"market_{i}" for i in range(7)], self._stored_markets())
+        self.assertEqual(0, self.write_queue.queue_depth)
+        self.assertEqual(3, self.write_queue.metrics.flushes)
+        self.assertEqual(7, self.write_queue.metrics.written_operations)
+        self.assertGreaterEqual(self.write_queue.metrics.max_flush_time, self.write_queue.metrics.average_flush_time)
+
+    def test_stop_writes_the_pending_operations(self):
+        self.write_queue.start()
+        self.write_queue.submit(self._add_market_state("market_1"))
+        self.write_queue.submit(self._add_market_state("market_2"))
+
+        self.write_queue.stop()
+
+        self.assertFalse(self.write_queue.is_running)
+        self.assertEqual(["market_1", "market_2"], self._stored_markets())
+
+    def test_failed_batch_is_written_one_operation_at_a_time(self):
+        def failing_operation(session: Session):
+            raise Exception("Test error")
+
+        self.write_queue.start()
+        self.write_queue.submit(self._add_market_state("market_1"))
+        self.write_queue.submit(failing_operation)
+        self.write_queue.submit(self._add_market_state("market_2"))
+        self.write_queue.flush()
+
+        self.assertEqual(["market_1", "market_2"], self._stored_markets())
+        self.assertEqual(2, self.write_queue.metrics.written_operations)
+        self.assertEqual(1, self.write_queue.metrics.failed_operations)
+        self.assertTrue(self._is_logged("ERROR", "Unexpected error while writing to the database."))
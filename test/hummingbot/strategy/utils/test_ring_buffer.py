@@ -107,3 +107,50 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_running_statistics_match_the_values(self):
+        np.random.seed(1234)
+        buffer = RingBuffer(5)
+
+        for value in np.random.normal(100, 10, 23):
+            buffer.add_value(value)
+            values = buffer.get_as_numpy_array()
+            self.assertEqual(values.size, buffer.size)
+            self.assertAlmostEqual(np.var(values), buffer.running_variance, 6)
+            self.assertAlmostEqual(np.sum(np.square(np.diff(values))), buffer.sum_squared_diffs, 6)
+            self.assertEqual(values[0], buffer.get_first_value())
+        self.assertAlmostEqual(np.mean(values), buffer.mean_value, 6)
+        self.assertAlmostEqual(np.std(values), buffer.std_dev, 6)
+
+    def test_long_buffer(self):
+        # Longer than the int16 indexes used before to read the values
+        length = 40000
+        buffer = RingBuffer(length)
+
+        for i in range(length + 10):
+            buffer.add_value(i % 7)
+
+        values = buffer.get_as_numpy_array()
+        self.assertEqual(length, values.size)
+        self.assertEqual(10 % 7, values[0])
+        self.assertAlmostEqual(np.mean(values), buffer.mean_value, 9)
+        self.assertAlmostEqual(np.var(values), buffer.variance, 9)
+        self.assertAlmostEqual(np.sum(np.square(np.diff(values))), buffer.sum_squared_diffs, 6)
+
+    def test_statistics_recover_after_nan_value(self):
+        buffer = RingBuffer(3)
+        for value in [1, np.nan, 2, 3, 4]:
+            buffer.add_value(value)
+
+        self.assertEqual(3, buffer.mean_value)
+        self.assertAlmostEqual(2 / 3, buffer.variance)
+        self.assertEqual(2, buffer.sum_squared_diffs)
+
+    def test_length_change_keeps_statistics(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 10
+
+        self.assertEqual(np.mean(np.arange(20, 30)), self.buffer.mean_value)
+        self.assertEqual(9, self.buffer.sum_squared_diffs)
@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+    BUFFER_LENGTH = 20
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    @staticmethod
+    def adjusted_ema(samples: np.ndarray, span: int) -> float:
+        weights = (1 - 2 / (span + 1)) ** np.arange(samples.size)[::-1]
+        return np.sum(weights * samples) / np.sum(weights)
+
+    def test_calculate_ema(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 3).astype(np.float32)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            window = samples[max(0, i + 1 - self.BUFFER_LENGTH):i + 1].astype(np.float64)
+            self.assertAlmostEqual(self.adjusted_ema(window, self.BUFFER_LENGTH), indicator.current_value, 3)
+
+    def test_sampling_length_change(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH).astype(np.float32)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+        for sample in samples:
+            indicator.add_sample(sample)
+
+        indicator.sampling_length = 10
+        indicator.add_sample(samples[0])
+
+        window = np.append(samples[-9:], samples[0]).astype(np.float64)
+        self.assertAlmostEqual(self.adjusted_ema(window, 10), indicator.current_value, 3)
@@ -66,3 +66,18 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_volatility_matches_the_variance_of_the_log_returns(self):
+        samples = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 50)))
+        self.indicator = HistoricalVolatilityIndicator(10, 1)
+
+        for i, sample in enumerate(samples):
+            self.indicator.add_sample(sample)
+            if i > 0:
+                prices = self.indicator._sampling_buffer.get_as_numpy_array()
+                expected = np.sqrt(np.var(np.diff(np.log(prices))))
+                self.assertAlmostEqual(expected, self.indicator.current_value, 5)
+
+        self.indicator.sampling_length = 5
+
+        self.assertEqual(4, self.indicator._returns_buffer.size)
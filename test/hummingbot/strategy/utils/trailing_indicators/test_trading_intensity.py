@@ -1,5 +1,6 @@
 import math
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
 import numpy as np
@@ -259,3 +260,62 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def _deterministic_indicator(self, price_levels, alpha, kappa, **kwargs) -> TradingIntensityIndicator:
+        timestamp = self.start_timestamp
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, **kwargs)
+        indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+        for price_level in price_levels:
+            indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp + 1,
+                price=1 + price_level,
+                amount=alpha * np.exp(-kappa * price_level),
+                type=TradeType.SELL,
+            ))
+        return indicator
+
+    def test_calculate_trading_intensity_log_linear(self):
+        indicator = self._deterministic_indicator([1, 2, 3, 4], 2, 0.1, estimator="log_linear")
+
+        indicator.calculate(self.start_timestamp + 1)
+        alpha, kappa = indicator.current_value
+
+        self.assertEqual("log_linear", indicator.estimator)
+        self.assertAlmostEqual(2, alpha, 10)
+        self.assertAlmostEqual(0.1, kappa, 10)
+
+    def test_log_linear_estimate_only_uses_the_trades_in_the_sampling_window(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2, estimator="log_linear")
+        indicator.last_quotes = [{"timestamp": self.start_timestamp, "price": 1}]
+        # The trades of the first tick do not follow the model, they leave the window after two more ticks
+        trades_by_tick = [[(1, 50), (5, 40)], [(1, 2 * np.exp(-0.5)), (2, 2 * np.exp(-1))], [(3, 2 * np.exp(-1.5))]]
+        for i, trades in enumerate(trades_by_tick):
+            timestamp = self.start_timestamp + i + 1
+            for price_level, amount in trades:
+                indicator.register_trade(OrderBookTradeEvent(
+                    trading_pair="COINALPHAHBOT", timestamp=timestamp, price=1 + price_level, amount=amount,
+                    type=TradeType.SELL))
+            indicator.calculate(timestamp)
+            indicator.last_quotes = [{"timestamp": timestamp, "price": 1}] + indicator.last_quotes
+
+        alpha, kappa = indicator.current_value
+
+        self.assertAlmostEqual(2, alpha, 8)
+        self.assertAlmostEqual(0.5, kappa, 8)
+
+    def test_curve_fit_in_background(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        indicator = self._deterministic_indicator([1, 2, 3, 4], 2, 0.1, refit_executor=executor)
+
+        indicator.calculate(self.start_timestamp + 1)
+        executor.shutdown(wait=True)
+
+        self.assertFalse(indicator.is_refit_running)
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(2, alpha, 8)
+        self.assertAlmostEqual(0.1, kappa, 8)
+
+    def test_invalid_estimator_raises_error(self):
+        with self.assertRaises(ValueError):
+            TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, estimator="unknown")
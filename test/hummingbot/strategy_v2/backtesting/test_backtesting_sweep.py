@@ -0,0 +1,70 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock, patch
+
+from hummingbot.strategy_v2.backtesting.backtesting_sweep import BacktestingSweep
+
+
+class BacktestingSweepTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = TemporaryDirectory()
+        self.results_path = os.path.join(self.temporary_directory.name, "results.csv")
+        self.sweep = BacktestingSweep(
+            base_config={"controller_name": "bollinger_v1", "controller_type": "directional_trading"},
+            parameter_grid={"bb_length": [50, 100], "bb_std": [1.5, 2.0]},
+            start=1700000000,
+            end=1700086400,
+            results_path=self.results_path,
+            max_workers=1)
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def _results(config_data, *args):
+        return {"net_pnl_quote": config_data["bb_length"] * config_data["bb_std"], "close_types": {"TAKE_PROFIT": 1}}
+
+    def test_parameter_combinations(self):
+        self.assertEqual([{"bb_length": 50, "bb_std": 1.5}, {"bb_length": 50, "bb_std": 2.0},
+                          {"bb_length": 100, "bb_std": 1.5}, {"bb_length": 100, "bb_std": 2.0}],
+                         self.sweep.parameter_combinations())
+
+    @patch("hummingbot.strategy_v2.backtesting.backtesting_sweep._initialize_engine")
+    @patch("hummingbot.strategy_v2.backtesting.backtesting_sweep._run_backtesting")
+    def test_run_records_every_result_as_it_finishes(self, run_backtesting_mock: MagicMock, _):
+        run_backtesting_mock.side_effect = self._results
+        rows = []
+
+        results_df = self.sweep.run(on_result=rows.append)
+
+        self.assertEqual(4, run_backtesting_mock.call_count)
+        self.assertEqual("bollinger_v1", run_backtesting_mock.call_args.args[0]["controller_name"])
+        self.assertEqual(4, len(rows))
+        self.assertEqual(4, len(results_df))
+        self.assertEqual([75., 100., 150., 200.], results_df["net_pnl_quote"].tolist())
+        self.assertEqual('{"TAKE_PROFIT": 1}', results_df["close_types"].iloc[0])
+
+    @patch("hummingbot.strategy_v2.backtesting.backtesting_sweep._initialize_engine")
+    @patch("hummingbot.strategy_v2.backtesting.backtesting_sweep._run_backtesting")
+    def test_run_resumes_from_recorded_results(self, run_backtesting_mock: MagicMock, _):
+        run_backtesting_mock.side_effect = [self._results({"bb_length": 50, "bb_std": 1.5}),
+                                            Exception("Test Error"),
+                                            self._results({"bb_length": 100, "bb_std": 1.5}),
+                                            self._results({"bb_length": 100, "bb_std": 2.0})]
+        self.sweep.run()
+        self.assertEqual(3, len(self.sweep.completed_run_ids()))
+
+        run_backtesting_mock.reset_mock(side_effect=True)
+        run_backtesting_mock.side_effect = self._results
+        results_df = self.sweep.run()
+
+        run_backtesting_mock.assert_called_once()
+        self.assertEqual({"bb_length": 50, "bb_std": 2.0, "controller_name": "bollinger_v1",
+                          "controller_type": "directional_trading"},
+                         run_backtesting_mock.call_args.args[0])
+        self.assertEqual(4, len(results_df))
+        self.assertEqual(set(self.sweep.run_id(parameters) for parameters in self.sweep.parameter_combinations()),
+                         set(results_df["run_id"]))
@@ -0,0 +1,147 @@
+import os
+import threading
+from tempfile import TemporaryDirectory
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.strategy_v2.backtesting.candles_disk_cache import CandlesDiskCache
+
+
+class CandlesDiskCacheTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = TemporaryDirectory()
+        self.cache = CandlesDiskCache(cache_path=self.temporary_directory.name)
+        self.connector_name = "binance"
+        self.trading_pair = "BTC-USDT"
+        self.interval = "1m"
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def _candles_df(start_time: int, end_time: int) -> pd.DataFrame:
+        timestamps = np.arange(start_time, end_time + 60, 60, dtype=float)
+        candles = {column: timestamps / 60 for column in CandlesBase.columns}
+        candles["timestamp"] = timestamps
+        return pd.DataFrame(candles)
+
+    def _config(self, start_time: int, end_time: int) -> HistoricalCandlesConfig:
+        return HistoricalCandlesConfig(connector_name=self.connector_name, trading_pair=self.trading_pair,
+                                       interval=self.interval, start_time=start_time, end_time=end_time)
+
+    def test_missing_periods_without_stored_candles(self):
+        self.assertEqual([(600, 1200)],
+                         self.cache.missing_periods(self.connector_name, self.trading_pair, self.interval, 600, 1200))
+
+    def test_write_and_read_time_slice(self):
+        self.cache.write(self.connector_name, self.trading_pair, self.interval, self._candles_df(600, 1200))
+
+        self.assertEqual((600, 1200), self.cache.cached_period(self.connector_name, self.trading_pair, self.interval))
+        candles_df = self.cache.read(self.connector_name, self.trading_pair, self.interval, 720, 900)
+        self.assertEqual([720., 780., 840., 900.], candles_df["timestamp"].tolist())
+        self.assertEqual(CandlesBase.columns, list(candles_df.columns))
+
+        columns = self.cache.read_columns(self.connector_name, self.trading_pair, self.interval, 720, 900)
+        self.assertIsInstance(columns["close"], np.memmap)
+
+    def test_write_merges_with_stored_candles_and_removes_previous_generation(self):
+        self.cache.write(self.connector_name, self.trading_pair, self.interval, self._candles_df(600, 1200))
+        self.cache.write(self.connector_name, self.trading_pair, self.interval, self._candles_df(1200, 1800))
+
+        self.assertEqual((600, 1800), self.cache.cached_period(self.connector_name, self.trading_pair, self.interval))
+        candles_df = self.cache.read(self.connector_name, self.trading_pair, self.interval)
+        self.assertEqual(21, len(candles_df))
+        self.assertTrue((candles_df["timestamp"].diff().dropna() == 60).all())
+        key_path = os.path.join(self.temporary_directory.name, self.connector_name, self.trading_pair, self.interval)
+        self.assertEqual(1, len([entry for entry in os.listdir(key_path) if os.path.isdir(os.path.join(key_path, entry))]))
+
+    def test_write_removes_generations_left_by_interrupted_writes(self):
+        key_path = os.path.join(self.temporary_directory.name, self.connector_name, self.trading_pair, self.interval)
+        os.makedirs(os.path.join(key_path, "interrupted_generation"))
+
+        self.cache.write(self.connector_name, self.trading_pair, self.interval, self._candles_df(600, 1200))
+
+        self.assertNotIn("interrupted_generation", os.listdir(key_path))
+
+    def test_concurrent_writes_keep_all_the_candles(self):
+        writers = [threading.Thread(target=CandlesDiskCache(cache_path=self.temporary_directory.name).write,
+                                    args=(self.connector_name, self.trading_pair, self.interval,
+                                          self._candles_df(600 * i, 600 * (i + 1))))
+                   for i in range(1, 5)]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+
+        candles_df = self.cache.read(self.connector_name, self.trading_pair, self.interval)
+        self.assertEqual(41, len(candles_df))
+        key_path = os.path.join(self.temporary_directory.name, self.connector_name, self.trading_pair, self.interval)
+        self.assertEqual(1, len([entry for entry in os.listdir(key_path) if os.path.isdir(os.path.join(key_path, entry))]))
+
+    def test_write_does_not_store_open_candles(self):
+        candles_df = self._candles_df(600, 1200)
+        candles_df.loc[len(candles_df) - 1, "timestamp"] = 10e12
+
+        self.cache.write(self.connector_name, self.trading_pair, self.interval, candles_df)
+
+        self.assertEqual((600, 1140), self.cache.cached_period(self.connector_name, self.trading_pair, self.interval))
+
+    def test_missing_periods_end_at_the_last_closed_candle(self):
+        with patch("hummingbot.strategy_v2.backtesting.candles_disk_cache.time.time", return_value=3630):
+            self.assertEqual(3540, self.cache.last_closed_candle_time(self.interval))
+            self.assertEqual([(600, 3540)], self.cache.missing_periods(self.connector_name, self.trading_pair,
+                                                                       self.interval, 600, 7200))
+            self.assertEqual([], self.cache.missing_periods(self.connector_name, self.trading_pair,
+                                                            self.interval, 3600, 7200))
+
+    async def test_get_candles_does_not_download_again_periods_without_candles(self):
+        candle_feed = MagicMock()
+        # The exchange only has candles from 1200 to 1800
+        candle_feed.get_historical_candles_concurrently = AsyncMock(
+            side_effect=lambda config: self._candles_df(max(config.start_time, 1200), min(config.end_time, 1800)))
+
+        candles_df = await self.cache.get_candles(candle_feed, self._config(600, 2400))
+
+        self.assertEqual(11, len(candles_df))
+        self.assertEqual((1200, 1800), self.cache.cached_period(self.connector_name, self.trading_pair, self.interval))
+        self.assertEqual((600, 2400), self.cache.covered_period(self.connector_name, self.trading_pair, self.interval))
+
+        candle_feed.get_historical_candles_concurrently.reset_mock()
+        await self.cache.get_candles(candle_feed, self._config(600, 2400))
+        candle_feed.get_historical_candles_concurrently.assert_not_called()
+
+    async def test_get_candles_stores_the_covered_period_when_there_are_no_candles(self):
+        candle_feed = MagicMock()
+        candle_feed.get_historical_candles_concurrently = AsyncMock(return_value=pd.DataFrame())
+
+        candles_df = await self.cache.get_candles(candle_feed, self._config(600, 1200))
+
+        self.assertEqual(0, len(candles_df))
+        self.assertIsNone(self.cache.cached_period(self.connector_name, self.trading_pair, self.interval))
+        self.assertEqual((600, 1200), self.cache.covered_period(self.connector_name, self.trading_pair, self.interval))
+        self.assertEqual([], self.cache.missing_periods(self.connector_name, self.trading_pair, self.interval, 600, 1200))
+
+    async def test_get_candles_only_downloads_missing_periods(self):
+        self.cache.write(self.connector_name, self.trading_pair, self.interval, self._candles_df(1200, 1800))
+        candle_feed = MagicMock()
+        candle_feed.get_historical_candles_concurrently = AsyncMock(
+            side_effect=lambda config: self._candles_df(config.start_time, config.end_time))
+
+        candles_df = await self.cache.get_candles(candle_feed, self._config(600, 2400))
+
+        requested_periods = [(call.kwargs["config"].start_time, call.kwargs["config"].end_time)
+                             for call in candle_feed.get_historical_candles_concurrently.call_args_list]
+        self.assertEqual([(600, 1200), (1800, 2400)], requested_periods)
+        self.assertEqual(31, len(candles_df))
+        self.assertEqual([], self.cache.missing_periods(self.connector_name, self.trading_pair, self.interval, 600, 2400))
+
+        candle_feed.get_historical_candles_concurrently.reset_mock()
+        await self.cache.get_candles(candle_feed, self._config(900, 2100))
+        candle_feed.get_historical_candles_concurrently.assert_not_called()
@@ -0,0 +1,64 @@
+import unittest
+from decimal import Decimal
+
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class ExecutorSimulationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.config = PositionExecutorConfig(id="test", timestamp=1000, trading_pair="ETH-USDT", connector_name="binance",
+                                             side=TradeType.BUY, entry_price=Decimal("100"), amount=Decimal("1"))
+        self.simulation = ExecutorSimulation(
+            config=self.config,
+            executor_simulation=pd.DataFrame({
+                "timestamp": [1000., 1060., 1120., 1180.],
+                "close": [100., 101., 102., 103.],
+                "net_pnl_pct": [0., 0.01, 0.02, 0.03],
+                "net_pnl_quote": [0., 1., 2., 3.],
+                "cum_fees_quote": [0.1, 0.1, 0.1, 0.1],
+                "filled_amount_quote": [100., 100., 100., 200.],
+                "current_position_average_price": [100., 100., 100., 100.],
+            }),
+            close_type=CloseType.TAKE_PROFIT)
+
+    def test_executor_info_before_the_first_row_is_terminated_without_pnl(self):
+        executor_info = self.simulation.get_executor_info_at_timestamp(900)
+
+        self.assertEqual(RunnableStatus.TERMINATED, executor_info.status)
+        self.assertEqual(Decimal(0), executor_info.net_pnl_quote)
+        self.assertEqual({}, executor_info.custom_info)
+
+    def test_executor_info_uses_last_row_up_to_timestamp(self):
+        executor_info = self.simulation.get_executor_info_at_timestamp(1130)
+
+        self.assertEqual(RunnableStatus.RUNNING, executor_info.status)
+        self.assertTrue(executor_info.is_active)
+        self.assertTrue(executor_info.is_trading)
+        self.assertEqual(Decimal(0.02), executor_info.net_pnl_pct)
+        self.assertEqual(Decimal(2), executor_info.net_pnl_quote)
+        self.assertEqual(102., executor_info.custom_info["close_price"])
+        self.assertEqual(100., executor_info.custom_info["current_position_average_price"])
+
+    def test_executor_info_at_last_row_is_closed(self):
+        executor_info = self.simulation.get_executor_info_at_timestamp(1200)
+
+        self.assertEqual(RunnableStatus.TERMINATED, executor_info.status)
+        self.assertEqual(CloseType.TAKE_PROFIT, executor_info.close_type)
+        self.assertEqual(1180., executor_info.close_timestamp)
+        self.assertEqual(Decimal(200), executor_info.filled_amount_quote)
+
+    def test_executor_info_matches_filtering_for_any_timestamp_order(self):
+        simulation_df = self.simulation.executor_simulation
+        for timestamp in [1000, 1059, 1060, 1180, 1061, 900, 1120, 1500]:
+            executor_info = self.simulation.get_executor_info_at_timestamp(timestamp)
+            rows_up_to_timestamp = simulation_df[simulation_df["timestamp"] <= timestamp]
+            expected_pnl = Decimal(rows_up_to_timestamp["net_pnl_quote"].iloc[-1]) if not rows_up_to_timestamp.empty \
+                else Decimal(0)
+            self.assertEqual(expected_pnl, executor_info.net_pnl_quote, f"Timestamp {timestamp}")
@@ -18,6 +18,7 @@ from hummingbot.core.event.events import (
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
 from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
 
@@ -134,6 +135,23 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         )
         self.assertEqual(buy_order_id, "OID-BUY-1")
 
+    def test_placed_orders_events_are_routed_to_the_executor(self):
+        self.component.register_events()
+        buy_order_id = self.component.place_order(
+            connector_name="connector1",
+            trading_pair="ETH-USDT",
+            order_type=OrderType.LIMIT,
+            side=TradeType.BUY,
+            price=Decimal("1000.0"),
+            amount=Decimal("1.0"),
+        )
+        router = OrderEventRouter.for_connector(self.strategy.connectors["connector1"])
+        self.assertIs(self.component, router._executors_by_order_id[buy_order_id])
+
+        self.component.unregister_events()
+        self.assertNotIn(buy_order_id, router._executors_by_order_id)
+        self.assertEqual(0, router.executors_count)
+
     def test_place_sell_order(self):
         sell_order_id = self.component.place_order(
             connector_name="connector1",
@@ -0,0 +1,108 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderCancelledEvent, OrderFilledEvent
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
+
+
+class OrderEventRouterTests(unittest.TestCase):
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.connector = MagicMock(spec=ExchangePyBase)
+        self.router = OrderEventRouter.for_connector(self.connector)
+        self.router.logger().setLevel(1)
+        self.router.logger().addHandler(self)
+
+        self.executor_1 = MagicMock(spec=ExecutorBase)
+        self.executor_1.config = MagicMock(id="executor_1")
+        self.executor_2 = MagicMock(spec=ExecutorBase)
+        self.executor_2.config = MagicMock(id="executor_2")
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    def _fill_event(self, order_id: str) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=1234567890,
+            order_id=order_id,
+            exchange_order_id="ED140",
+            trading_pair="ETH-USDT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("1000.0"),
+            amount=Decimal("1.0"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.001")),
+        )
+
+    def test_there_is_one_router_per_connector(self):
+        self.assertIs(self.router, OrderEventRouter.for_connector(self.connector))
+        self.assertIsNot(self.router, OrderEventRouter.for_connector(MagicMock(spec=ExchangePyBase)))
+
+    def test_listens_to_the_connector_only_while_there_are_executors(self):
+        self.router.add_executor(self.executor_1)
+        self.router.add_executor(self.executor_2)
+        self.router.add_executor(self.executor_2)
+
+        self.assertEqual(2, self.router.executors_count)
+        self.assertEqual(len(OrderEventRouter.EVENT_HANDLERS), self.connector.add_listener.call_count)
+
+        self.router.remove_executor(self.executor_1)
+        self.connector.remove_listener.assert_not_called()
+
+        self.router.remove_executor(self.executor_2)
+        self.assertEqual(0, self.router.executors_count)
+        self.assertEqual(len(OrderEventRouter.EVENT_HANDLERS), self.connector.remove_listener.call_count)
+
+    def test_order_events_are_delivered_only_to_the_order_owner(self):
+        self.router.add_executor(self.executor_1)
+        self.router.add_executor(self.executor_2)
+        self.router.register_order(executor=self.executor_2, order_id="OID-2")
+        event = self._fill_event(order_id="OID-2")
+
+        self.router._route_event(MarketEvent.OrderFilled.value, self.connector, event)
+
+        self.executor_1.process_order_filled_event.assert_not_called()
+        self.executor_2.process_order_filled_event.assert_called_once_with(
+            MarketEvent.OrderFilled.value, self.connector, event)
+
+    def test_unknown_order_events_are_delivered_to_all_the_executors(self):
+        self.router.add_executor(self.executor_1)
+        self.router.add_executor(self.executor_2)
+        self.router.register_order(executor=self.executor_2, order_id="OID-2")
+        self.executor_1.process_order_canceled_event.side_effect = Exception("Test Error")
+        event = OrderCancelledEvent(timestamp=1234567890, order_id="OID-UNKNOWN")
+
+        self.router._route_event(MarketEvent.OrderCancelled.value, self.connector, event)
+
+        self.executor_1.process_order_canceled_event.assert_called_once()
+        self.executor_2.process_order_canceled_event.assert_called_once_with(
+            MarketEvent.OrderCancelled.value, self.connector, event)
+        self.assertTrue(self._is_logged(
+            "ERROR", f"Unexpected error while processing event {MarketEvent.OrderCancelled.value} in executor "
+                     f"executor_1."))
+
+    def test_removed_executor_orders_are_forgotten(self):
+        self.router.add_executor(self.executor_1)
+        self.router.add_executor(self.executor_2)
+        self.router.register_order(executor=self.executor_1, order_id="OID-1")
+        self.router.remove_executor(self.executor_1)
+        self.router.register_order(executor=self.executor_1, order_id="OID-3")
+        event = self._fill_event(order_id="OID-1")
+
+        self.router._route_event(MarketEvent.OrderFilled.value, self.connector, event)
+
+        self.executor_1.process_order_filled_event.assert_not_called()
+        self.executor_2.process_order_filled_event.assert_called_once_with(
+            MarketEvent.OrderFilled.value, self.connector, event)
+        self.assertNotIn("OID-3", self.router._executors_by_order_id)
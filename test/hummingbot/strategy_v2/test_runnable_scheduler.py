@@ -0,0 +1,113 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+from typing import List
+
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
+
+
+class RecordingRunnable(RunnableBase):
+    def __init__(self, name: str, calls: List[str], update_interval: float = 0.1, priority: int = 0,
+                 task_duration: float = 0.0):
+        super().__init__(update_interval=update_interval)
+        self.name = name
+        self.calls = calls
+        self.SCHEDULER_PRIORITY = priority
+        self.task_duration = task_duration
+        self.stopped = False
+
+    async def on_start(self):
+        self.calls.append(f"{self.name}-start")
+
+    async def control_task(self):
+        self.calls.append(self.name)
+        if self.task_duration > 0:
+            await asyncio.sleep(self.task_duration)
+
+    def on_stop(self):
+        self.stopped = True
+
+
+class TestRunnableScheduler(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+    def setUp(self):
+        super().setUp()
+        self.scheduler = RunnableScheduler()
+        self.calls: List[str] = []
+        self.set_loggers(loggers=[RunnableBase.logger()])
+
+    def tearDown(self):
+        self.scheduler.stop()
+        super().tearDown()
+
+    def _start(self, runnable: RunnableBase):
+        runnable.scheduler = self.scheduler
+        runnable.start()
+
+    async def test_runnables_are_ticked_in_priority_order(self):
+        controller = RecordingRunnable(name="controller", calls=self.calls, priority=1)
+        executor_1 = RecordingRunnable(name="executor_1", calls=self.calls)
+        executor_2 = RecordingRunnable(name="executor_2", calls=self.calls)
+        self._start(controller)
+        self._start(executor_1)
+        self._start(executor_2)
+
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(RunnableStatus.RUNNING, controller.status)
+        self.assertEqual(["controller-start", "executor_1-start", "executor_2-start",
+                          "executor_1", "executor_2", "controller"], self.calls)
+        self.assertEqual(3, self.scheduler.runnables_count)
+        self.assertEqual(1, self.scheduler.stats(executor_1).ticks)
+
+    async def test_runnables_with_the_same_interval_share_the_ticks(self):
+        fast_runnable = RecordingRunnable(name="fast", calls=self.calls, update_interval=0.1)
+        slow_runnable = RecordingRunnable(name="slow", calls=self.calls, update_interval=0.5)
+        self._start(fast_runnable)
+        self._start(slow_runnable)
+
+        await asyncio.sleep(0.35)
+
+        self.assertEqual(4, self.calls.count("fast"))
+        self.assertEqual(1, self.calls.count("slow"))
+        self.assertEqual(2, len(self.scheduler._groups))
+
+    async def test_terminated_runnables_are_stopped_and_removed(self):
+        runnable = RecordingRunnable(name="executor", calls=self.calls)
+        self._start(runnable)
+        await asyncio.sleep(0.05)
+
+        runnable.stop()
+        await asyncio.sleep(0.1)
+
+        self.assertTrue(runnable.stopped)
+        self.assertEqual(1, self.calls.count("executor"))
+        self.assertEqual(0, self.scheduler.runnables_count)
+        self.assertEqual(0, len(self.scheduler._groups))
+
+    async def test_overrun_ticks_are_skipped(self):
+        runnable = RecordingRunnable(name="executor", calls=self.calls, task_duration=0.25)
+        self._start(runnable)
+
+        await asyncio.sleep(0.45)
+
+        self.assertEqual(2, self.calls.count("executor"))
+        self.assertEqual(2, self.scheduler.skipped_ticks(update_interval=0.1))
+        stats = self.scheduler.stats(runnable)
+        self.assertEqual(1, stats.ticks)
+        self.assertGreaterEqual(stats.max_time, 0.25)
+
+    async def test_control_task_errors_are_logged_and_counted(self):
+        runnable = RecordingRunnable(name="executor", calls=self.calls)
+
+        async def raise_exception():
+            raise Exception("Test")
+
+        runnable.control_task = raise_exception
+        self._start(runnable)
+        await asyncio.sleep(0.05)
+
+        self.assertTrue(self.is_logged("ERROR", "Test"))
+        self.assertEqual(1, self.scheduler.stats(runnable).errors)
+        self.assertEqual(1, self.scheduler.stats(runnable).ticks)